@@ -4,6 +4,7 @@ Load Balancer for ComfyUI Servers
 Selects the best available server based on queue status.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -68,6 +69,18 @@ class LoadBalancer:
             self.servers[address] = ServerHealth(address)
             self.servers[address].update()
 
+    def register_servers(self, addresses: List[str]):
+        """Register several servers at once, probing the new ones in parallel"""
+        new_servers = [ServerHealth(a) for a in dict.fromkeys(addresses) if a not in self.servers]
+        if not new_servers:
+            return
+
+        with ThreadPoolExecutor(max_workers=len(new_servers)) as pool:
+            list(pool.map(ServerHealth.update, new_servers))
+
+        for server in new_servers:
+            self.servers[server.address] = server
+
     def unregister_server(self, address: str):
         """Unregister a server"""
         if address in self.servers:
@@ -4,11 +4,16 @@ History-based Logger
 Creates JSONL logs from ComfyUI history data after execution completes.
 """
 
-import json
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+import orjson
+
+# JSONL entry encoding: one line per entry, non-JSON values (datetimes,
+# paths, ...) stringified as before
+_JSONL_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
 
 def create_log_from_history(
     prompt_id: str,
@@ -38,9 +43,8 @@ def create_log_from_history(
 
     # Helper to write log entry
     def write_entry(entry: Dict[str, Any]):
-        with open(log_file, 'a') as f:
-            json.dump(entry, f, default=str)
-            f.write('\n')
+        with open(log_file, 'ab') as f:
+            f.write(orjson.dumps(entry, default=str, option=_JSONL_OPTIONS))
 
     # 1. Log workflow submission
     write_entry({
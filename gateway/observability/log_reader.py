@@ -4,7 +4,7 @@ Log Reader for Debug Agent
 Utilities for reading and analyzing prompt logs for debugging workflows.
 """
 
-import json
+import orjson
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -30,14 +30,13 @@ class PromptLogReader:
         if not self.log_file.exists():
             raise FileNotFoundError(f"Log file not found: {self.log_file}")
 
-        with open(self.log_file, 'r') as f:
-            for line_num, line in enumerate(f, 1):
-                try:
-                    entry = json.loads(line.strip())
-                    entry['_line_number'] = line_num
-                    self.entries.append(entry)
-                except json.JSONDecodeError as e:
-                    print(f"Warning: Failed to parse line {line_num}: {e}")
+        for line_num, line in enumerate(self.log_file.read_bytes().splitlines(), 1):
+            try:
+                entry = orjson.loads(line)
+                entry['_line_number'] = line_num
+                self.entries.append(entry)
+            except orjson.JSONDecodeError as e:
+                print(f"Warning: Failed to parse line {line_num}: {e}")
 
     def get_all_events(self) -> List[Dict[str, Any]]:
         """Get all log entries"""
@@ -6,11 +6,15 @@ Each workflow execution gets its own log file with complete event history.
 """
 
 import structlog
-import json
+import orjson
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional
 
+# JSONL entry encoding: one line per entry, non-JSON values (datetimes,
+# paths, ...) stringified as before
+_JSONL_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
 
 class PromptLogger:
     """Logger for individual prompt executions"""
@@ -70,9 +74,8 @@ class PromptLogger:
 
     def _write_to_file(self, data: Dict[str, Any]):
         """Write a log entry to the JSONL file"""
-        with open(self.log_file, 'a') as f:
-            json.dump(data, f, default=str)
-            f.write('\n')
+        with open(self.log_file, 'ab') as f:
+            f.write(orjson.dumps(data, default=str, option=_JSONL_OPTIONS))
 
     def log_workflow_submitted(self):
         """Log workflow submission"""
@@ -269,12 +272,11 @@ class PromptLogger:
         """
         entries = []
         if self.log_file.exists():
-            with open(self.log_file, 'r') as f:
-                for line in f:
-                    try:
-                        entries.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        pass
+            for line in self.log_file.read_bytes().splitlines():
+                try:
+                    entries.append(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    pass
         return entries
 
 
@@ -5,27 +5,33 @@ Activities perform the actual work that interacts with external systems.
 They can fail and will be automatically retried by Temporal.
 """
 
-from .select_server import select_best_server
+from .select_server import select_best_server, is_server_healthy
 from .download_artifacts import download_and_store_images
 from .download_artifacts_db import download_and_store_artifacts
 from .execution_log import create_execution_log
 from .server_outputs import get_server_output_files
 from .chain_templates import resolve_chain_templates
 from .chain_conditions import evaluate_chain_condition
-from .workflow_parameters import apply_workflow_parameters
-from .transfer_artifacts import transfer_outputs_to_input, transfer_artifacts_from_storage
+from .workflow_parameters import apply_workflow_parameters, upsert_workflow_record_and_apply_params
+from .transfer_artifacts import (
+    transfer_outputs_to_input,
+    transfer_artifacts_from_storage,
+    collect_and_transfer_dependency_artifacts,
+)
 from .execute_workflow import execute_and_track_workflow
 from .database_operations import (
     create_chain_record,
     create_workflow_record,
     update_chain_status_activity,
     update_workflow_status_activity,
+    bulk_update_chain_and_workflows,
     get_workflow_artifacts,
 )
 from .approval_operations import create_approval_request_activity
 
 __all__ = [
     "select_best_server",
+    "is_server_healthy",
     "download_and_store_images",
     "download_and_store_artifacts",
     "create_execution_log",
@@ -33,13 +39,16 @@ __all__ = [
     "resolve_chain_templates",
     "evaluate_chain_condition",
     "apply_workflow_parameters",
+    "upsert_workflow_record_and_apply_params",
     "transfer_outputs_to_input",
     "transfer_artifacts_from_storage",
+    "collect_and_transfer_dependency_artifacts",
     "execute_and_track_workflow",
     "create_chain_record",
     "create_workflow_record",
     "update_chain_status_activity",
     "update_workflow_status_activity",
+    "bulk_update_chain_and_workflows",
     "get_workflow_artifacts",
     "create_approval_request_activity",
 ]
@@ -45,7 +45,7 @@ async def create_approval_request_activity(
     activity.logger.info(f"Creating approval request for artifact: {artifact_id}")
 
     try:
-        with get_session() as session:
+        async with get_session() as session:
             # Build config metadata
             config_metadata = {
                 'step_id': step_id,
@@ -56,7 +56,7 @@ async def create_approval_request_activity(
             }
 
             # Create approval request
-            approval_request = create_approval_request(
+            approval_request = await create_approval_request(
                 session=session,
                 artifact_id=artifact_id,
                 temporal_workflow_id=temporal_workflow_id,
@@ -4,7 +4,7 @@ Activities: Database operations for chains and workflows
 
 import sys
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from temporalio import activity
 
@@ -14,9 +14,11 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 from temporal_gateway.database import (
     get_session,
     create_chain,
+    get_chain_by_temporal_id,
     create_workflow,
     update_chain_status,
     update_workflow_status,
+    bulk_update_workflow_status,
     get_workflow,
 )
 
@@ -28,6 +30,7 @@ async def create_chain_record(
     temporal_run_id: str,
     chain_definition: Optional[Dict[str, Any]] = None,
     description: Optional[str] = None,
+    status: str = "initializing",
 ) -> str:
     """
     Activity: Create chain record in database
@@ -38,6 +41,7 @@ async def create_chain_record(
         temporal_run_id: Temporal run ID
         chain_definition: Full chain definition (YAML as dict)
         description: Optional description
+        status: Initial chain status
 
     Returns:
         Chain ID
@@ -45,15 +49,22 @@ async def create_chain_record(
     activity.logger.info(f"Creating chain record: {chain_name}")
 
     try:
-        with get_session() as session:
-            chain = create_chain(
+        async with get_session() as session:
+            # An attempt abandoned after a slow commit has already inserted
+            # the row; a retry must reuse it (temporal_workflow_id is unique)
+            chain = await get_chain_by_temporal_id(session, temporal_workflow_id)
+            if chain:
+                activity.logger.info(f"✓ Chain record already exists: {chain.id}")
+                return chain.id
+
+            chain = await create_chain(
                 session=session,
                 name=chain_name,
                 temporal_workflow_id=temporal_workflow_id,
                 temporal_run_id=temporal_run_id,
                 chain_definition=chain_definition,
                 description=description,
-                status="initializing"
+                status=status
             )
             activity.logger.info(f"✓ Created chain record: {chain.id}")
             return chain.id
@@ -95,8 +106,8 @@ async def create_workflow_record(
     activity.logger.info(f"Creating workflow record: {workflow_name} (prompt: {prompt_id})")
 
     try:
-        with get_session() as session:
-            workflow_record = create_workflow(
+        async with get_session() as session:
+            workflow_record = await create_workflow(
                 session=session,
                 workflow_name=workflow_name,
                 server_address=server_address,
@@ -136,8 +147,8 @@ async def update_chain_status_activity(
     activity.logger.info(f"Updating chain {chain_id} status to: {status}")
 
     try:
-        with get_session() as session:
-            update_chain_status(
+        async with get_session() as session:
+            await update_chain_status(
                 session=session,
                 chain_id=chain_id,
                 status=status,
@@ -168,8 +179,8 @@ async def update_workflow_status_activity(
     activity.logger.info(f"Updating workflow {workflow_id} status to: {status}")
 
     try:
-        with get_session() as session:
-            update_workflow_status(
+        async with get_session() as session:
+            await update_workflow_status(
                 session=session,
                 workflow_id=workflow_id,
                 status=status,
@@ -182,6 +193,53 @@ async def update_workflow_status_activity(
         # Don't fail workflow for status update failures
 
 
+@activity.defn
+async def bulk_update_chain_and_workflows(
+    chain_id: str,
+    status: str,
+    current_level: Optional[int] = None,
+    workflow_updates: Optional[List[List[Optional[str]]]] = None,
+    error_message: Optional[str] = None,
+) -> None:
+    """
+    Activity: Update a chain and the workflows of its finished level at once
+
+    One activity (and one transaction) per chain level instead of a status
+    update per step plus one per level.
+
+    Args:
+        chain_id: Chain ID
+        status: New chain status
+        current_level: Optional current level
+        workflow_updates: [workflow_id, status, error_message] per workflow
+        error_message: Optional chain error message
+    """
+    workflow_updates = workflow_updates or []
+    activity.logger.info(
+        f"Updating chain {chain_id} status to: {status} "
+        f"({len(workflow_updates)} workflow status update(s))"
+    )
+
+    try:
+        async with get_session() as session:
+            await bulk_update_workflow_status(
+                session,
+                [tuple(update) for update in workflow_updates]
+            )
+            await update_chain_status(
+                session=session,
+                chain_id=chain_id,
+                status=status,
+                current_level=current_level,
+                error_message=error_message
+            )
+            activity.logger.info("✓ Updated chain and workflow statuses")
+
+    except Exception as e:
+        activity.logger.error(f"Failed to update chain/workflow statuses: {e}")
+        # Don't fail workflow for status update failures
+
+
 @activity.defn
 async def get_workflow_artifacts(
     workflow_id: str,
@@ -198,8 +256,8 @@ async def get_workflow_artifacts(
     activity.logger.info(f"Getting artifacts for workflow: {workflow_id}")
 
     try:
-        with get_session() as session:
-            workflow_record = get_workflow(session, workflow_id)
+        async with get_session() as session:
+            workflow_record = await get_workflow(session, workflow_id)
             if not workflow_record or not workflow_record.latest_artifact_id:
                 activity.logger.warning(f"No artifacts found for workflow {workflow_id}")
                 return []
@@ -75,8 +75,8 @@ async def download_and_store_images(
             # If workflow_id provided, save to database
             if workflow_id:
                 try:
-                    with get_session() as session:
-                        artifact = create_artifact(
+                    async with get_session() as session:
+                        artifact = await create_artifact(
                             session=session,
                             workflow_id=workflow_id,
                             filename=filename,
@@ -44,7 +44,7 @@ async def download_and_store_artifacts(
         client = ComfyUIClient(server_address)
         stored_artifacts = []
 
-        with get_session() as session:
+        async with get_session() as session:
             for file_info in output_files:
                 filename = file_info['filename']
                 subfolder = file_info.get('subfolder', '')
@@ -69,7 +69,7 @@ async def download_and_store_artifacts(
                 file_format = file_ext.lstrip('.')
 
                 # Save to database
-                artifact = create_artifact(
+                artifact = await create_artifact(
                     session=session,
                     workflow_id=workflow_id,
                     filename=filename,
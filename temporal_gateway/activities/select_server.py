@@ -41,3 +41,24 @@ async def select_best_server(strategy: str) -> str:
 
     activity.logger.info(f"Selected server: {server_address}")
     return server_address
+
+
+@activity.defn
+async def is_server_healthy(server_address: str) -> bool:
+    """
+    Activity: Check whether a previously selected ComfyUI server is still online
+
+    Probes only the given server (select_best_server probes all of them).
+
+    Args:
+        server_address: Server address as returned by select_best_server
+
+    Returns:
+        True if the server is registered and online
+    """
+    address = server_address.split("://", 1)[-1]
+    health = load_balancer.get_server_health(address) or load_balancer.get_server_health(server_address)
+
+    is_online = bool(health and health["is_online"])
+    activity.logger.info(f"Server {server_address} online: {is_online}")
+    return is_online
@@ -2,9 +2,10 @@
 Activity: Transfer artifacts from local storage to target server
 """
 
+import asyncio
 import sys
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
 from temporalio import activity
 
@@ -15,8 +16,10 @@ from temporal_gateway.clients.comfy import ComfyUIClient
 from temporal_gateway.database import (
     get_session,
     get_latest_artifact,
+    get_latest_artifacts_by_workflows,
     create_transfer,
     update_transfer_status,
+    bulk_update_transfer_status,
 )
 from temporal_gateway.database.crud.artifact import get_artifact
 
@@ -56,20 +59,20 @@ async def transfer_artifacts_from_storage(
         target_client = ComfyUIClient(target_server)
         transferred_filenames = []
 
-        with get_session() as session:
+        async with get_session() as session:
             for artifact_id in artifact_ids:
                 # Handle special "latest" keyword
                 if artifact_id == "latest":
-                    artifact = get_latest_artifact(session, source_workflow_id)
+                    artifact = await get_latest_artifact(session, source_workflow_id)
                 else:
-                    artifact = get_artifact(session, artifact_id)
+                    artifact = await get_artifact(session, artifact_id)
 
                 if not artifact:
                     activity.logger.warning(f"Artifact {artifact_id} not found, skipping")
                     continue
 
                 # Create transfer record
-                transfer = create_transfer(
+                transfer = await create_transfer(
                     session=session,
                     artifact_id=artifact.id,
                     source_workflow_id=source_workflow_id,
@@ -100,11 +103,13 @@ async def transfer_artifacts_from_storage(
                     activity.logger.info(f"✓ Uploaded: {artifact.filename} ({len(file_data)} bytes)")
 
                     # Update transfer status
-                    update_transfer_status(session, transfer.id, "completed")
+                    await update_transfer_status(session, transfer.id, "completed")
 
                 except Exception as upload_error:
                     activity.logger.error(f"Failed to upload artifact {artifact.id}: {upload_error}")
-                    update_transfer_status(session, transfer.id, "failed", str(upload_error))
+                    await update_transfer_status(session, transfer.id, "failed", str(upload_error))
+                    # Persist the failure before the session block rolls back
+                    await session.commit()
                     raise
 
         await target_client.close()
@@ -117,6 +122,100 @@ async def transfer_artifacts_from_storage(
         raise
 
 
+@activity.defn
+async def collect_and_transfer_dependency_artifacts(
+    dep_workflow_ids: List[str],
+    target_server: str,
+) -> Dict[str, List[str]]:
+    """
+    Activity: Transfer the latest artifact of each dependency workflow to target server
+
+    Replaces a get_workflow_artifacts + transfer_artifacts_from_storage pair
+    per dependency: the artifacts are looked up with one query and uploaded
+    concurrently.
+
+    Args:
+        dep_workflow_ids: Dependency workflow IDs
+        target_server: Target ComfyUI server address
+
+    Returns:
+        Dict of dependency workflow ID -> filenames now available in target server's input/ directory
+    """
+    activity.logger.info(f"Transferring artifacts of {len(dep_workflow_ids)} dependency workflow(s) to {target_server}")
+
+    try:
+        target_client = ComfyUIClient(target_server)
+        transferred: Dict[str, List[str]] = {workflow_id: [] for workflow_id in dep_workflow_ids}
+
+        async def upload(artifact) -> None:
+            local_path = Path(artifact.local_path)
+            if not local_path.exists():
+                raise FileNotFoundError(f"Local file not found: {local_path}")
+
+            file_data = await asyncio.to_thread(local_path.read_bytes)
+            activity.logger.info(f"Uploading: {artifact.filename} from local storage to {target_server}/input/")
+
+            await target_client.upload_file(
+                file_data=file_data,
+                filename=artifact.filename,  # Use original filename
+                subfolder=artifact.subfolder,
+                overwrite=True
+            )
+            activity.logger.info(f"✓ Uploaded: {artifact.filename} ({len(file_data)} bytes)")
+
+        async with get_session() as session:
+            artifacts = await get_latest_artifacts_by_workflows(session, dep_workflow_ids)
+            for workflow_id in dep_workflow_ids:
+                if workflow_id not in artifacts:
+                    activity.logger.info(f"Dependency workflow {workflow_id} has no artifacts - skipping transfer")
+
+            # Transfer records are created up front - the session can't be
+            # shared by the concurrent uploads
+            transfers = []
+            for workflow_id, artifact in artifacts.items():
+                transfer = await create_transfer(
+                    session=session,
+                    artifact_id=artifact.id,
+                    source_workflow_id=workflow_id,
+                    target_server=target_server,
+                    target_subfolder=artifact.subfolder,
+                    status="uploading"
+                )
+                transfers.append((workflow_id, artifact, transfer))
+
+            results = await asyncio.gather(
+                *(upload(artifact) for _, artifact, _ in transfers),
+                return_exceptions=True
+            )
+
+            updates = []
+            first_error = None
+            for (workflow_id, artifact, transfer), result in zip(transfers, results):
+                if isinstance(result, BaseException):
+                    activity.logger.error(f"Failed to upload artifact {artifact.id}: {result}")
+                    updates.append((transfer.id, "failed", str(result)))
+                    first_error = first_error or result
+                else:
+                    transferred[workflow_id].append(artifact.filename)
+                    updates.append((transfer.id, "completed", None))
+
+            await bulk_update_transfer_status(session, updates)
+
+            if first_error is not None:
+                # Persist the failures before the session block rolls back
+                await session.commit()
+                raise first_error
+
+        await target_client.close()
+
+        activity.logger.info(f"Successfully transferred {sum(map(len, transferred.values()))} file(s)")
+        return transferred
+
+    except Exception as e:
+        activity.logger.error(f"Failed to transfer files: {e}")
+        raise
+
+
 @activity.defn
 async def transfer_outputs_to_input(
     source_server: str,
@@ -4,7 +4,7 @@ Activity: Apply workflow parameters
 
 import sys
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
 from temporalio import activity
 
@@ -12,6 +12,12 @@ from temporalio import activity
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from temporal_gateway.workflow_registry import get_registry
+from temporal_gateway.database import (
+    get_session,
+    create_workflow,
+    get_workflow_by_step,
+    reset_workflow_for_rerun,
+)
 
 
 @activity.defn
@@ -41,3 +47,73 @@ async def apply_workflow_parameters(
     except Exception as e:
         activity.logger.error(f"Failed to apply parameters: {e}")
         raise
+
+
+@activity.defn
+async def upsert_workflow_record_and_apply_params(
+    workflow_name: str,
+    parameters: Dict[str, Any],
+    server_address: str,
+    chain_id: Optional[str] = None,
+    step_id: Optional[str] = None,
+    temporal_workflow_id: Optional[str] = None,
+) -> Tuple[Dict[str, Any], str]:
+    """
+    Activity: Apply parameters and create the workflow record in one round trip
+
+    A chain step has one record: a retried activity or a regenerated step
+    reuses the record already created for it, updated with the definition,
+    parameters and server of this run.
+
+    Args:
+        workflow_name: Name of the workflow
+        parameters: Parameters to apply
+        server_address: ComfyUI server the workflow will run on
+        chain_id: Optional chain ID
+        step_id: Optional step ID (for chain workflows)
+        temporal_workflow_id: Temporal workflow ID
+
+    Returns:
+        Tuple of (workflow JSON with parameters applied, workflow record ID)
+    """
+    activity.logger.info(f"Applying parameters and creating record for workflow: {workflow_name}")
+
+    try:
+        workflow_json = get_registry().apply_overrides(workflow_name, parameters)
+
+        async with get_session() as session:
+            workflow_record = None
+            if chain_id and step_id:
+                workflow_record = await get_workflow_by_step(session, chain_id, step_id)
+
+            if workflow_record is not None:
+                workflow_record = await reset_workflow_for_rerun(
+                    session,
+                    workflow_record.id,
+                    server_address=server_address,
+                    workflow_definition=workflow_json,
+                    parameters=parameters,
+                )
+            else:
+                # prompt_id isn't known until the child workflow queues it
+                workflow_record = await create_workflow(
+                    session=session,
+                    workflow_name=workflow_name,
+                    server_address=server_address,
+                    prompt_id="pending",
+                    chain_id=chain_id,
+                    step_id=step_id,
+                    temporal_workflow_id=temporal_workflow_id,
+                    workflow_definition=workflow_json,
+                    parameters=parameters,
+                    status="queued"
+                )
+
+            workflow_db_id = workflow_record.id
+
+        activity.logger.info(f"✓ Parameters applied, workflow record: {workflow_db_id}")
+        return workflow_json, workflow_db_id
+
+    except Exception as e:
+        activity.logger.error(f"Failed to apply parameters / create workflow record: {e}")
+        raise
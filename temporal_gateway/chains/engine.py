@@ -53,7 +53,7 @@ class ChainEngine:
             workflow_id = await engine.execute_chain(plan)
             print(f"Chain started: {workflow_id}")
         """
-        workflow_id = f"chain-{plan.chain_name}-{uuid.uuid4()}"
+        workflow_id = f"chain-{plan.chain_name}-{uuid.uuid4().hex}"
 
         await self.client.start_workflow(
             ChainExecutorWorkflow.run,
@@ -5,15 +5,17 @@ Handles approval requests for artifacts with parameter validation.
 """
 
 import logging
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from temporalio.client import Client
 
+from temporal_gateway.database import db
 from .service import get_approval_service, ApprovalService
 from .models import RejectRequest, ApproveRequest
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/approval", tags=["approval"])
+# Every approval route shares one request-scoped DB session (committed once per request)
+router = APIRouter(prefix="/approval", tags=["approval"], dependencies=[Depends(db)])
 
 
 # Routes
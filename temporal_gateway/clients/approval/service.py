@@ -162,19 +162,19 @@ class ApprovalService:
         Raises:
             ValueError: If token is invalid
         """
-        with get_session() as session:
+        async with get_session() as session:
             # Validate token
-            valid, error = validate_approval_link(session, token)
+            valid, error = await validate_approval_link(session, token)
             if not valid:
                 raise ValueError(error)
 
             # Get request
-            request = get_approval_request_by_token(session, token)
+            request = await get_approval_request_by_token(session, token)
             if not request:
                 raise ValueError("Approval request not found")
 
             # Get artifact (via relationship)
-            artifact = request.artifact
+            artifact = await request.awaitable_attrs.artifact
 
             return {
                 "approval_request_id": request.id,
@@ -214,14 +214,14 @@ class ApprovalService:
         Raises:
             ValueError: If token is invalid or workflow not found
         """
-        with get_session() as session:
+        async with get_session() as session:
             # Validate token
-            valid, error = validate_approval_link(session, token)
+            valid, error = await validate_approval_link(session, token)
             if not valid:
                 raise ValueError(error)
 
             # Get request
-            request = get_approval_request_by_token(session, token)
+            request = await get_approval_request_by_token(session, token)
             if not request:
                 raise ValueError("Approval request not found")
 
@@ -264,19 +264,24 @@ class ApprovalService:
         Raises:
             ValueError: If token is invalid
         """
-        with get_session() as session:
+        async with get_session() as session:
             # Validate token
-            valid, error = validate_approval_link(session, token)
+            valid, error = await validate_approval_link(session, token)
             if not valid:
                 raise ValueError(error)
 
             # Get request
-            request = get_approval_request_by_token(session, token)
+            request = await get_approval_request_by_token(session, token)
             if not request:
                 raise ValueError("Approval request not found")
 
             # Update DB
-            updated_request = approve_approval_request(session, request.id, decided_by)
+            updated_request = await approve_approval_request(session, request.id, decided_by)
+
+            # Commit before signalling: the workflow may read the decision as
+            # soon as it wakes (inside a request, get_session() would
+            # otherwise only commit when the request finishes)
+            await session.commit()
 
             # Send signal to Temporal workflow
             if self.temporal_client:
@@ -319,14 +324,14 @@ class ApprovalService:
         Raises:
             ValueError: If token is invalid or parameters are invalid
         """
-        with get_session() as session:
+        async with get_session() as session:
             # Validate token
-            valid, error = validate_approval_link(session, token)
+            valid, error = await validate_approval_link(session, token)
             if not valid:
                 raise ValueError(error)
 
             # Get request
-            request = get_approval_request_by_token(session, token)
+            request = await get_approval_request_by_token(session, token)
             if not request:
                 raise ValueError("Approval request not found")
 
@@ -346,7 +351,10 @@ class ApprovalService:
                 })
 
             # Update DB
-            updated_request = reject_approval_request(session, request.id, decided_by)
+            updated_request = await reject_approval_request(session, request.id, decided_by)
+
+            # Commit before signalling (see approve())
+            await session.commit()
 
             # Send signal to Temporal workflow
             if self.temporal_client:
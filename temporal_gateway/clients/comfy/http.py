@@ -4,19 +4,57 @@ ComfyUI HTTP Client
 Handles all HTTP API calls to ComfyUI server.
 """
 
+import asyncio
 import httpx
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 logger = logging.getLogger(__name__)
 
 
+# One pooled AsyncClient shared by every ComfyHTTPClient, so the per-activity
+# clients reuse keep-alive connections instead of opening new ones each time
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get (or create) the process-wide pooled HTTP client"""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(timeout=30.0)
+    return _shared_client
+
+
+async def warm_up_shared_client(server_addresses: List[str]) -> None:
+    """
+    Open a pooled connection to each server ahead of the first activity
+
+    Unreachable servers are only logged; they are retried on first use.
+    """
+    client = get_shared_client()
+    results = await asyncio.gather(
+        *(client.get(f"{address.rstrip('/')}/queue") for address in server_addresses),
+        return_exceptions=True
+    )
+    for address, result in zip(server_addresses, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Warm-up request to {address} failed: {result}")
+
+
+async def close_shared_client() -> None:
+    """Close the pooled HTTP client (on worker shutdown)"""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
 class ComfyHTTPClient:
     """HTTP client for ComfyUI REST API"""
 
     def __init__(self, server_address: str):
         self.server_address = server_address.rstrip('/')
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = get_shared_client()
 
     async def queue_prompt(self, workflow: Dict[str, Any], client_id: str) -> Dict[str, Any]:
         """
@@ -234,5 +272,10 @@ class ComfyHTTPClient:
         return response.json()
 
     async def close(self):
-        """Close HTTP client"""
-        await self.client.aclose()
+        """
+        Release the HTTP client
+
+        The underlying connection pool is shared and stays open for other
+        clients; close_shared_client() closes it on shutdown.
+        """
+        self.client = None
@@ -5,7 +5,8 @@ Provides SQLAlchemy models and CRUD operations for artifact tracking.
 """
 
 from .models import Chain, Workflow, Artifact, ArtifactTransfer, Base
-from .session import get_session, get_session_direct, init_db, engine
+from .schemas import ChainSummary, WorkflowSummary, ArtifactSummary, TransferSummary
+from .session import get_session, get_session_direct, init_db, optimize_db, engine, db, SessionLocal, count_queries
 from .crud import (
     # Chain
     create_chain,
@@ -20,7 +21,9 @@ from .crud import (
     get_workflow_by_prompt,
     get_workflow_by_step,
     get_workflows_by_chain,
+    reset_workflow_for_rerun,
     update_workflow_status,
+    bulk_update_workflow_status,
     update_workflow_latest_artifact,
     list_workflows,
     delete_workflow,
@@ -28,6 +31,7 @@ from .crud import (
     create_artifact,
     get_artifact,
     get_latest_artifact,
+    get_latest_artifacts_by_workflows,
     get_artifacts_by_workflow,
     get_artifact_versions,
     update_artifact_latest_flag,
@@ -39,6 +43,7 @@ from .crud import (
     create_transfer,
     get_transfer,
     update_transfer_status,
+    bulk_update_transfer_status,
     list_transfers,
     delete_transfer,
 )
@@ -50,11 +55,20 @@ __all__ = [
     "Artifact",
     "ArtifactTransfer",
     "Base",
+    # Summary schemas
+    "ChainSummary",
+    "WorkflowSummary",
+    "ArtifactSummary",
+    "TransferSummary",
     # Session
     "get_session",
     "get_session_direct",
     "init_db",
+    "optimize_db",
     "engine",
+    "db",
+    "SessionLocal",
+    "count_queries",
     # Chain CRUD
     "create_chain",
     "get_chain",
@@ -68,7 +82,9 @@ __all__ = [
     "get_workflow_by_prompt",
     "get_workflow_by_step",
     "get_workflows_by_chain",
+    "reset_workflow_for_rerun",
     "update_workflow_status",
+    "bulk_update_workflow_status",
     "update_workflow_latest_artifact",
     "list_workflows",
     "delete_workflow",
@@ -76,6 +92,7 @@ __all__ = [
     "create_artifact",
     "get_artifact",
     "get_latest_artifact",
+    "get_latest_artifacts_by_workflows",
     "get_artifacts_by_workflow",
     "get_artifact_versions",
     "update_artifact_latest_flag",
@@ -87,6 +104,7 @@ __all__ = [
     "create_transfer",
     "get_transfer",
     "update_transfer_status",
+    "bulk_update_transfer_status",
     "list_transfers",
     "delete_transfer",
 ]
@@ -1,7 +1,12 @@
 """
 CRUD operations module
 
-Imports all CRUD functions from individual entity files
+Imports all CRUD functions from individual entity files.
+
+All CRUD functions are coroutines taking an AsyncSession. They flush their
+changes but never commit: the transaction is committed once by whoever owns
+the session (an `async with get_session()` block or the request-scoped `db`
+dependency).
 """
 
 from .chain import (
@@ -19,7 +24,9 @@ from .workflow import (
     get_workflow_by_prompt,
     get_workflow_by_step,
     get_workflows_by_chain,
+    reset_workflow_for_rerun,
     update_workflow_status,
+    bulk_update_workflow_status,
     update_workflow_latest_artifact,
     list_workflows,
     delete_workflow,
@@ -29,6 +36,7 @@ from .artifact import (
     create_artifact,
     get_artifact,
     get_latest_artifact,
+    get_latest_artifacts_by_workflows,
     get_artifacts_by_workflow,
     get_artifact_versions,
     update_artifact_latest_flag,
@@ -42,6 +50,7 @@ from .transfer import (
     create_transfer,
     get_transfer,
     update_transfer_status,
+    bulk_update_transfer_status,
     list_transfers,
     delete_transfer,
 )
@@ -75,7 +84,9 @@ __all__ = [
     "get_workflow_by_prompt",
     "get_workflow_by_step",
     "get_workflows_by_chain",
+    "reset_workflow_for_rerun",
     "update_workflow_status",
+    "bulk_update_workflow_status",
     "update_workflow_latest_artifact",
     "list_workflows",
     "delete_workflow",
@@ -83,6 +94,7 @@ __all__ = [
     "create_artifact",
     "get_artifact",
     "get_latest_artifact",
+    "get_latest_artifacts_by_workflows",
     "get_artifacts_by_workflow",
     "get_artifact_versions",
     "update_artifact_latest_flag",
@@ -94,6 +106,7 @@ __all__ = [
     "create_transfer",
     "get_transfer",
     "update_transfer_status",
+    "bulk_update_transfer_status",
     "list_transfers",
     "delete_transfer",
     # Approval
@@ -2,18 +2,18 @@
 CRUD operations for ApprovalRequest model
 """
 
-import uuid
 import secrets
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_
+from typing import Optional, List, Dict, Any, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import desc, and_, tuple_, select, lambda_stmt, bindparam
 
 from ..models import ApprovalRequest
+from .base import insert_returning, update_returning
 
 
-def create_approval_request(
-    session: Session,
+async def create_approval_request(
+    session: AsyncSession,
     artifact_id: str,
     temporal_workflow_id: str,
     artifact_view_url: str,
@@ -48,8 +48,9 @@ def create_approval_request(
     if link_expiration_hours:
         link_expires_at = datetime.utcnow() + timedelta(hours=link_expiration_hours)
 
-    request = ApprovalRequest(
-        id=str(uuid.uuid4()),
+    request = await insert_returning(
+        session,
+        ApprovalRequest,
         artifact_id=artifact_id,
         chain_id=chain_id,
         step_id=step_id,
@@ -60,53 +61,89 @@ def create_approval_request(
         link_expires_at=link_expires_at,
         config_metadata=config_metadata or {},
     )
-
-    session.add(request)
-    session.commit()
-    session.refresh(request)
     return request
 
 
-def get_approval_request(session: Session, request_id: str) -> Optional[ApprovalRequest]:
+# Hot lookups: built once as lambda statements so their compiled SQL is served
+# from the statement cache instead of being recompiled on every call
+_get_approval_request_stmt = lambda_stmt(
+    lambda: select(ApprovalRequest).where(ApprovalRequest.id == bindparam("id"))
+)
+_get_approval_request_by_token_stmt = lambda_stmt(
+    lambda: select(ApprovalRequest).where(ApprovalRequest.approval_link_token == bindparam("token"))
+)
+
+
+async def get_approval_request(session: AsyncSession, request_id: str) -> Optional[ApprovalRequest]:
     """Get approval request by ID"""
-    return session.query(ApprovalRequest).filter(ApprovalRequest.id == request_id).first()
+    result = await session.scalars(_get_approval_request_stmt, {"id": request_id})
+    return result.first()
 
 
-def get_approval_request_by_token(session: Session, token: str) -> Optional[ApprovalRequest]:
+async def get_approval_request_by_token(session: AsyncSession, token: str) -> Optional[ApprovalRequest]:
     """Get approval request by link token"""
-    return session.query(ApprovalRequest).filter(
-        ApprovalRequest.approval_link_token == token
-    ).first()
+    result = await session.scalars(_get_approval_request_by_token_stmt, {"token": token})
+    return result.first()
 
 
-def get_approval_request_by_artifact(
-    session: Session,
+async def get_approval_request_by_artifact(
+    session: AsyncSession,
     artifact_id: str,
     status: Optional[str] = None,
 ) -> Optional[ApprovalRequest]:
     """Get approval request for an artifact (latest if multiple)"""
-    query = session.query(ApprovalRequest).filter(
-        ApprovalRequest.artifact_id == artifact_id
-    )
+    stmt = select(ApprovalRequest).where(ApprovalRequest.artifact_id == artifact_id)
     if status:
-        query = query.filter(ApprovalRequest.status == status)
-    return query.order_by(desc(ApprovalRequest.created_at)).first()
+        stmt = stmt.where(ApprovalRequest.status == status)
+    result = await session.scalars(stmt.order_by(desc(ApprovalRequest.created_at)))
+    return result.first()
 
 
-def get_approval_requests_by_chain(
-    session: Session,
+async def get_approval_requests_by_chain(
+    session: AsyncSession,
     chain_id: str,
     status: Optional[str] = None,
 ) -> List[ApprovalRequest]:
     """Get all approval requests for a chain"""
-    query = session.query(ApprovalRequest).filter(ApprovalRequest.chain_id == chain_id)
+    stmt = select(ApprovalRequest).where(ApprovalRequest.chain_id == chain_id)
     if status:
-        query = query.filter(ApprovalRequest.status == status)
-    return query.order_by(desc(ApprovalRequest.created_at)).all()
+        stmt = stmt.where(ApprovalRequest.status == status)
+    result = await session.scalars(stmt.order_by(desc(ApprovalRequest.created_at)))
+    return result.all()
+
+
+async def _decide_approval_request(
+    session: AsyncSession,
+    request_id: str,
+    status: str,
+    decided_by: Optional[str] = None,
+) -> Optional[ApprovalRequest]:
+    """
+    Move a pending approval request to its final status
+
+    The pending check is part of the UPDATE, so a request that was already
+    decided is returned unchanged.
+    """
+    values = {"status": status, "decided_at": datetime.utcnow()}
+    if decided_by:
+        values["decided_by"] = decided_by
+
+    request = await update_returning(
+        session,
+        ApprovalRequest,
+        request_id,
+        ApprovalRequest.status == "pending",
+        **values,
+    )
+    if request:
+        return request
+
+    # Not found, or already decided
+    return await get_approval_request(session, request_id)
 
 
-def approve_approval_request(
-    session: Session,
+async def approve_approval_request(
+    session: AsyncSession,
     request_id: str,
     decided_by: Optional[str] = None,
 ) -> Optional[ApprovalRequest]:
@@ -121,26 +158,11 @@ def approve_approval_request(
     Returns:
         Updated ApprovalRequest or None if not found
     """
-    request = get_approval_request(session, request_id)
-    if not request:
-        return None
+    return await _decide_approval_request(session, request_id, "approved", decided_by)
 
-    if request.status != "pending":
-        # Already decided
-        return request
 
-    request.status = "approved"
-    request.decided_at = datetime.utcnow()
-    if decided_by:
-        request.decided_by = decided_by
-
-    session.commit()
-    session.refresh(request)
-    return request
-
-
-def reject_approval_request(
-    session: Session,
+async def reject_approval_request(
+    session: AsyncSession,
     request_id: str,
     decided_by: Optional[str] = None,
 ) -> Optional[ApprovalRequest]:
@@ -155,102 +177,86 @@ def reject_approval_request(
     Returns:
         Updated ApprovalRequest or None if not found
     """
-    request = get_approval_request(session, request_id)
-    if not request:
-        return None
+    return await _decide_approval_request(session, request_id, "rejected", decided_by)
 
-    if request.status != "pending":
-        # Already decided
-        return request
 
-    request.status = "rejected"
-    request.decided_at = datetime.utcnow()
-    if decided_by:
-        request.decided_by = decided_by
-
-    session.commit()
-    session.refresh(request)
-    return request
-
-
-def cancel_approval_request(
-    session: Session,
+async def cancel_approval_request(
+    session: AsyncSession,
     request_id: str,
 ) -> Optional[ApprovalRequest]:
     """Cancel an approval request"""
-    request = get_approval_request(session, request_id)
-    if not request:
-        return None
+    return await _decide_approval_request(session, request_id, "cancelled")
 
-    if request.status != "pending":
-        # Already decided
-        return request
-
-    request.status = "cancelled"
-    request.decided_at = datetime.utcnow()
-
-    session.commit()
-    session.refresh(request)
-    return request
 
-
-def list_approval_requests(
-    session: Session,
+async def list_approval_requests(
+    session: AsyncSession,
     limit: int = 100,
-    offset: int = 0,
+    cursor: Optional[Tuple[datetime, str]] = None,
     status: Optional[str] = None,
     chain_id: Optional[str] = None,
     artifact_id: Optional[str] = None,
-) -> List[ApprovalRequest]:
+) -> Tuple[List[ApprovalRequest], Optional[Tuple[datetime, str]]]:
     """
     List approval requests with optional filtering
 
+    Uses keyset pagination ordered by (created_at, id) descending.
+
     Args:
         session: Database session
         limit: Maximum number of results
-        offset: Offset for pagination
+        cursor: (created_at, id) cursor returned by the previous page
         status: Filter by status
         chain_id: Filter by chain
         artifact_id: Filter by artifact
 
     Returns:
-        List of ApprovalRequest objects
+        Tuple of (ApprovalRequest objects, next_cursor); next_cursor is None on the last page
     """
-    query = session.query(ApprovalRequest)
+    stmt = select(ApprovalRequest)
 
     if status:
-        query = query.filter(ApprovalRequest.status == status)
+        stmt = stmt.where(ApprovalRequest.status == status)
     if chain_id:
-        query = query.filter(ApprovalRequest.chain_id == chain_id)
+        stmt = stmt.where(ApprovalRequest.chain_id == chain_id)
     if artifact_id:
-        query = query.filter(ApprovalRequest.artifact_id == artifact_id)
+        stmt = stmt.where(ApprovalRequest.artifact_id == artifact_id)
 
-    return query.order_by(desc(ApprovalRequest.created_at)).limit(limit).offset(offset).all()
+    if cursor:
+        stmt = stmt.where(tuple_(ApprovalRequest.created_at, ApprovalRequest.id) < cursor)
 
+    stmt = stmt.order_by(desc(ApprovalRequest.created_at), desc(ApprovalRequest.id)).limit(limit)
+    requests = (await session.scalars(stmt)).all()
+    next_cursor = (requests[-1].created_at, requests[-1].id) if len(requests) == limit else None
+    return requests, next_cursor
 
-def get_pending_approval_requests(
-    session: Session,
+
+async def get_pending_approval_requests(
+    session: AsyncSession,
     limit: int = 100,
 ) -> List[ApprovalRequest]:
     """Get all pending approval requests"""
-    return session.query(ApprovalRequest).filter(
-        ApprovalRequest.status == "pending"
-    ).order_by(desc(ApprovalRequest.created_at)).limit(limit).all()
+    result = await session.scalars(
+        select(ApprovalRequest)
+        .where(ApprovalRequest.status == "pending")
+        .order_by(desc(ApprovalRequest.created_at))
+        .limit(limit)
+    )
+    return result.all()
 
 
-def delete_approval_request(session: Session, request_id: str) -> bool:
+async def delete_approval_request(session: AsyncSession, request_id: str) -> bool:
     """Delete an approval request"""
-    request = get_approval_request(session, request_id)
+    request = await get_approval_request(session, request_id)
     if not request:
         return False
 
-    session.delete(request)
-    session.commit()
+    await session.delete(request)
+    await session.flush()
     return True
 
 
-def validate_approval_link(
-    session: Session,
+async def validate_approval_link(
+    session: AsyncSession,
     token: str,
 ) -> tuple[bool, Optional[str]]:
     """
@@ -263,7 +269,7 @@ def validate_approval_link(
     Returns:
         Tuple of (is_valid, error_message)
     """
-    request = get_approval_request_by_token(session, token)
+    request = await get_approval_request_by_token(session, token)
 
     if not request:
         return False, "Invalid approval link"
@@ -2,18 +2,18 @@
 CRUD operations for Artifact model
 """
 
-import uuid
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc
+from typing import Optional, List, Dict, Any, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, desc, select, update, case, tuple_, lambda_stmt, bindparam
 
-from ..models import Artifact
-from .workflow import get_workflow
+from ..models import Artifact, Workflow
+from ..schemas import ArtifactSummary
+from .base import insert_returning, update_returning, summary_columns
 
 
-def create_artifact(
-    session: Session,
+async def create_artifact(
+    session: AsyncSession,
     workflow_id: str,
     filename: str,
     local_filename: str,
@@ -31,8 +31,9 @@ def create_artifact(
     extra_metadata: Optional[Dict[str, Any]] = None,
 ) -> Artifact:
     """Create a new artifact record"""
-    artifact = Artifact(
-        id=str(uuid.uuid4()),
+    artifact = await insert_returning(
+        session,
+        Artifact,
         workflow_id=workflow_id,
         filename=filename,
         local_filename=local_filename,
@@ -49,52 +50,89 @@ def create_artifact(
         approval_status=approval_status,
         extra_metadata=extra_metadata,
     )
-    session.add(artifact)
 
     # If this is the latest, update workflow's latest_artifact_id
     if is_latest:
         # First, set all other artifacts for this workflow to is_latest=False
-        session.query(Artifact).filter(
-            and_(Artifact.workflow_id == workflow_id, Artifact.id != artifact.id)
-        ).update({"is_latest": False})
+        await session.execute(
+            update(Artifact)
+            .where(and_(Artifact.workflow_id == workflow_id, Artifact.id != artifact.id))
+            .values(is_latest=False)
+        )
 
         # Update workflow's latest_artifact_id
-        workflow = get_workflow(session, workflow_id)
-        if workflow:
-            workflow.latest_artifact_id = artifact.id
+        await session.execute(
+            update(Workflow)
+            .where(Workflow.id == workflow_id)
+            .values(latest_artifact_id=artifact.id)
+        )
 
-    session.commit()
-    session.refresh(artifact)
     return artifact
 
 
-def get_artifact(session: Session, artifact_id: str) -> Optional[Artifact]:
+# Hot lookups: built once as lambda statements so their compiled SQL is served
+# from the statement cache instead of being recompiled on every call
+_get_artifact_stmt = lambda_stmt(lambda: select(Artifact).where(Artifact.id == bindparam("id")))
+_get_latest_artifact_stmt = lambda_stmt(
+    lambda: select(Artifact).where(
+        and_(Artifact.workflow_id == bindparam("workflow_id"), Artifact.is_latest == True)
+    )
+)
+
+
+async def get_artifact(session: AsyncSession, artifact_id: str) -> Optional[Artifact]:
     """Get artifact by ID"""
-    return session.query(Artifact).filter(Artifact.id == artifact_id).first()
+    result = await session.scalars(_get_artifact_stmt, {"id": artifact_id})
+    return result.first()
 
 
-def get_latest_artifact(session: Session, workflow_id: str) -> Optional[Artifact]:
+async def get_latest_artifact(session: AsyncSession, workflow_id: str) -> Optional[Artifact]:
     """Get latest artifact for a workflow"""
-    return session.query(Artifact).filter(
-        and_(Artifact.workflow_id == workflow_id, Artifact.is_latest == True)
-    ).first()
+    result = await session.scalars(_get_latest_artifact_stmt, {"workflow_id": workflow_id})
+    return result.first()
+
+
+async def get_latest_artifacts_by_workflows(
+    session: AsyncSession,
+    workflow_ids: List[str],
+) -> Dict[str, Artifact]:
+    """
+    Get the latest artifact of each workflow with a single query
+
+    Args:
+        session: Database session
+        workflow_ids: Workflow IDs
+
+    Returns:
+        Dict of workflow_id -> latest artifact (workflows without one are omitted)
+    """
+    if not workflow_ids:
+        return {}
+
+    rows = await session.execute(
+        select(Workflow.id, Artifact)
+        .join(Artifact, Artifact.id == Workflow.latest_artifact_id)
+        .where(Workflow.id.in_(workflow_ids))
+    )
+    return {workflow_id: artifact for workflow_id, artifact in rows}
 
 
-def get_artifacts_by_workflow(
-    session: Session,
+async def get_artifacts_by_workflow(
+    session: AsyncSession,
     workflow_id: str,
     include_old_versions: bool = False,
-) -> List[Artifact]:
-    """Get all artifacts for a workflow"""
-    query = session.query(Artifact).filter(Artifact.workflow_id == workflow_id)
+) -> List[ArtifactSummary]:
+    """Get all artifacts for a workflow (ArtifactSummary columns only)"""
+    stmt = select(*summary_columns(Artifact, ArtifactSummary)).where(Artifact.workflow_id == workflow_id)
     if not include_old_versions:
-        query = query.filter(Artifact.is_latest == True)
-    return query.order_by(desc(Artifact.version)).all()
+        stmt = stmt.where(Artifact.is_latest == True)
+    rows = (await session.execute(stmt.order_by(desc(Artifact.version)))).all()
+    return [ArtifactSummary(**row._mapping) for row in rows]
 
 
-def get_artifact_versions(session: Session, artifact_id: str) -> List[Artifact]:
+async def get_artifact_versions(session: AsyncSession, artifact_id: str) -> List[Artifact]:
     """Get all versions of an artifact (including parent versions)"""
-    artifact = get_artifact(session, artifact_id)
+    artifact = await get_artifact(session, artifact_id)
     if not artifact:
         return []
 
@@ -103,7 +141,7 @@ def get_artifact_versions(session: Session, artifact_id: str) -> List[Artifact]:
 
     # Walk back through parent chain
     while current.parent_artifact_id:
-        parent = get_artifact(session, current.parent_artifact_id)
+        parent = await get_artifact(session, current.parent_artifact_id)
         if not parent:
             break
         versions.append(parent)
@@ -112,100 +150,127 @@ def get_artifact_versions(session: Session, artifact_id: str) -> List[Artifact]:
     return sorted(versions, key=lambda a: a.version, reverse=True)
 
 
-def update_artifact_latest_flag(
-    session: Session,
+async def update_artifact_latest_flag(
+    session: AsyncSession,
     artifact_id: str,
     is_latest: bool = True,
 ) -> Optional[Artifact]:
-    """Update artifact's is_latest flag"""
-    artifact = get_artifact(session, artifact_id)
+    """
+    Update artifact's is_latest flag
+
+    Marking an artifact as latest flips the flag on every sibling in a single
+    UPDATE (CASE on the id, workflow resolved by a scalar subquery) and then
+    points the workflow at it: two round-trips in total.
+    """
+    if is_latest:
+        workflow_id = select(Artifact.workflow_id).where(Artifact.id == artifact_id).scalar_subquery()
+        stmt = (
+            update(Artifact)
+            .where(Artifact.workflow_id == workflow_id)
+            .values(is_latest=case((Artifact.id == artifact_id, True), else_=False))
+        )
+    else:
+        stmt = update(Artifact).where(Artifact.id == artifact_id).values(is_latest=False)
+
+    # RETURNING where the dialect supports it, as in update_returning()
+    if session.get_bind().dialect.update_returning:
+        result = await session.execute(
+            stmt.returning(Artifact).execution_options(synchronize_session=False, populate_existing=True)
+        )
+        updated = result.scalars().all()
+        artifact = next((a for a in updated if a.id == artifact_id), None)
+    else:
+        result = await session.execute(stmt.execution_options(synchronize_session=False))
+        artifact = (
+            await session.get(Artifact, artifact_id, populate_existing=True) if result.rowcount else None
+        )
     if not artifact:
         return None
 
     if is_latest:
-        # Set all other artifacts for this workflow to is_latest=False
-        session.query(Artifact).filter(
-            and_(
-                Artifact.workflow_id == artifact.workflow_id,
-                Artifact.id != artifact_id
-            )
-        ).update({"is_latest": False})
-
-        # Import here to avoid circular dependency
-        from .workflow import update_workflow_latest_artifact
-        update_workflow_latest_artifact(session, artifact.workflow_id, artifact_id)
-
-    artifact.is_latest = is_latest
-    session.commit()
-    session.refresh(artifact)
+        await session.execute(
+            update(Workflow)
+            .where(Workflow.id == artifact.workflow_id)
+            .values(latest_artifact_id=artifact_id)
+        )
+
     return artifact
 
 
-def approve_artifact(
-    session: Session,
+async def approve_artifact(
+    session: AsyncSession,
     artifact_id: str,
     approved_by: str,
 ) -> Optional[Artifact]:
     """Approve an artifact"""
-    artifact = get_artifact(session, artifact_id)
-    if not artifact:
-        return None
-
-    artifact.approval_status = "approved"
-    artifact.approved_by = approved_by
-    artifact.approved_at = datetime.utcnow()
-
-    session.commit()
-    session.refresh(artifact)
-    return artifact
+    return await update_returning(
+        session,
+        Artifact,
+        artifact_id,
+        approval_status="approved",
+        approved_by=approved_by,
+        approved_at=datetime.utcnow(),
+    )
 
 
-def reject_artifact(
-    session: Session,
+async def reject_artifact(
+    session: AsyncSession,
     artifact_id: str,
     rejected_by: str,
     reason: Optional[str] = None,
 ) -> Optional[Artifact]:
     """Reject an artifact"""
-    artifact = get_artifact(session, artifact_id)
-    if not artifact:
-        return None
-
-    artifact.approval_status = "rejected"
-    artifact.approved_by = rejected_by
-    artifact.approved_at = datetime.utcnow()
-    artifact.rejection_reason = reason
-
-    session.commit()
-    session.refresh(artifact)
-    return artifact
+    return await update_returning(
+        session,
+        Artifact,
+        artifact_id,
+        approval_status="rejected",
+        approved_by=rejected_by,
+        approved_at=datetime.utcnow(),
+        rejection_reason=reason,
+    )
 
 
-def list_artifacts(
-    session: Session,
+async def list_artifacts(
+    session: AsyncSession,
     limit: int = 100,
-    offset: int = 0,
+    cursor: Optional[Tuple[datetime, str]] = None,
     workflow_id: Optional[str] = None,
     approval_status: Optional[str] = None,
     is_latest: Optional[bool] = None,
-) -> List[Artifact]:
-    """List artifacts with optional filtering"""
-    query = session.query(Artifact)
+) -> Tuple[List[ArtifactSummary], Optional[Tuple[datetime, str]]]:
+    """
+    List artifacts with optional filtering
+
+    Selects only the ArtifactSummary columns (no ORM objects are built). Uses
+    keyset pagination ordered by (created_at, id) descending: pass the
+    returned cursor back to fetch the next page.
+
+    Returns:
+        Tuple of (artifact summaries, next_cursor); next_cursor is None on the last page
+    """
+    stmt = select(*summary_columns(Artifact, ArtifactSummary))
     if workflow_id:
-        query = query.filter(Artifact.workflow_id == workflow_id)
+        stmt = stmt.where(Artifact.workflow_id == workflow_id)
     if approval_status:
-        query = query.filter(Artifact.approval_status == approval_status)
+        stmt = stmt.where(Artifact.approval_status == approval_status)
     if is_latest is not None:
-        query = query.filter(Artifact.is_latest == is_latest)
-    return query.order_by(desc(Artifact.created_at)).limit(limit).offset(offset).all()
+        stmt = stmt.where(Artifact.is_latest == is_latest)
+    if cursor:
+        stmt = stmt.where(tuple_(Artifact.created_at, Artifact.id) < cursor)
+    stmt = stmt.order_by(desc(Artifact.created_at), desc(Artifact.id)).limit(limit)
+    rows = (await session.execute(stmt)).all()
+    artifacts = [ArtifactSummary(**row._mapping) for row in rows]
+    next_cursor = (artifacts[-1].created_at, artifacts[-1].id) if len(artifacts) == limit else None
+    return artifacts, next_cursor
 
 
-def delete_artifact(session: Session, artifact_id: str) -> bool:
+async def delete_artifact(session: AsyncSession, artifact_id: str) -> bool:
     """Delete an artifact"""
-    artifact = get_artifact(session, artifact_id)
+    artifact = await get_artifact(session, artifact_id)
     if not artifact:
         return False
 
-    session.delete(artifact)
-    session.commit()
+    await session.delete(artifact)
+    await session.flush()
     return True
@@ -0,0 +1,65 @@
+"""
+Shared helpers for CRUD operations
+"""
+
+from typing import Any, List, Optional, Type, TypeVar
+from pydantic import BaseModel
+from sqlalchemy import insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import Base
+
+ModelT = TypeVar("ModelT", bound=Base)
+
+
+async def insert_returning(session: AsyncSession, model: Type[ModelT], **values: Any) -> ModelT:
+    """
+    INSERT a row and get the ORM object back in a single round-trip
+
+    Uses INSERT ... RETURNING where the dialect supports it (Postgres,
+    SQLite >= 3.35). Otherwise falls back to add + flush, which needs no
+    refresh either since every default (id, timestamps) is generated
+    client-side.
+    """
+    if session.get_bind().dialect.insert_returning:
+        result = await session.execute(insert(model).values(**values).returning(model))
+        return result.scalar_one()
+
+    obj = model(**values)
+    session.add(obj)
+    await session.flush()
+    return obj
+
+
+async def update_returning(
+    session: AsyncSession,
+    model: Type[ModelT],
+    id: str,
+    *criteria: Any,
+    **values: Any,
+) -> Optional[ModelT]:
+    """
+    UPDATE a row by primary key and get the refreshed ORM object back
+
+    Values may be SQL expressions (e.g. func.coalesce()); RETURNING hands back the
+    stored values, so nothing is left expired for a later lazy load (which an
+    AsyncSession cannot do). Extra `criteria` narrow the WHERE clause; returns
+    None when no row matched.
+    """
+    stmt = update(model).where(model.id == id, *criteria).values(**values)
+
+    if session.get_bind().dialect.update_returning:
+        result = await session.execute(
+            stmt.returning(model).execution_options(synchronize_session=False, populate_existing=True)
+        )
+        return result.scalars().first()
+
+    result = await session.execute(stmt.execution_options(synchronize_session=False))
+    if not result.rowcount:
+        return None
+    return await session.get(model, id, populate_existing=True)
+
+
+def summary_columns(model: Type[Base], schema: Type[BaseModel]) -> List[Any]:
+    """Model columns matching the fields of a summary schema, for select()"""
+    return [getattr(model, name) for name in schema.model_fields]
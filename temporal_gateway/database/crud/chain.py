@@ -2,17 +2,18 @@
 CRUD operations for Chain model
 """
 
-import uuid
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from typing import Optional, List, Dict, Any, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import desc, select, tuple_, lambda_stmt, bindparam
 
 from ..models import Chain
+from ..schemas import ChainSummary
+from .base import insert_returning, update_returning, summary_columns
 
 
-def create_chain(
-    session: Session,
+async def create_chain(
+    session: AsyncSession,
     name: str,
     status: str = "initializing",
     temporal_workflow_id: Optional[str] = None,
@@ -21,8 +22,9 @@ def create_chain(
     description: Optional[str] = None,
 ) -> Chain:
     """Create a new chain execution record"""
-    chain = Chain(
-        id=str(uuid.uuid4()),
+    chain = await insert_returning(
+        session,
+        Chain,
         name=name,
         description=description,
         temporal_workflow_id=temporal_workflow_id,
@@ -31,66 +33,97 @@ def create_chain(
         chain_definition=chain_definition,
         started_at=datetime.utcnow(),
     )
-    session.add(chain)
-    session.commit()
-    session.refresh(chain)
     return chain
 
 
-def get_chain(session: Session, chain_id: str) -> Optional[Chain]:
+# Hot lookups: built once as lambda statements so their compiled SQL is served
+# from the statement cache instead of being recompiled on every call
+_get_chain_stmt = lambda_stmt(lambda: select(Chain).where(Chain.id == bindparam("id")))
+_get_chain_by_temporal_id_stmt = lambda_stmt(
+    lambda: select(Chain).where(Chain.temporal_workflow_id == bindparam("temporal_workflow_id"))
+)
+
+
+async def get_chain(session: AsyncSession, chain_id: str) -> Optional[Chain]:
     """Get chain by ID"""
-    return session.query(Chain).filter(Chain.id == chain_id).first()
+    result = await session.scalars(_get_chain_stmt, {"id": chain_id})
+    return result.first()
 
 
-def get_chain_by_temporal_id(session: Session, temporal_workflow_id: str) -> Optional[Chain]:
+async def get_chain_by_temporal_id(session: AsyncSession, temporal_workflow_id: str) -> Optional[Chain]:
     """Get chain by Temporal workflow ID"""
-    return session.query(Chain).filter(Chain.temporal_workflow_id == temporal_workflow_id).first()
+    result = await session.scalars(
+        _get_chain_by_temporal_id_stmt, {"temporal_workflow_id": temporal_workflow_id}
+    )
+    return result.first()
 
 
-def update_chain_status(
-    session: Session,
+async def update_chain_status(
+    session: AsyncSession,
     chain_id: str,
     status: str,
     current_level: Optional[int] = None,
     error_message: Optional[str] = None,
 ) -> Optional[Chain]:
-    """Update chain status"""
-    chain = get_chain(session, chain_id)
-    if not chain:
-        return None
-
-    chain.status = status
+    """
+    Update chain status
+
+    No-op when the chain already has this status and there is no
+    current_level or error_message to record (retries and heartbeats resend
+    the same transition): nothing is written and the current row is returned.
+    """
+    values = {"status": status}
     if current_level is not None:
-        chain.current_level = current_level
+        values["current_level"] = current_level
     if error_message:
-        chain.error_message = error_message
+        values["error_message"] = error_message
     if status in ["completed", "failed", "cancelled"]:
-        chain.completed_at = datetime.utcnow()
+        values["completed_at"] = datetime.utcnow()
 
-    session.commit()
-    session.refresh(chain)
-    return chain
+    # Skip unchanged statuses only when there is nothing else to record
+    criteria = () if current_level is not None or error_message else (Chain.status != status,)
+    chain = await update_returning(session, Chain, chain_id, *criteria, **values)
+    if chain:
+        return chain
+
+    # Not found, or status unchanged
+    return await get_chain(session, chain_id)
 
 
-def list_chains(
-    session: Session,
+async def list_chains(
+    session: AsyncSession,
     limit: int = 100,
-    offset: int = 0,
+    cursor: Optional[Tuple[datetime, str]] = None,
     status: Optional[str] = None,
-) -> List[Chain]:
-    """List chains with optional filtering"""
-    query = session.query(Chain)
+) -> Tuple[List[ChainSummary], Optional[Tuple[datetime, str]]]:
+    """
+    List chains with optional filtering
+
+    Selects only the ChainSummary columns (no ORM objects are built). Uses
+    keyset pagination ordered by (started_at, id) descending: pass the
+    returned cursor back to fetch the next page.
+
+    Returns:
+        Tuple of (chain summaries, next_cursor); next_cursor is None on the last page
+    """
+    stmt = select(*summary_columns(Chain, ChainSummary))
     if status:
-        query = query.filter(Chain.status == status)
-    return query.order_by(desc(Chain.started_at)).limit(limit).offset(offset).all()
+        stmt = stmt.where(Chain.status == status)
+    if cursor:
+        stmt = stmt.where(tuple_(Chain.started_at, Chain.id) < cursor)
+    stmt = stmt.order_by(desc(Chain.started_at), desc(Chain.id)).limit(limit)
+    rows = (await session.execute(stmt)).all()
+    chains = [ChainSummary(**row._mapping) for row in rows]
+    next_cursor = (chains[-1].started_at, chains[-1].id) if len(chains) == limit else None
+    return chains, next_cursor
 
 
-def delete_chain(session: Session, chain_id: str) -> bool:
+async def delete_chain(session: AsyncSession, chain_id: str) -> bool:
     """Delete a chain and all associated workflows/artifacts (cascade)"""
-    chain = get_chain(session, chain_id)
+    chain = await get_chain(session, chain_id)
     if not chain:
         return False
 
-    session.delete(chain)
-    session.commit()
+    await session.delete(chain)
+    await session.flush()
     return True
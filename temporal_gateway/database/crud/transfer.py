@@ -2,17 +2,18 @@
 CRUD operations for ArtifactTransfer model
 """
 
-import uuid
 from datetime import datetime
-from typing import Optional, List
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from typing import Optional, List, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import or_, desc, select, update, bindparam, case, func, tuple_, lambda_stmt
 
 from ..models import ArtifactTransfer
+from ..schemas import TransferSummary
+from .base import insert_returning, update_returning, summary_columns
 
 
-def create_transfer(
-    session: Session,
+async def create_transfer(
+    session: AsyncSession,
     artifact_id: str,
     source_workflow_id: str,
     target_server: str,
@@ -21,8 +22,9 @@ def create_transfer(
     target_subfolder: str = "",
 ) -> ArtifactTransfer:
     """Create a new artifact transfer record"""
-    transfer = ArtifactTransfer(
-        id=str(uuid.uuid4()),
+    transfer = await insert_returning(
+        session,
+        ArtifactTransfer,
         artifact_id=artifact_id,
         source_workflow_id=source_workflow_id,
         target_workflow_id=target_workflow_id,
@@ -30,61 +32,133 @@ def create_transfer(
         target_subfolder=target_subfolder,
         status=status,
     )
-    session.add(transfer)
-    session.commit()
-    session.refresh(transfer)
     return transfer
 
 
-def get_transfer(session: Session, transfer_id: str) -> Optional[ArtifactTransfer]:
+# Hot lookup: built once as a lambda statement so its compiled SQL is served
+# from the statement cache instead of being recompiled on every call
+_get_transfer_stmt = lambda_stmt(
+    lambda: select(ArtifactTransfer).where(ArtifactTransfer.id == bindparam("id"))
+)
+
+
+async def get_transfer(session: AsyncSession, transfer_id: str) -> Optional[ArtifactTransfer]:
     """Get transfer by ID"""
-    return session.query(ArtifactTransfer).filter(ArtifactTransfer.id == transfer_id).first()
+    result = await session.scalars(_get_transfer_stmt, {"id": transfer_id})
+    return result.first()
 
 
-def update_transfer_status(
-    session: Session,
+async def update_transfer_status(
+    session: AsyncSession,
     transfer_id: str,
     status: str,
     error_message: Optional[str] = None,
 ) -> Optional[ArtifactTransfer]:
-    """Update transfer status"""
-    transfer = get_transfer(session, transfer_id)
-    if not transfer:
-        return None
+    """
+    Update transfer status
 
-    transfer.status = status
+    No-op when the transfer already has this status and there is no
+    error_message to record (retried activities resend the same transition):
+    nothing is written and the current row is returned.
+    """
+    values = {"status": status}
     if status == "completed":
-        transfer.uploaded_at = datetime.utcnow()
+        values["uploaded_at"] = datetime.utcnow()
     if error_message:
-        transfer.error_message = error_message
+        values["error_message"] = error_message
 
-    session.commit()
-    session.refresh(transfer)
-    return transfer
+    criteria = () if error_message else (ArtifactTransfer.status != status,)
+    transfer = await update_returning(session, ArtifactTransfer, transfer_id, *criteria, **values)
+    if transfer:
+        return transfer
+
+    # Not found, or status unchanged
+    return await get_transfer(session, transfer_id)
+
+
+async def bulk_update_transfer_status(
+    session: AsyncSession,
+    updates: List[Tuple[str, str, Optional[str]]],
+) -> int:
+    """
+    Update the status of many transfers with a single executemany UPDATE
 
+    Used for batch completion events (e.g. the end of a chain level) instead
+    of one SELECT + UPDATE per transfer. Rows already in the requested status
+    are skipped unless an error message is given. Objects already loaded in
+    the session are not refreshed.
 
-def list_transfers(
-    session: Session,
+    Args:
+        session: Database session
+        updates: (transfer_id, status, error_message) tuples
+
+    Returns:
+        Number of rows updated
+    """
+    if not updates:
+        return 0
+
+    table = ArtifactTransfer.__table__
+    now = datetime.utcnow()
+    stmt = (
+        update(table)
+        .where(
+            table.c.id == bindparam("b_id"),
+            or_(table.c.status != bindparam("b_status"), bindparam("b_error").is_not(None)),
+        )
+        .values(
+            status=bindparam("b_status"),
+            error_message=func.coalesce(bindparam("b_error"), table.c.error_message),
+            uploaded_at=case(
+                (bindparam("b_status") == "completed", now),
+                else_=table.c.uploaded_at,
+            ),
+        )
+    )
+    result = await session.execute(stmt, [
+        {"b_id": transfer_id, "b_status": status, "b_error": error_message}
+        for transfer_id, status, error_message in updates
+    ])
+    return result.rowcount
+
+
+async def list_transfers(
+    session: AsyncSession,
     limit: int = 100,
-    offset: int = 0,
+    cursor: Optional[Tuple[datetime, str]] = None,
     artifact_id: Optional[str] = None,
     status: Optional[str] = None,
-) -> List[ArtifactTransfer]:
-    """List transfers with optional filtering"""
-    query = session.query(ArtifactTransfer)
+) -> Tuple[List[TransferSummary], Optional[Tuple[datetime, str]]]:
+    """
+    List transfers with optional filtering
+
+    Selects only the TransferSummary columns (no ORM objects are built). Uses
+    keyset pagination ordered by (created_at, id) descending: pass the
+    returned cursor back to fetch the next page.
+
+    Returns:
+        Tuple of (transfer summaries, next_cursor); next_cursor is None on the last page
+    """
+    stmt = select(*summary_columns(ArtifactTransfer, TransferSummary))
     if artifact_id:
-        query = query.filter(ArtifactTransfer.artifact_id == artifact_id)
+        stmt = stmt.where(ArtifactTransfer.artifact_id == artifact_id)
     if status:
-        query = query.filter(ArtifactTransfer.status == status)
-    return query.order_by(desc(ArtifactTransfer.created_at)).limit(limit).offset(offset).all()
+        stmt = stmt.where(ArtifactTransfer.status == status)
+    if cursor:
+        stmt = stmt.where(tuple_(ArtifactTransfer.created_at, ArtifactTransfer.id) < cursor)
+    stmt = stmt.order_by(desc(ArtifactTransfer.created_at), desc(ArtifactTransfer.id)).limit(limit)
+    rows = (await session.execute(stmt)).all()
+    transfers = [TransferSummary(**row._mapping) for row in rows]
+    next_cursor = (transfers[-1].created_at, transfers[-1].id) if len(transfers) == limit else None
+    return transfers, next_cursor
 
 
-def delete_transfer(session: Session, transfer_id: str) -> bool:
+async def delete_transfer(session: AsyncSession, transfer_id: str) -> bool:
     """Delete a transfer record"""
-    transfer = get_transfer(session, transfer_id)
+    transfer = await get_transfer(session, transfer_id)
     if not transfer:
         return False
 
-    session.delete(transfer)
-    session.commit()
+    await session.delete(transfer)
+    await session.flush()
     return True
@@ -2,17 +2,18 @@
 CRUD operations for Workflow model
 """
 
-import uuid
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc
+from typing import Optional, List, Dict, Any, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, or_, desc, select, update, bindparam, case, func, tuple_, lambda_stmt, Boolean
 
 from ..models import Workflow
+from ..schemas import WorkflowSummary
+from .base import insert_returning, update_returning, summary_columns
 
 
-def create_workflow(
-    session: Session,
+async def create_workflow(
+    session: AsyncSession,
     workflow_name: str,
     server_address: str,
     prompt_id: str,
@@ -25,8 +26,9 @@ def create_workflow(
     parameters: Optional[Dict[str, Any]] = None,
 ) -> Workflow:
     """Create a new workflow execution record"""
-    workflow = Workflow(
-        id=str(uuid.uuid4()),
+    workflow = await insert_returning(
+        session,
+        Workflow,
         chain_id=chain_id,
         step_id=step_id,
         workflow_name=workflow_name,
@@ -39,103 +41,211 @@ def create_workflow(
         parameters=parameters,
         queued_at=datetime.utcnow(),
     )
-    session.add(workflow)
-    session.commit()
-    session.refresh(workflow)
     return workflow
 
 
-def get_workflow(session: Session, workflow_id: str) -> Optional[Workflow]:
+# Hot lookups: built once as lambda statements so their compiled SQL is served
+# from the statement cache instead of being recompiled on every call
+_get_workflow_stmt = lambda_stmt(lambda: select(Workflow).where(Workflow.id == bindparam("id")))
+_get_workflow_by_prompt_stmt = lambda_stmt(
+    lambda: select(Workflow).where(Workflow.prompt_id == bindparam("prompt_id"))
+)
+
+
+async def get_workflow(session: AsyncSession, workflow_id: str) -> Optional[Workflow]:
     """Get workflow by ID"""
-    return session.query(Workflow).filter(Workflow.id == workflow_id).first()
+    result = await session.scalars(_get_workflow_stmt, {"id": workflow_id})
+    return result.first()
 
 
-def get_workflow_by_prompt(session: Session, prompt_id: str) -> Optional[Workflow]:
+async def get_workflow_by_prompt(session: AsyncSession, prompt_id: str) -> Optional[Workflow]:
     """Get workflow by ComfyUI prompt ID"""
-    return session.query(Workflow).filter(Workflow.prompt_id == prompt_id).first()
+    result = await session.scalars(_get_workflow_by_prompt_stmt, {"prompt_id": prompt_id})
+    return result.first()
 
 
-def get_workflow_by_step(
-    session: Session,
+async def get_workflow_by_step(
+    session: AsyncSession,
     chain_id: str,
     step_id: str,
 ) -> Optional[Workflow]:
     """Get workflow by chain ID and step ID"""
-    return session.query(Workflow).filter(
-        and_(Workflow.chain_id == chain_id, Workflow.step_id == step_id)
-    ).first()
+    result = await session.scalars(
+        select(Workflow).where(and_(Workflow.chain_id == chain_id, Workflow.step_id == step_id))
+    )
+    return result.first()
 
 
-def get_workflows_by_chain(
-    session: Session,
+async def get_workflows_by_chain(
+    session: AsyncSession,
     chain_id: str,
 ) -> List[Workflow]:
     """Get all workflows in a chain"""
-    return session.query(Workflow).filter(Workflow.chain_id == chain_id).all()
+    result = await session.scalars(select(Workflow).where(Workflow.chain_id == chain_id))
+    return result.all()
+
+
+async def reset_workflow_for_rerun(
+    session: AsyncSession,
+    workflow_id: str,
+    server_address: str,
+    workflow_definition: Optional[Dict[str, Any]] = None,
+    parameters: Optional[Dict[str, Any]] = None,
+) -> Optional[Workflow]:
+    """
+    Point an existing workflow record at a new execution of the same step
+
+    Used when a step runs again (e.g. approval regeneration): the record gets
+    the new definition, parameters and server and goes back to queued.
+    """
+    return await update_returning(
+        session,
+        Workflow,
+        workflow_id,
+        server_address=server_address,
+        workflow_definition=workflow_definition,
+        parameters=parameters,
+        prompt_id="pending",
+        status="queued",
+        error_message=None,
+        queued_at=datetime.utcnow(),
+        started_at=None,
+        completed_at=None,
+    )
 
 
-def update_workflow_status(
-    session: Session,
+async def update_workflow_status(
+    session: AsyncSession,
     workflow_id: str,
     status: str,
     error_message: Optional[str] = None,
 ) -> Optional[Workflow]:
-    """Update workflow status"""
-    workflow = get_workflow(session, workflow_id)
-    if not workflow:
-        return None
-
-    workflow.status = status
-    if status == "executing" and not workflow.started_at:
-        workflow.started_at = datetime.utcnow()
+    """
+    Update workflow status
+
+    No-op when the workflow already has this status and there is no
+    error_message to record (retries and heartbeats resend the same
+    transition): nothing is written and the current row is returned.
+    """
+    values = {"status": status}
+    if status == "executing":
+        # Keep the first start time if the workflow is re-entered
+        values["started_at"] = func.coalesce(Workflow.started_at, datetime.utcnow())
     if status in ["completed", "failed", "skipped"]:
-        workflow.completed_at = datetime.utcnow()
+        values["completed_at"] = datetime.utcnow()
     if error_message:
-        workflow.error_message = error_message
-
-    session.commit()
-    session.refresh(workflow)
-    return workflow
-
-
-def update_workflow_latest_artifact(
-    session: Session,
+        values["error_message"] = error_message
+
+    criteria = () if error_message else (Workflow.status != status,)
+    workflow = await update_returning(session, Workflow, workflow_id, *criteria, **values)
+    if workflow:
+        return workflow
+
+    # Not found, or status unchanged
+    return await get_workflow(session, workflow_id)
+
+
+async def bulk_update_workflow_status(
+    session: AsyncSession,
+    updates: List[Tuple[str, str, Optional[str]]],
+) -> int:
+    """
+    Update the status of many workflows with a single executemany UPDATE
+
+    Applies the same started_at/completed_at rules as update_workflow_status,
+    and likewise skips rows already in the requested status unless an error
+    message is given. Objects already loaded in the session are not refreshed.
+
+    Args:
+        session: Database session
+        updates: (workflow_id, status, error_message) tuples
+
+    Returns:
+        Number of rows updated
+    """
+    if not updates:
+        return 0
+
+    table = Workflow.__table__
+    now = datetime.utcnow()
+    stmt = (
+        update(table)
+        .where(
+            table.c.id == bindparam("b_id"),
+            or_(table.c.status != bindparam("b_status"), bindparam("b_error").is_not(None)),
+        )
+        .values(
+            status=bindparam("b_status"),
+            error_message=func.coalesce(bindparam("b_error"), table.c.error_message),
+            started_at=case(
+                (and_(bindparam("b_started", type_=Boolean), table.c.started_at.is_(None)), now),
+                else_=table.c.started_at,
+            ),
+            completed_at=case(
+                (bindparam("b_completed", type_=Boolean), now),
+                else_=table.c.completed_at,
+            ),
+        )
+    )
+    result = await session.execute(stmt, [
+        {
+            "b_id": workflow_id,
+            "b_status": status,
+            "b_error": error_message,
+            "b_started": status == "executing",
+            "b_completed": status in ("completed", "failed", "skipped"),
+        }
+        for workflow_id, status, error_message in updates
+    ])
+    return result.rowcount
+
+
+async def update_workflow_latest_artifact(
+    session: AsyncSession,
     workflow_id: str,
     artifact_id: str,
 ) -> Optional[Workflow]:
     """Update workflow's latest artifact reference"""
-    workflow = get_workflow(session, workflow_id)
-    if not workflow:
-        return None
-
-    workflow.latest_artifact_id = artifact_id
-    session.commit()
-    session.refresh(workflow)
-    return workflow
+    return await update_returning(session, Workflow, workflow_id, latest_artifact_id=artifact_id)
 
 
-def list_workflows(
-    session: Session,
+async def list_workflows(
+    session: AsyncSession,
     limit: int = 100,
-    offset: int = 0,
+    cursor: Optional[Tuple[datetime, str]] = None,
     status: Optional[str] = None,
     chain_id: Optional[str] = None,
-) -> List[Workflow]:
-    """List workflows with optional filtering"""
-    query = session.query(Workflow)
+) -> Tuple[List[WorkflowSummary], Optional[Tuple[datetime, str]]]:
+    """
+    List workflows with optional filtering
+
+    Selects only the WorkflowSummary columns (no ORM objects are built). Uses
+    keyset pagination ordered by (queued_at, id) descending: pass the
+    returned cursor back to fetch the next page.
+
+    Returns:
+        Tuple of (workflow summaries, next_cursor); next_cursor is None on the last page
+    """
+    stmt = select(*summary_columns(Workflow, WorkflowSummary))
     if status:
-        query = query.filter(Workflow.status == status)
+        stmt = stmt.where(Workflow.status == status)
     if chain_id:
-        query = query.filter(Workflow.chain_id == chain_id)
-    return query.order_by(desc(Workflow.queued_at)).limit(limit).offset(offset).all()
+        stmt = stmt.where(Workflow.chain_id == chain_id)
+    if cursor:
+        stmt = stmt.where(tuple_(Workflow.queued_at, Workflow.id) < cursor)
+    stmt = stmt.order_by(desc(Workflow.queued_at), desc(Workflow.id)).limit(limit)
+    rows = (await session.execute(stmt)).all()
+    workflows = [WorkflowSummary(**row._mapping) for row in rows]
+    next_cursor = (workflows[-1].queued_at, workflows[-1].id) if len(workflows) == limit else None
+    return workflows, next_cursor
 
 
-def delete_workflow(session: Session, workflow_id: str) -> bool:
+async def delete_workflow(session: AsyncSession, workflow_id: str) -> bool:
     """Delete a workflow and all associated artifacts (cascade)"""
-    workflow = get_workflow(session, workflow_id)
+    workflow = await get_workflow(session, workflow_id)
     if not workflow:
         return False
 
-    session.delete(workflow)
-    session.commit()
+    await session.delete(workflow)
+    await session.flush()
     return True
@@ -2,8 +2,12 @@
 SQLAlchemy models for artifact tracking database
 """
 
+import uuid
+import zlib
 from datetime import datetime
 from typing import Optional
+
+import orjson
 from sqlalchemy import (
     Column,
     String,
@@ -15,11 +19,88 @@ from sqlalchemy import (
     Index,
     UniqueConstraint,
     JSON,
+    BINARY,
+    LargeBinary,
 )
-from sqlalchemy.orm import declarative_base, relationship
-from sqlalchemy.sql import func
-
-Base = declarative_base()
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncAttrs
+from sqlalchemy.orm import declarative_base, relationship, deferred
+from sqlalchemy.types import TypeDecorator
+
+# AsyncAttrs: unloaded relationships are reached with `await obj.awaitable_attrs.<name>`
+Base = declarative_base(cls=AsyncAttrs)
+
+
+class UUIDString(TypeDecorator):
+    """
+    UUID stored natively (Postgres UUID, BINARY(16) elsewhere) but exposed as str
+
+    Keeps primary/foreign key indexes at 16 bytes per entry instead of a
+    36-char string while callers (activities, Temporal payloads, API
+    responses) keep passing and receiving canonical UUID strings. Values that
+    are not valid UUIDs bind as NULL, so lookups on them match nothing.
+    """
+
+    impl = BINARY(16)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+        return dialect.type_descriptor(BINARY(16))
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if not isinstance(value, uuid.UUID):
+            try:
+                value = uuid.UUID(str(value))
+            except ValueError:
+                return None
+        return value if dialect.name == "postgresql" else value.bytes
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, uuid.UUID):
+            return str(value)
+        return str(uuid.UUID(bytes=bytes(value)))
+
+
+class PackedJSON(TypeDecorator):
+    """
+    JSON payload column: JSONB on Postgres, zlib-compressed JSON bytes elsewhere
+
+    Used for the large workflow/chain payloads. JSONB is stored pre-parsed
+    (no re-parse on read, supports containment indexes); on SQLite the
+    compressed blob roughly halves the I/O for big workflow graphs. Rows
+    written as plain JSON text before this type existed are still readable.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.JSONB())
+        return dialect.type_descriptor(LargeBinary())
+
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name == "postgresql":
+            return value
+        return zlib.compress(orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS))
+
+    def process_result_value(self, value, dialect):
+        if value is None or dialect.name == "postgresql":
+            return value
+        if isinstance(value, str):
+            return orjson.loads(value)
+        return orjson.loads(zlib.decompress(value))
+
+
+def _new_id() -> str:
+    """Default primary key value"""
+    return str(uuid.uuid4())
 
 
 class Chain(Base):
@@ -27,7 +108,7 @@ class Chain(Base):
 
     __tablename__ = "chains"
 
-    id = Column(String, primary_key=True)  # UUID
+    id = Column(UUIDString, primary_key=True, default=_new_id)
     name = Column(String, nullable=False)
     description = Column(Text)
 
@@ -40,16 +121,16 @@ class Chain(Base):
     current_level = Column(Integer, default=0)
 
     # Timestamps
-    started_at = Column(DateTime, nullable=False, default=func.now())
+    started_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     completed_at = Column(DateTime)
 
     # Results
     error_message = Column(Text)
-    chain_definition = Column(JSON)  # Full chain YAML as JSON
+    chain_definition = deferred(Column(PackedJSON))  # Full chain YAML as JSON (loaded on access)
 
     # Metadata
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
     workflows = relationship("Workflow", back_populates="chain", cascade="all, delete-orphan")
@@ -58,7 +139,7 @@ class Chain(Base):
     __table_args__ = (
         Index("idx_chains_temporal", "temporal_workflow_id"),
         Index("idx_chains_status", "status"),
-        Index("idx_chains_started", "started_at"),
+        Index("idx_chains_started_id", "started_at", "id"),
     )
 
     def __repr__(self):
@@ -70,10 +151,10 @@ class Workflow(Base):
 
     __tablename__ = "workflows"
 
-    id = Column(String, primary_key=True)  # UUID
+    id = Column(UUIDString, primary_key=True, default=_new_id)
 
     # Chain relationship (NULL for standalone workflows)
-    chain_id = Column(String, ForeignKey("chains.id", ondelete="CASCADE"))
+    chain_id = Column(UUIDString, ForeignKey("chains.id", ondelete="CASCADE"))
     step_id = Column(String)  # NULL for standalone
 
     # Workflow info
@@ -89,21 +170,22 @@ class Workflow(Base):
     status = Column(String, nullable=False)  # 'queued', 'executing', 'completed', 'failed', 'skipped'
 
     # Latest artifact reference (denormalized)
-    latest_artifact_id = Column(String, ForeignKey("artifacts.id", ondelete="SET NULL"))
+    latest_artifact_id = Column(UUIDString, ForeignKey("artifacts.id", ondelete="SET NULL"))
 
     # Timestamps
-    queued_at = Column(DateTime, nullable=False, default=func.now())
+    queued_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     started_at = Column(DateTime)
     completed_at = Column(DateTime)
 
     # Execution details
     error_message = Column(Text)
-    workflow_definition = Column(JSON)  # Workflow JSON sent to ComfyUI
-    parameters = Column(JSON)  # Resolved parameters
+    # Large JSON payloads are deferred: only loaded when accessed (or via undefer())
+    workflow_definition = deferred(Column(PackedJSON))  # Workflow JSON sent to ComfyUI
+    parameters = deferred(Column(PackedJSON))  # Resolved parameters
 
     # Metadata
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
     chain = relationship("Chain", back_populates="workflows")
@@ -116,6 +198,8 @@ class Workflow(Base):
         Index("idx_workflows_prompt", "prompt_id"),
         Index("idx_workflows_temporal", "temporal_workflow_id"),
         Index("idx_workflows_status", "status"),
+        Index("idx_workflows_chain_status", "chain_id", "status"),
+        Index("idx_workflows_queued_id", "queued_at", "id"),
     )
 
     def __repr__(self):
@@ -127,8 +211,8 @@ class Artifact(Base):
 
     __tablename__ = "artifacts"
 
-    id = Column(String, primary_key=True)  # UUID
-    workflow_id = Column(String, ForeignKey("workflows.id", ondelete="CASCADE"), nullable=False)
+    id = Column(UUIDString, primary_key=True, default=_new_id)
+    workflow_id = Column(UUIDString, ForeignKey("workflows.id", ondelete="CASCADE"), nullable=False)
 
     # File info
     filename = Column(String, nullable=False)  # Original ComfyUI filename
@@ -146,7 +230,7 @@ class Artifact(Base):
     # Versioning
     version = Column(Integer, default=1)
     is_latest = Column(Boolean, default=True)
-    parent_artifact_id = Column(String, ForeignKey("artifacts.id", ondelete="SET NULL"))
+    parent_artifact_id = Column(UUIDString, ForeignKey("artifacts.id", ondelete="SET NULL"))
 
     # Approval workflow
     approval_status = Column(String, default="auto_approved")  # 'pending', 'approved', 'rejected', 'auto_approved', 'edited'
@@ -155,9 +239,9 @@ class Artifact(Base):
     rejection_reason = Column(Text)
 
     # Metadata
-    extra_metadata = Column(JSON)  # Additional metadata (renamed from 'metadata' to avoid SQLAlchemy conflict)
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    extra_metadata = deferred(Column(PackedJSON))  # Additional metadata (renamed from 'metadata' to avoid SQLAlchemy conflict), loaded on access
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
     workflow = relationship("Workflow", foreign_keys=[workflow_id], back_populates="artifacts")
@@ -169,7 +253,8 @@ class Artifact(Base):
         Index("idx_artifacts_workflow", "workflow_id"),
         Index("idx_artifacts_latest", "workflow_id", "is_latest"),
         Index("idx_artifacts_approval", "approval_status"),
-        Index("idx_artifacts_created", "created_at"),
+        Index("idx_artifacts_created_id", "created_at", "id"),
+        Index("idx_artifacts_workflow_created", "workflow_id", "created_at"),
     )
 
     def __repr__(self):
@@ -181,12 +266,12 @@ class ArtifactTransfer(Base):
 
     __tablename__ = "artifact_transfers"
 
-    id = Column(String, primary_key=True)  # UUID
-    artifact_id = Column(String, ForeignKey("artifacts.id", ondelete="CASCADE"), nullable=False)
+    id = Column(UUIDString, primary_key=True, default=_new_id)
+    artifact_id = Column(UUIDString, ForeignKey("artifacts.id", ondelete="CASCADE"), nullable=False)
 
     # Transfer info
-    source_workflow_id = Column(String, ForeignKey("workflows.id", ondelete="CASCADE"), nullable=False)
-    target_workflow_id = Column(String, ForeignKey("workflows.id", ondelete="CASCADE"))
+    source_workflow_id = Column(UUIDString, ForeignKey("workflows.id", ondelete="CASCADE"), nullable=False)
+    target_workflow_id = Column(UUIDString, ForeignKey("workflows.id", ondelete="CASCADE"))
     target_server = Column(String, nullable=False)
     target_subfolder = Column(String, default="")
 
@@ -196,7 +281,7 @@ class ArtifactTransfer(Base):
     error_message = Column(Text)
 
     # Metadata
-    created_at = Column(DateTime, default=func.now())
+    created_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
     artifact = relationship("Artifact", back_populates="transfers")
@@ -209,6 +294,8 @@ class ArtifactTransfer(Base):
         Index("idx_transfers_source", "source_workflow_id"),
         Index("idx_transfers_target", "target_workflow_id"),
         Index("idx_transfers_status", "status"),
+        Index("idx_transfers_artifact_status", "artifact_id", "status"),
+        Index("idx_transfers_created_id", "created_at", "id"),
     )
 
     def __repr__(self):
@@ -220,9 +307,9 @@ class ApprovalRequest(Base):
 
     __tablename__ = "approval_requests"
 
-    id = Column(String, primary_key=True)  # UUID
-    artifact_id = Column(String, ForeignKey("artifacts.id", ondelete="CASCADE"), nullable=False)
-    chain_id = Column(String, ForeignKey("chains.id", ondelete="CASCADE"))  # Optional, for chain context
+    id = Column(UUIDString, primary_key=True, default=_new_id)
+    artifact_id = Column(UUIDString, ForeignKey("artifacts.id", ondelete="CASCADE"), nullable=False)
+    chain_id = Column(UUIDString, ForeignKey("chains.id", ondelete="CASCADE"))  # Optional, for chain context
     step_id = Column(String)  # Which step in the chain this approval is for
 
     # Temporal workflow info (parent workflow waiting for approval)
@@ -240,8 +327,8 @@ class ApprovalRequest(Base):
     decided_by = Column(String)  # Optional: identifier of who/what made final decision
 
     # Timestamps
-    created_at = Column(DateTime, nullable=False, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Metadata
     config_metadata = Column(JSON)  # Additional configuration for external systems
@@ -257,6 +344,7 @@ class ApprovalRequest(Base):
         Index("idx_approval_requests_status", "status"),
         Index("idx_approval_requests_temporal", "temporal_workflow_id"),
         Index("idx_approval_requests_link_token", "approval_link_token"),
+        Index("idx_approval_requests_created_id", "created_at", "id"),
     )
 
     def __repr__(self):
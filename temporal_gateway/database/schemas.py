@@ -0,0 +1,57 @@
+"""
+Lightweight row schemas returned by the list queries
+
+Each schema names exactly the columns its list query selects, so listing
+rows never hydrates full ORM objects (or their JSON payloads).
+"""
+
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+
+
+class ChainSummary(BaseModel):
+    """Chain row as returned by list_chains"""
+    id: str
+    name: str
+    status: str
+    current_level: Optional[int] = None
+    started_at: datetime
+    completed_at: Optional[datetime] = None
+
+
+class WorkflowSummary(BaseModel):
+    """Workflow row as returned by list_workflows"""
+    id: str
+    chain_id: Optional[str] = None
+    step_id: Optional[str] = None
+    workflow_name: str
+    server_address: str
+    status: str
+    latest_artifact_id: Optional[str] = None
+    queued_at: datetime
+    completed_at: Optional[datetime] = None
+
+
+class ArtifactSummary(BaseModel):
+    """Artifact row as returned by list_artifacts / get_artifacts_by_workflow"""
+    id: str
+    workflow_id: str
+    filename: str
+    file_type: str
+    version: Optional[int] = None
+    is_latest: Optional[bool] = None
+    parent_artifact_id: Optional[str] = None
+    approval_status: Optional[str] = None
+    created_at: datetime
+
+
+class TransferSummary(BaseModel):
+    """Transfer row as returned by list_transfers"""
+    id: str
+    artifact_id: str
+    source_workflow_id: str
+    target_server: str
+    status: str
+    uploaded_at: Optional[datetime] = None
+    created_at: datetime
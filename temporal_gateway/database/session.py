@@ -2,65 +2,247 @@
 Database session management
 """
 
+import logging
 import os
+import uuid
+from contextvars import ContextVar
 from pathlib import Path
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
-from contextlib import contextmanager
+from typing import AsyncIterator, Iterator, List, Optional
+from sqlalchemy import Uuid, event, inspect
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    create_async_engine,
+    async_sessionmaker,
+    async_scoped_session,
+    AsyncSession,
+)
+from contextlib import asynccontextmanager, contextmanager
 
-from .models import Base
+from .models import Base, UUIDString
+
+logger = logging.getLogger(__name__)
 
 # Database configuration
 DATABASE_DIR = Path(__file__).parent.parent / "data"
 DATABASE_DIR.mkdir(parents=True, exist_ok=True)
-DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{DATABASE_DIR}/artifacts.db")
+DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite+aiosqlite:///{DATABASE_DIR}/artifacts.db")
+
+# Async drivers for URLs given with the default (blocking) driver
+# (postgresql+asyncpg needs the "postgres" extra)
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+_url = make_url(DATABASE_URL)
+if _url.drivername in ASYNC_DRIVERS:
+    _url = _url.set(drivername=ASYNC_DRIVERS[_url.drivername])
 
 # Create engine
-# Use StaticPool for SQLite to avoid threading issues
-if DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(
-        DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-        echo=False  # Set to True for SQL debugging
-    )
-else:
-    engine = create_engine(DATABASE_URL, echo=False)
+# All queries go through the async driver so they never block the event loop
+engine = create_async_engine(
+    _url,
+    query_cache_size=1200,  # Room for every CRUD statement variant
+    echo=False  # Set to True for SQL debugging
+)
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Statements executed in the current context (set by count_queries())
+_query_log: ContextVar[Optional[List[str]]] = ContextVar("db_query_log", default=None)
 
 
-def init_db():
-    """Initialize database tables"""
-    Base.metadata.create_all(bind=engine)
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _record_query(conn, cursor, statement, parameters, context, executemany):
+    queries = _query_log.get()
+    if queries is not None:
+        queries.append(statement)
 
 
 @contextmanager
-def get_session() -> Session:
+def count_queries() -> Iterator[List[str]]:
     """
-    Get database session with automatic cleanup
+    Record the SQL statements executed inside the block
+
+    Yields the list the statements are appended to, so len() of it is the
+    query count. Used to catch N+1 regressions in tests and per request.
 
     Usage:
-        with get_session() as session:
-            chain = session.query(Chain).first()
+        with count_queries() as queries:
+            await get_workflow(session, workflow_id)
+        assert len(queries) <= 1
     """
+    queries: List[str] = []
+    token = _query_log.set(queries)
+    try:
+        yield queries
+    finally:
+        _query_log.reset(token)
+
+
+# Create session factory
+# expire_on_commit=False keeps returned objects readable after the commit
+session_factory = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+# Request scope identifier (set by the `db` dependency for the lifetime of a request)
+_request_scope: ContextVar[Optional[str]] = ContextVar("db_request_scope", default=None)
+
+# Sessions are scoped to the current request, so every CRUD call made while
+# handling one request shares a single session and a single transaction
+SessionLocal = async_scoped_session(session_factory, scopefunc=_request_scope.get)
+
+
+# Indexes since replaced in the models (by a wider index on the same leading
+# column), dropped from databases created before the change
+OBSOLETE_INDEXES = ["idx_chains_started", "idx_artifacts_created"]
+
+
+def _migrate_uuid_columns(connection):
+    """
+    Convert UUID keys stored as 36-char text to the UUIDString form
+
+    Databases created before UUIDString stored every id and foreign key as
+    TEXT. On SQLite (whose columns accept either type) the values are
+    rewritten in place as 16-byte UUIDs, so old and new rows compare equal.
+    Other backends would need a column type change, which is not done
+    here: startup fails with instructions instead.
+    """
+    if connection.dialect.name != "sqlite":
+        if connection.dialect.name == "postgresql":
+            id_column = next(
+                (c for c in inspect(connection).get_columns("chains") if c["name"] == "id"), None
+            )
+            if id_column and not isinstance(id_column["type"], Uuid):
+                raise RuntimeError(
+                    "Database ids are stored as text (schema predates UUID keys). Convert the "
+                    "id and foreign key columns to uuid (ALTER COLUMN ... TYPE uuid USING ...::uuid) "
+                    "or recreate the database."
+                )
+        return
+
+    # Old ids may be referenced before their own row is converted
+    connection.exec_driver_sql("PRAGMA defer_foreign_keys = ON")
+
+    for table in Base.metadata.tables.values():
+        for column in table.columns:
+            if not isinstance(column.type, UUIDString):
+                continue
+            rows = connection.exec_driver_sql(
+                f'SELECT rowid, "{column.name}" FROM "{table.name}" WHERE typeof("{column.name}") = \'text\''
+            ).all()
+            if not rows:
+                continue
+
+            updates = []
+            for rowid, value in rows:
+                try:
+                    updates.append((uuid.UUID(value).bytes, rowid))
+                except ValueError:
+                    raise RuntimeError(
+                        f"Cannot migrate {table.name}.{column.name}: {value!r} (row {rowid}) "
+                        "is not a UUID"
+                    ) from None
+            connection.exec_driver_sql(
+                f'UPDATE "{table.name}" SET "{column.name}" = ? WHERE rowid = ?', updates
+            )
+            logger.info(f"Migrated {len(updates)} text UUID(s) in {table.name}.{column.name}")
+
+
+def _create_schema(connection):
+    """
+    Create tables and any indexes missing from existing tables, convert
+    text UUID keys and drop obsolete indexes
+    """
+    Base.metadata.create_all(bind=connection)
+    _migrate_uuid_columns(connection)
+
+    # create_all() skips tables that already exist, so indexes added to the
+    # models later are created here (no-op when they are already present)
+    for table in Base.metadata.tables.values():
+        for index in table.indexes:
+            index.create(bind=connection, checkfirst=True)
+
+    for name in OBSOLETE_INDEXES:
+        connection.exec_driver_sql(f"DROP INDEX IF EXISTS {name}")
+
+
+async def init_db():
+    """Initialize database tables and any indexes missing from existing tables"""
+    async with engine.begin() as conn:
+        await conn.run_sync(_create_schema)
+
+
+async def optimize_db():
+    """
+    Refresh planner statistics so the query planner keeps using our indexes
+
+    SQLite runs PRAGMA optimize (capped by analysis_limit to keep it cheap);
+    other backends run ANALYZE.
+    """
+    async with engine.begin() as conn:
+        if engine.dialect.name == "sqlite":
+            await conn.exec_driver_sql("PRAGMA analysis_limit=1000")
+            await conn.exec_driver_sql("PRAGMA optimize")
+        else:
+            await conn.exec_driver_sql("ANALYZE")
+
+
+async def db():
+    """
+    FastAPI dependency providing the request-scoped session
+
+    Commits once when the request finishes (rolls back on error) and removes
+    the session from the registry.
+
+    Usage:
+        @router.get("/items")
+        async def list_items(session: AsyncSession = Depends(db)):
+            ...
+    """
+    token = _request_scope.set(uuid.uuid4().hex)
     session = SessionLocal()
     try:
         yield session
-        session.commit()
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await SessionLocal.remove()
+        _request_scope.reset(token)
+
+
+@asynccontextmanager
+async def get_session() -> AsyncIterator[AsyncSession]:
+    """
+    Get database session with automatic cleanup
+
+    Inside a request handled with the `db` dependency this yields the
+    request-scoped session and leaves commit/cleanup to the request boundary.
+    Otherwise (activities, scripts) a dedicated session is opened and
+    committed when the block exits.
+
+    Usage:
+        async with get_session() as session:
+            chain = await get_chain(session, chain_id)
+    """
+    if _request_scope.get() is not None:
+        yield SessionLocal()
+        return
+
+    session = session_factory()
+    try:
+        yield session
+        await session.commit()
     except Exception:
-        session.rollback()
+        await session.rollback()
         raise
     finally:
-        session.close()
+        await session.close()
 
 
-def get_session_direct() -> Session:
+def get_session_direct() -> AsyncSession:
     """
     Get database session without context manager (for dependency injection)
 
-    Note: Caller is responsible for closing the session
+    Note: Caller is responsible for closing the session (`await session.close()`)
     """
-    return SessionLocal()
+    return session_factory()
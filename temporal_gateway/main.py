@@ -4,16 +4,29 @@ Temporal-based FastAPI Gateway for ComfyUI
 This gateway uses Temporal for durable workflow execution.
 """
 
+import asyncio
+import hashlib
+import logging
+import os
 import uuid
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
-
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
-
-from temporalio.client import Client
+from typing import Dict, Any, List, Optional, Tuple, Type
+
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import FileResponse
+from pydantic import BaseModel, ValidationError
+
+from temporalio.client import (
+    Client,
+    WorkflowExecutionStatus,
+    WorkflowQueryFailedError,
+    WorkflowQueryRejectedError,
+)
+from temporalio.service import RPCError, RPCStatusCode
 
 # Add parent to path
 sys.path.append(str(Path(__file__).parent.parent))
@@ -29,12 +42,37 @@ from temporal_gateway.chains import (
     ChainEngine
 )
 from temporal_gateway.clients.approval import router as approval_router, initialize_approval_service
+from temporal_gateway.database import init_db, optimize_db, count_queries
+from temporal_gateway.response_cache import cached, response_cache
+
+logger = logging.getLogger(__name__)
 
 app = FastAPI(title="ComfyAutomate Temporal Gateway", version="2.0.0")
 
 # Include routers
 app.include_router(approval_router)
 
+# DB query instrumentation: X-DB-Query-Count header in debug mode, warning
+# for requests issuing more queries than the threshold (likely an N+1)
+DEBUG = os.getenv("GATEWAY_DEBUG", "").lower() in ("1", "true", "yes")
+DB_QUERY_WARN_THRESHOLD = int(os.getenv("DB_QUERY_WARN_THRESHOLD", "20"))
+
+
+@app.middleware("http")
+async def count_db_queries(request: Request, call_next):
+    """Count the DB queries issued while handling each request"""
+    with count_queries() as queries:
+        response = await call_next(request)
+
+    if len(queries) > DB_QUERY_WARN_THRESHOLD:
+        logger.warning(
+            f"{request.method} {request.url.path} issued {len(queries)} DB queries "
+            f"(threshold {DB_QUERY_WARN_THRESHOLD})"
+        )
+    if DEBUG:
+        response.headers["X-DB-Query-Count"] = str(len(queries))
+    return response
+
 # Temporal client (will be initialized on startup)
 temporal_client: Client = None
 
@@ -44,11 +82,58 @@ workflow_registry = None
 # Chain engine (will be initialized on startup)
 chain_engine: ChainEngine = None
 
+# Periodic planner statistics refresh (started on startup)
+ANALYZE_INTERVAL_SECONDS = 3600
+analyze_task: asyncio.Task = None
+
+# ComfyUI server health snapshot, refreshed in the background (started on
+# startup) so health polling does not probe every backend per request
+HEALTH_REFRESH_INTERVAL_SECONDS = 5
+health_task: asyncio.Task = None
+_health_snapshot: Optional[Dict[str, Any]] = None
+
+
+async def analyze_periodically():
+    """Re-run ANALYZE / PRAGMA optimize every hour as the tables grow"""
+    while True:
+        await asyncio.sleep(ANALYZE_INTERVAL_SECONDS)
+        try:
+            await optimize_db()
+        except Exception as e:
+            print(f"Periodic database analyze failed: {e}")
+
+
+async def refresh_server_health() -> Dict[str, Any]:
+    """Probe every registered server (blocking HTTP, so in a thread) and store the snapshot"""
+    global _health_snapshot
+    servers = await asyncio.to_thread(load_balancer.get_all_servers_health)
+    _health_snapshot = {
+        "servers": servers,
+        "available_count": sum(1 for s in servers if s["is_online"])
+    }
+    return _health_snapshot
+
+
+async def refresh_health_periodically():
+    """Keep the server health snapshot at most HEALTH_REFRESH_INTERVAL_SECONDS old"""
+    while True:
+        try:
+            await refresh_server_health()
+        except Exception as e:
+            print(f"Server health refresh failed: {e}")
+        await asyncio.sleep(HEALTH_REFRESH_INTERVAL_SECONDS)
+
 
 @app.on_event("startup")
 async def startup():
     """Connect to Temporal Server and initialize workflow registry on startup"""
-    global temporal_client, workflow_registry, chain_engine
+    global temporal_client, workflow_registry, chain_engine, analyze_task, health_task
+
+    # Initialize database and refresh planner statistics
+    await init_db()
+    await optimize_db()
+    analyze_task = asyncio.create_task(analyze_periodically())
+    health_task = asyncio.create_task(refresh_health_periodically())
 
     # Connect to Temporal
     temporal_client = await Client.connect("localhost:7233")
@@ -56,6 +141,7 @@ async def startup():
     # Initialize workflow registry
     workflow_registry = get_registry()
     summary = workflow_registry.discover_workflows()
+    response_cache.clear(namespace="workflows")
 
     # Initialize chain engine
     chain_engine = ChainEngine(temporal_client)
@@ -76,6 +162,10 @@ async def startup():
 @app.on_event("shutdown")
 async def shutdown():
     """Cleanup on shutdown"""
+    if analyze_task:
+        analyze_task.cancel()
+    if health_task:
+        health_task.cancel()
     if temporal_client:
         await temporal_client.close()
 
@@ -104,11 +194,76 @@ class TemplateExecuteRequest(BaseModel):
     strategy: str = "least_loaded"
 
 
+def json_body(model: Type[BaseModel]):
+    """
+    Dependency that validates the raw request body straight into `model`
+
+    model_validate_json parses and validates in one pass inside pydantic-core,
+    skipping the intermediate dict FastAPI builds with request.json() - that
+    dict is the expensive part when `parameters` is large. Pair it with
+    body_schema() so the endpoint keeps its OpenAPI request body.
+    """
+    async def parse(request: Request) -> BaseModel:
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError(
+                [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+            )
+
+    return Depends(parse)
+
+
+def body_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """openapi_extra documenting a json_body() request body"""
+    return {
+        "requestBody": {
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+            "required": True,
+        }
+    }
+
+
+# ============================================================================
+# Conditional GET helpers
+# ============================================================================
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match covers this ETag (weak comparison)"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+# orjson options for JSON the gateway encodes itself (ETags, cached bodies)
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def json_etag(data: Any) -> str:
+    """Weak ETag over the JSON form of a response body (stable across workers)"""
+    body = orjson.dumps(data, default=str, option=_JSON_OPTIONS | orjson.OPT_SORT_KEYS)
+    return f'W/"{hashlib.md5(body).hexdigest()}"'
+
+
 # ============================================================================
 # Workflow Discovery & Template Endpoints
 # ============================================================================
 
+def workflow_not_found(workflow_name: str) -> HTTPException:
+    """404 for an unknown template, pointing clients at the catalog endpoint"""
+    return HTTPException(
+        status_code=404,
+        detail=f"Workflow '{workflow_name}' not found. See /workflows for available workflows.",
+        headers={"Link": '</workflows>; rel="collection"'}
+    )
+
+
 @app.get("/workflows")
+@cached(namespace="workflows", expire=300)
 async def list_workflows() -> Dict[str, Any]:
     """
     List all available workflow templates
@@ -130,13 +285,35 @@ async def list_workflows() -> Dict[str, Any]:
     }
 
 
-@app.get("/workflows/{workflow_name}")
-async def get_workflow_details(workflow_name: str) -> Dict[str, Any]:
+@cached(namespace="workflows", expire=300)
+async def workflow_details_json(workflow_name: str) -> bytes:
+    """get_workflow_details body, encoded once per cache lifetime"""
+    if not workflow_registry:
+        raise HTTPException(status_code=503, detail="Workflow registry not initialized")
+
+    info = workflow_registry.get_workflow_info(workflow_name)
+
+    if not info:
+        raise workflow_not_found(workflow_name)
+
+    return orjson.dumps({
+        "name": info["name"],
+        "description": info["description"],
+        "output": info["output"],
+        "parameters": info["parameters_by_category"],
+        "parameter_count": len(info["parameters"])
+    }, default=str, option=_JSON_OPTIONS)
+
+
+@app.get("/workflows/{workflow_name}", response_model=Dict[str, Any])
+async def get_workflow_details(workflow_name: str) -> Response:
     """
     Get detailed information about a specific workflow template
 
     Returns all overridable parameters grouped by category, output information,
-    and workflow metadata.
+    and workflow metadata. The parameter tree is the largest catalog payload,
+    so its encoded JSON is cached rather than the dict: cache hits send the
+    stored bytes without re-encoding.
 
     Args:
         workflow_name: Name of the workflow (e.g., "video_wan2_2_14B_i2v")
@@ -147,39 +324,18 @@ async def get_workflow_details(workflow_name: str) -> Dict[str, Any]:
     Raises:
         404: If workflow not found
     """
-    if not workflow_registry:
-        raise HTTPException(status_code=503, detail="Workflow registry not initialized")
-
-    info = workflow_registry.get_workflow_info(workflow_name)
-
-    if not info:
-        available = [w["name"] for w in workflow_registry.list_workflows()]
-        raise HTTPException(
-            status_code=404,
-            detail=f"Workflow '{workflow_name}' not found. Available workflows: {available}"
-        )
-
-    # Group parameters by category
-    params_by_category = {}
-    for param in info["parameters"]:
-        category = param.get("category", "other")
-        if category not in params_by_category:
-            params_by_category[category] = []
-        params_by_category[category].append(param)
-
-    return {
-        "name": info["name"],
-        "description": info["description"],
-        "output": info["output"],
-        "parameters": params_by_category,
-        "parameter_count": len(info["parameters"])
-    }
+    return Response(await workflow_details_json(workflow_name), media_type="application/json")
 
 
-@app.post("/workflows/{workflow_name}/execute")
+@app.post(
+    "/workflows/{workflow_name}/execute",
+    status_code=202,
+    openapi_extra=body_schema(TemplateExecuteRequest)
+)
 async def execute_workflow_template(
     workflow_name: str,
-    request: TemplateExecuteRequest
+    response: Response,
+    request: TemplateExecuteRequest = json_body(TemplateExecuteRequest)
 ) -> Dict[str, str]:
     """
     Execute a workflow template with parameter overrides
@@ -196,7 +352,8 @@ async def execute_workflow_template(
         request: Execution request with parameters and strategy
 
     Returns:
-        Dictionary with workflow_id and execution status
+        202 Accepted with workflow_id and execution status; the Location
+        header points at the workflow's status endpoint
 
     Raises:
         400: If invalid parameters provided
@@ -217,6 +374,9 @@ async def execute_workflow_template(
     if not workflow_registry:
         raise HTTPException(status_code=503, detail="Workflow registry not initialized")
 
+    if workflow_name not in workflow_registry.workflow_names:
+        raise workflow_not_found(workflow_name)
+
     try:
         # Apply parameter overrides to the workflow template
         workflow_json = workflow_registry.apply_overrides(
@@ -230,14 +390,10 @@ async def execute_workflow_template(
 
     except Exception as e:
         # Workflow not found or other error
-        available = [w["name"] for w in workflow_registry.list_workflows()]
-        raise HTTPException(
-            status_code=404,
-            detail=f"Workflow '{workflow_name}' not found. Available workflows: {available}"
-        )
+        raise workflow_not_found(workflow_name)
 
     # Generate unique workflow ID
-    workflow_id = f"workflow-{uuid.uuid4()}"
+    workflow_id = f"workflow-{uuid.uuid4().hex}"
 
     try:
         # Start Temporal workflow with modified workflow JSON
@@ -252,9 +408,9 @@ async def execute_workflow_template(
         )
 
         # Get output type for response
-        info = workflow_registry.get_workflow_info(workflow_name)
-        output_type = info["output"]["output_type"] if info and info["output"] else "unknown"
+        output_type = workflow_registry.output_types.get(workflow_name, "unknown")
 
+        response.headers["Location"] = f"/workflow/status/{workflow_id}"
         return {
             "workflow_id": workflow_id,
             "status": "started",
@@ -271,15 +427,16 @@ async def execute_workflow_template(
 # Raw Workflow Execution (Advanced Users)
 # ============================================================================
 
-@app.post("/workflow/execute")
-async def execute_workflow(request: ExecuteWorkflowRequest) -> Dict[str, str]:
+@app.post("/workflow/execute", status_code=202)
+async def execute_workflow(request: ExecuteWorkflowRequest, response: Response) -> Dict[str, str]:
     """
     Start workflow execution using Temporal
 
-    Returns workflow_id immediately. Workflow runs in background.
+    Returns 202 with the workflow_id immediately (Location: its status
+    endpoint). Workflow runs in background.
     """
     # Generate unique workflow ID
-    workflow_id = f"workflow-{uuid.uuid4()}"
+    workflow_id = f"workflow-{uuid.uuid4().hex}"
 
     try:
         # Start Temporal workflow
@@ -293,6 +450,7 @@ async def execute_workflow(request: ExecuteWorkflowRequest) -> Dict[str, str]:
             task_queue="comfyui-gpu-farm"
         )
 
+        response.headers["Location"] = f"/workflow/status/{workflow_id}"
         return {
             "workflow_id": workflow_id,
             "status": "started",
@@ -303,52 +461,125 @@ async def execute_workflow(request: ExecuteWorkflowRequest) -> Dict[str, str]:
         raise HTTPException(status_code=500, detail=f"Failed to start workflow: {str(e)}")
 
 
+async def query_workflow_status(workflow_id: str) -> WorkflowStatusResponse:
+    """Build a workflow's status from Temporal (status query, plus result once completed)"""
+    # Get workflow handle
+    handle = temporal_client.get_workflow_handle(workflow_id)
+
+    # Query current status
+    status_data = await handle.query("get_status")
+
+    # Fetch the result only once the workflow has completed; describe() is a
+    # single cheap RPC, whereas result() long-polls on a running workflow
+    # (and raises for failed/cancelled ones, which carry no result)
+    result = None
+    description = await handle.describe()
+    if description.status == WorkflowExecutionStatus.COMPLETED:
+        result = await handle.result()
+
+    # Build response
+    status_response = WorkflowStatusResponse(
+        workflow_id=workflow_id,
+        status=status_data.get("status", "unknown"),
+        server_address=status_data.get("server_address"),
+        prompt_id=status_data.get("prompt_id"),
+        current_node=status_data.get("current_node"),
+        progress=status_data.get("progress", 0.0),
+        error=status_data.get("error")
+    )
+
+    # If completed, add final results
+    # Note: result is a dict, not WorkflowExecutionResult object
+    if result:
+        status_response.status = result.get("status")
+        status_response.local_preview = result.get("local_preview", [])
+        status_response.log_file_path = result.get("log_file_path")
+        if result.get("error"):
+            status_response.error = result.get("error")
+
+    return status_response
+
+
+# Seconds clients should wait before retrying while Temporal is unavailable
+TEMPORAL_RETRY_AFTER_SECONDS = 5
+
+
+# Temporal errors temporal_rpc_error() maps to an HTTP error
+TEMPORAL_CLIENT_ERRORS = (RPCError, WorkflowQueryFailedError, WorkflowQueryRejectedError)
+
+
+def temporal_rpc_error(e: Exception, workflow_id: str) -> HTTPException:
+    """
+    HTTP error for a failed Temporal RPC or workflow query
+
+    NOT_FOUND means the workflow does not exist (404). A rejected query means
+    the workflow is closed in a state that no longer answers queries (409); a
+    failed query means its query handler raised (502). Any other RPC error is
+    Temporal being unavailable or overloaded (503 + Retry-After) so clients
+    back off instead of treating it as a missing workflow. Other exceptions
+    are left to propagate as 500s.
+    """
+    if isinstance(e, WorkflowQueryRejectedError):
+        return HTTPException(
+            status_code=409,
+            detail=f"Workflow '{workflow_id}' does not accept queries in status {e.status.name if e.status else 'unknown'}"
+        )
+    if isinstance(e, WorkflowQueryFailedError):
+        return HTTPException(status_code=502, detail=f"Workflow status query failed: {e.message}")
+    if e.status == RPCStatusCode.NOT_FOUND:
+        return HTTPException(status_code=404, detail=f"Workflow '{workflow_id}' not found")
+    return HTTPException(
+        status_code=503,
+        detail=f"Temporal unavailable: {e.message}",
+        headers={"Retry-After": str(TEMPORAL_RETRY_AFTER_SECONDS)}
+    )
+
+
+# Status lookups currently running, by workflow ID (single-flight)
+_status_inflight: Dict[str, asyncio.Task] = {}
+
+
+def coalesced_workflow_status(workflow_id: str) -> "asyncio.Future[WorkflowStatusResponse]":
+    """
+    Share one Temporal lookup between concurrent polls of the same workflow
+
+    The first caller starts the lookup; callers arriving while it runs await
+    the same task. Each caller awaits it through shield(), so a client
+    disconnecting does not cancel the lookup for the others.
+    """
+    task = _status_inflight.get(workflow_id)
+    if task is None:
+        task = asyncio.create_task(query_workflow_status(workflow_id))
+        _status_inflight[workflow_id] = task
+        task.add_done_callback(lambda _: _status_inflight.pop(workflow_id, None))
+    return asyncio.shield(task)
+
+
 @app.get("/workflow/status/{workflow_id}")
-async def get_workflow_status(workflow_id: str) -> WorkflowStatusResponse:
+async def get_workflow_status(
+    workflow_id: str,
+    request: Request,
+    response: Response
+) -> WorkflowStatusResponse:
     """
     Get current workflow status by querying Temporal
 
     This uses Temporal queries to get real-time state from running workflow.
+    Concurrent polls for the same workflow share a single lookup. Responses
+    carry an ETag; a poll whose If-None-Match still matches gets an empty 304.
     """
     try:
-        # Get workflow handle
-        handle = temporal_client.get_workflow_handle(workflow_id)
-
-        # Query current status
-        status_data = await handle.query("get_status")
-
-        # Try to get result if completed
-        result = None
-        try:
-            result = await handle.result()
-        except:
-            # Workflow still running
-            pass
-
-        # Build response
-        response = WorkflowStatusResponse(
-            workflow_id=workflow_id,
-            status=status_data.get("status", "unknown"),
-            server_address=status_data.get("server_address"),
-            prompt_id=status_data.get("prompt_id"),
-            current_node=status_data.get("current_node"),
-            progress=status_data.get("progress", 0.0),
-            error=status_data.get("error")
-        )
+        status_response = await coalesced_workflow_status(workflow_id)
 
-        # If completed, add final results
-        # Note: result is a dict, not WorkflowExecutionResult object
-        if result:
-            response.status = result.get("status")
-            response.local_preview = result.get("local_preview", [])
-            response.log_file_path = result.get("log_file_path")
-            if result.get("error"):
-                response.error = result.get("error")
+        etag = json_etag(status_response.model_dump())
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
 
-        return response
+        response.headers["ETag"] = etag
+        return status_response
 
-    except Exception as e:
-        raise HTTPException(status_code=404, detail=f"Workflow not found: {str(e)}")
+    except TEMPORAL_CLIENT_ERRORS as e:
+        raise temporal_rpc_error(e, workflow_id)
 
 
 @app.post("/workflow/cancel/{workflow_id}")
@@ -366,22 +597,42 @@ async def cancel_workflow(workflow_id: str) -> Dict[str, str]:
             "message": "Cancel signal sent to workflow"
         }
 
-    except Exception as e:
-        raise HTTPException(status_code=404, detail=f"Failed to cancel workflow: {str(e)}")
+    except RPCError as e:
+        raise temporal_rpc_error(e, workflow_id)
+
+
+# Stored images get a unique filename per download and are never rewritten,
+# so browsers/CDNs may keep them forever without revalidating
+IMAGE_CACHE_CONTROL = "public, max-age=31536000, immutable"
 
 
 @app.get("/images/{filename}")
-async def serve_image(filename: str):
-    """Serve a stored image"""
+async def serve_image(filename: str, request: Request):
+    """
+    Serve a stored image
+
+    Sent with FileResponse (streamed from disk / sendfile, never loaded into
+    memory) and cacheable for a year. The ETag is derived from the file's
+    mtime and size; a matching If-None-Match gets a 304 with no body.
+    """
     image_path = image_storage.get_image_path(filename)
 
     if not image_path:
         raise HTTPException(status_code=404, detail="Image not found")
 
-    return StreamingResponse(
-        iter([image_path.read_bytes()]),
+    stat = image_path.stat()
+    etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    headers = {"ETag": etag, "Cache-Control": IMAGE_CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    return FileResponse(
+        image_path,
         media_type="image/png",
-        headers={"Content-Disposition": f"inline; filename={filename}"}
+        filename=filename,
+        content_disposition_type="inline",
+        stat_result=stat,
+        headers=headers,
     )
 
 
@@ -390,35 +641,41 @@ async def serve_image(filename: str):
 async def register_server(server: ComfyUIServer):
     """Register a new ComfyUI server"""
     try:
-        success = load_balancer.register_server(
-            name=server.name,
-            address=server.address,
-            description=server.description
-        )
+        # Registration probes the server once (blocking HTTP)
+        await asyncio.to_thread(load_balancer.register_server, server.address)
+        response_cache.clear(namespace="workflows")
 
-        if success:
-            return {"status": "registered", "server": server.address}
-        else:
-            raise HTTPException(status_code=400, detail="Failed to register server")
+        # Include the new server in the health snapshot straight away
+        await refresh_server_health()
+        return {"status": "registered", "server": server.address}
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/servers")
-async def list_servers():
+async def list_servers() -> Dict[str, Any]:
     """List all registered servers"""
-    return {"servers": load_balancer.list_servers()}
+    servers = list(load_balancer.servers)
+    return {"servers": servers, "count": len(servers)}
 
 
 @app.get("/servers/health")
-async def get_servers_health():
-    """Get health status of all servers"""
-    return load_balancer.get_servers_health()
+async def get_servers_health(request: Request) -> Dict[str, Any]:
+    """
+    Get health status of all servers
+
+    Served from the background snapshot (at most
+    HEALTH_REFRESH_INTERVAL_SECONDS old); send Cache-Control: no-cache to
+    probe the servers now instead.
+    """
+    if _health_snapshot is None or "no-cache" in request.headers.get("cache-control", ""):
+        return await refresh_server_health()
+    return _health_snapshot
 
 
 @app.get("/health")
-async def health_check():
+async def health_check() -> Dict[str, Any]:
     """Gateway health check"""
     return {
         "status": "healthy",
@@ -431,8 +688,50 @@ async def health_check():
 # Chain Execution Endpoints
 # ============================================================================
 
+CHAINS_DIR = Path("chains")
+
+# Parsed chain summaries, reused until a chain file is added, removed or edited
+_chains_cache: Dict[str, Any] = {"signature": None, "data": None}
+
+
+def _chains_signature() -> Tuple:
+    """Modification times of the chains directory and every chain file (stat only, no parsing)"""
+    if not CHAINS_DIR.exists():
+        return ()
+    chain_files = list(CHAINS_DIR.glob("**/*.yaml")) + list(CHAINS_DIR.glob("**/*.yml"))
+    return (CHAINS_DIR.stat().st_mtime_ns,) + tuple(
+        sorted((str(f), f.stat().st_mtime_ns) for f in chain_files)
+    )
+
+
+def get_discovered_chains() -> List[Dict[str, Any]]:
+    """discover_chains() result, rescanned only when the chain files change"""
+    signature = _chains_signature()
+    if signature != _chains_cache["signature"]:
+        _chains_cache["data"] = discover_chains(CHAINS_DIR)
+        _chains_cache["signature"] = signature
+    return _chains_cache["data"]
+
+
+@lru_cache(maxsize=128)
+def _load_chain_and_plan(chain_path: str, mtime_ns: int):
+    """Parse a chain file and build its plan; cached per (path, mtime)"""
+    chain = load_chain(chain_path)
+    return chain, create_execution_plan(chain)
+
+
+def load_chain_and_plan(chain_name: str) -> Optional[Tuple]:
+    """(chain, plan) for a chain name, or None if the chain file does not exist"""
+    chain_path = CHAINS_DIR / f"{chain_name}.yaml"
+    try:
+        mtime_ns = chain_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _load_chain_and_plan(str(chain_path), mtime_ns)
+
+
 @app.get("/chains")
-async def list_chains():
+async def list_chains() -> Dict[str, Any]:
     """
     List all available workflow chains
 
@@ -440,7 +739,7 @@ async def list_chains():
         List of chain summaries with name, description, and step count
     """
     try:
-        chains = discover_chains("chains/")
+        chains = await asyncio.to_thread(get_discovered_chains)
         return {"chains": chains, "count": len(chains)}
 
     except Exception as e:
@@ -448,20 +747,19 @@ async def list_chains():
 
 
 @app.get("/chains/{chain_name}")
-async def get_chain_details(chain_name: str):
+async def get_chain_details(chain_name: str) -> Dict[str, Any]:
     """
     Get detailed information about a specific chain
 
     Returns chain structure, execution plan, and parallel groups
     """
     try:
-        # Load chain
-        chain_path = Path("chains") / f"{chain_name}.yaml"
-        if not chain_path.exists():
+        # Load chain (parsed once per file version; stat/parse off the event loop)
+        loaded = await asyncio.to_thread(load_chain_and_plan, chain_name)
+        if not loaded:
             raise HTTPException(status_code=404, detail=f"Chain '{chain_name}' not found")
 
-        chain = load_chain(chain_path)
-        plan = create_execution_plan(chain)
+        chain, plan = loaded
 
         return {
             "name": chain.name,
@@ -496,21 +794,29 @@ class ChainExecutionRequest(BaseModel):
     parameters: Dict[str, Any] = {}
 
 
-@app.post("/chains/{chain_name}/execute")
-async def execute_chain(chain_name: str, request: ChainExecutionRequest):
+@app.post(
+    "/chains/{chain_name}/execute",
+    status_code=202,
+    openapi_extra=body_schema(ChainExecutionRequest)
+)
+async def execute_chain(
+    chain_name: str,
+    response: Response,
+    request: ChainExecutionRequest = json_body(ChainExecutionRequest)
+):
     """
     Execute a workflow chain
 
-    Returns workflow_id for tracking the chain execution
+    Returns 202 with the workflow_id for tracking the chain execution
+    (Location: the chain's status endpoint)
     """
     try:
-        # Load chain
-        chain_path = Path("chains") / f"{chain_name}.yaml"
-        if not chain_path.exists():
+        # Load chain (parsed once per file version; stat/parse off the event loop)
+        loaded = await asyncio.to_thread(load_chain_and_plan, chain_name)
+        if not loaded:
             raise HTTPException(status_code=404, detail=f"Chain '{chain_name}' not found")
 
-        chain = load_chain(chain_path)
-        plan = create_execution_plan(chain)
+        chain, plan = loaded
 
         # Execute via chain engine
         workflow_id = await chain_engine.execute_chain(
@@ -518,6 +824,7 @@ async def execute_chain(chain_name: str, request: ChainExecutionRequest):
             initial_parameters=request.parameters
         )
 
+        response.headers["Location"] = f"/chains/status/{workflow_id}"
         return {
             "workflow_id": workflow_id,
             "chain_name": chain.name,
@@ -534,14 +841,25 @@ async def execute_chain(chain_name: str, request: ChainExecutionRequest):
 
 
 @app.get("/chains/status/{workflow_id}")
-async def get_chain_status(workflow_id: str):
+async def get_chain_status(
+    workflow_id: str,
+    request: Request,
+    response: Response
+) -> Dict[str, Any]:
     """
     Get current status of a running chain
 
-    Returns current level, completed steps, and step statuses
+    Returns current level, completed steps, and step statuses. Responses
+    carry an ETag; a poll whose If-None-Match still matches gets an empty 304.
     """
     try:
         status = await chain_engine.get_chain_status(workflow_id)
+
+        etag = json_etag(status)
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
+        response.headers["ETag"] = etag
         return status
 
     except Exception as e:
@@ -549,7 +867,7 @@ async def get_chain_status(workflow_id: str):
 
 
 @app.get("/chains/result/{workflow_id}")
-async def get_chain_result(workflow_id: str):
+async def get_chain_result(workflow_id: str) -> Dict[str, Any]:
     """
     Wait for chain to complete and get final result
 
@@ -559,26 +877,22 @@ async def get_chain_result(workflow_id: str):
         result = await chain_engine.get_chain_result(workflow_id)
         # Result is already a dict from Temporal
 
-        # Process step results
+        # Process step results and split successful/failed steps in one pass
         step_results_processed = {}
+        successful_steps, failed_steps = [], []
         for step_id, step_result in result.get("step_results", {}).items():
+            status = step_result.get("status")
             step_results_processed[step_id] = {
-                "status": step_result.get("status"),
+                "status": status,
                 "workflow": step_result.get("workflow"),
                 "output": step_result.get("output"),
                 "parameters": step_result.get("parameters"),
                 "error": step_result.get("error")
             }
-
-        # Calculate successful/failed steps
-        successful_steps = [
-            step_id for step_id, sr in result.get("step_results", {}).items()
-            if sr.get("status") == "completed"
-        ]
-        failed_steps = [
-            step_id for step_id, sr in result.get("step_results", {}).items()
-            if sr.get("status") == "failed"
-        ]
+            if status == "completed":
+                successful_steps.append(step_id)
+            elif status == "failed":
+                failed_steps.append(step_id)
 
         return {
             "chain_name": result.get("chain_name"),
@@ -595,4 +909,20 @@ async def get_chain_result(workflow_id: str):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001, log_level="info")
+
+    # uvloop/httptools ship with uvicorn[standard]; multiple workers need the
+    # app as an import string. Defaults to a single worker: the server
+    # registry (load_balancer), the health loop and the caches live in the
+    # process, and startup runs init_db/optimize_db. With GATEWAY_WORKERS > 1
+    # each worker has its own server list, probes every server itself and
+    # migrates the same database concurrently.
+    uvicorn.run(
+        "temporal_gateway.main:app",
+        host="0.0.0.0",
+        port=8001,
+        log_level="info",
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("GATEWAY_WORKERS", "1")),
+        proxy_headers=True
+    )
@@ -0,0 +1,77 @@
+"""
+In-process response cache for read-heavy gateway endpoints
+
+Catalog endpoints (workflow templates, chains) serve data that only changes
+when templates are rediscovered or servers are registered, yet clients poll
+them constantly. Responses are cached per namespace with a TTL and the write
+paths clear the affected namespace.
+
+Usage:
+    @app.get("/workflows/{workflow_name}")
+    @cached(namespace="workflows", expire=300)
+    async def get_workflow_details(workflow_name: str):
+        ...
+
+    response_cache.clear(namespace="workflows")
+"""
+
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class ResponseCache:
+    """Namespaced TTL cache (namespace -> key -> (expires_at, value))"""
+
+    def __init__(self):
+        self._entries: Dict[str, Dict[Hashable, Tuple[float, Any]]] = {}
+
+    def get(self, namespace: str, key: Hashable) -> Tuple[bool, Any]:
+        """Return (hit, value) for a key, dropping it if expired"""
+        entries = self._entries.get(namespace)
+        if not entries or key not in entries:
+            return False, None
+
+        expires_at, value = entries[key]
+        if expires_at < time.monotonic():
+            del entries[key]
+            return False, None
+        return True, value
+
+    def set(self, namespace: str, key: Hashable, value: Any, expire: float) -> None:
+        """Store a value for `expire` seconds"""
+        self._entries.setdefault(namespace, {})[key] = (time.monotonic() + expire, value)
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """Drop one namespace, or everything when namespace is None"""
+        if namespace is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(namespace, None)
+
+
+# Global cache shared by all endpoints
+response_cache = ResponseCache()
+
+
+def cached(namespace: str, expire: float = 300) -> Callable:
+    """
+    Cache an async endpoint's return value keyed on its path/query arguments
+
+    Only successful results are cached; raised exceptions (404s etc.) are not.
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            hit, value = response_cache.get(namespace, key)
+            if hit:
+                return value
+
+            value = await func(*args, **kwargs)
+            response_cache.set(namespace, key, value, expire)
+            return value
+
+        return wrapper
+
+    return decorator
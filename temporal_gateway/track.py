@@ -12,17 +12,18 @@ Key features:
 """
 
 import asyncio
-import threading
+import contextvars
+import inspect
 import time
 import logging
-from typing import Dict, Any, Optional, Set, Callable
-from pathlib import Path
-import sys
+from typing import Dict, Any, Optional, Set, Callable, Tuple
+from dataclasses import dataclass
 
-# Add parent to path
-sys.path.append(str(Path(__file__).parent.parent))
+import orjson
+import websockets
 
 from gateway.core import ComfyUIClient
+from temporal_gateway.clients.comfy.http import ComfyHTTPClient
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -40,6 +41,263 @@ DEFAULT_TRACKED_MESSAGES = {
     'status'
 }
 
+# Frequent message types no tracker uses, matched against the head of the raw
+# frame (ComfyUI sends {"type": ..., "data": ...}) so they are dropped before
+# JSON parsing
+SKIPPED_FRAME_TYPES = (b'"crystools.monitor"',)
+
+# Seconds between heartbeat checks while waiting for completion; a heartbeat
+# is only sent when the node/progress changed (at most HEARTBEAT_BURST per
+# HEARTBEAT_BURST_INTERVAL seconds) or nothing was sent for HEARTBEAT_MAX_SILENCE
+HEARTBEAT_INTERVAL = 1
+HEARTBEAT_MAX_SILENCE = 30
+HEARTBEAT_BURST = 5
+HEARTBEAT_BURST_INTERVAL = 10
+
+# Heartbeats from all trackers on an event loop are queued and delivered by
+# one consumer task, so a slow callback (DB write, Temporal call) never stalls
+# a tracker; when the queue is full new heartbeats are dropped
+HEARTBEAT_QUEUE_SIZE = 1024
+HEARTBEAT_CALLBACK_TIMEOUT = 2.0
+
+# A hub whose socket drops while trackers are subscribed reconnects up to
+# WS_RECONNECT_ATTEMPTS times (backing off up to WS_RECONNECT_MAX_DELAY
+# seconds), then fails the remaining trackers
+WS_RECONNECT_ATTEMPTS = 5
+WS_RECONNECT_MAX_DELAY = 10
+
+# Event loop -> (heartbeat queue, consumer task); an asyncio.Queue is bound
+# to the loop it is first used on, so each loop gets its own
+_heartbeat_queues: Dict[asyncio.AbstractEventLoop, Tuple[asyncio.Queue, asyncio.Task]] = {}
+
+
+async def _consume_heartbeats(queue: asyncio.Queue) -> None:
+    """Deliver queued heartbeats; async callbacks get HEARTBEAT_CALLBACK_TIMEOUT seconds"""
+    while True:
+        context, callback, data = await queue.get()
+        try:
+            # Run in the context captured when the heartbeat was queued, so
+            # context-bound callbacks (activity.heartbeat) reach the tracker's
+            # own activity rather than whichever one started the consumer
+            result = context.run(callback, data)
+            if inspect.isawaitable(result):
+                await asyncio.wait_for(
+                    context.run(asyncio.ensure_future, result),
+                    timeout=HEARTBEAT_CALLBACK_TIMEOUT,
+                )
+        except asyncio.TimeoutError:
+            logger.warning(f"Heartbeat callback timed out after {HEARTBEAT_CALLBACK_TIMEOUT}s")
+        except Exception as e:
+            # Don't fail on heartbeat errors
+            logger.warning(f"Heartbeat callback failed: {e}")
+
+
+class TokenBucket:
+    """Allows `max_tokens` events per `refill_interval` seconds, refilled continuously"""
+
+    def __init__(self, max_tokens: int, refill_interval: float):
+        self.max_tokens = max_tokens
+        self.refill_rate = max_tokens / refill_interval
+        self.tokens = float(max_tokens)
+        self._updated = time.monotonic()
+
+    def take(self) -> bool:
+        """Consume a token if one is available"""
+        now = time.monotonic()
+        self.tokens = min(self.max_tokens, self.tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+def _queue_heartbeat(callback: Callable, data: Dict[str, Any]) -> None:
+    """Enqueue a heartbeat (O(1)), starting this loop's consumer task on first use"""
+    loop = asyncio.get_running_loop()
+    entry = _heartbeat_queues.get(loop)
+    if entry is None or entry[1].done():
+        # Forget consumers of loops that have since closed
+        for old_loop in [other for other in _heartbeat_queues if other.is_closed()]:
+            del _heartbeat_queues[old_loop]
+        queue = asyncio.Queue(maxsize=HEARTBEAT_QUEUE_SIZE)
+        entry = _heartbeat_queues[loop] = (queue, loop.create_task(_consume_heartbeats(queue)))
+    try:
+        entry[0].put_nowait((contextvars.copy_context(), callback, data))
+    except asyncio.QueueFull:
+        logger.debug("Heartbeat queue full, dropping heartbeat")
+
+
+class ComfyWSHub:
+    """
+    One ComfyUI WebSocket shared by every tracker using the same URL
+
+    ComfyUI tags execution messages with their prompt_id, so a single
+    connection per (server, client_id) can serve all prompts queued under
+    that client_id: each frame is parsed once and handed to the tracker
+    for its prompt. Messages without a prompt_id (e.g. 'status') go to
+    every tracker. The connection opens with the first subscriber and
+    closes when the last one leaves; if it drops in between it is
+    reopened, and trackers are failed if that keeps failing.
+
+    Example:
+        hub = ComfyWSHub.for_url(client.ws_url)
+        await hub.subscribe(tracker)
+        ...
+        await hub.unsubscribe(tracker)
+    """
+
+    _hubs: Dict[str, "ComfyWSHub"] = {}
+
+    @classmethod
+    def for_url(cls, ws_url: str) -> "ComfyWSHub":
+        """Get (or create) the hub for a WebSocket URL"""
+        hub = cls._hubs.get(ws_url)
+        if hub is None:
+            hub = cls._hubs[ws_url] = cls(ws_url)
+        return hub
+
+    def __init__(self, ws_url: str):
+        self.ws_url = ws_url
+        self.trackers: Dict[str, "WorkflowTracker"] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._ready = asyncio.Event()
+        self._error = None
+
+    async def subscribe(self, tracker: "WorkflowTracker") -> None:
+        """
+        Route a tracker's messages to it, connecting first if needed
+
+        Raises:
+            Exception: If the connection fails or is not open within 10 seconds
+        """
+        self.trackers[tracker.prompt_id] = tracker
+
+        if self._task is None:
+            logger.info(f"Connecting to WebSocket: {self.ws_url}")
+            self._error = None
+            self._task = asyncio.create_task(self._reader())
+
+        if self._ready.is_set():
+            return
+
+        # Returns as soon as the socket is open, or the reader gives up early
+        ready = asyncio.create_task(self._ready.wait())
+        await asyncio.wait({ready, self._task}, timeout=10, return_when=asyncio.FIRST_COMPLETED)
+
+        if not self._ready.is_set():
+            ready.cancel()
+            await self.unsubscribe(tracker)
+            if self._error:
+                raise Exception(f"WebSocket failed to connect: {self._error}")
+            raise Exception("WebSocket failed to connect within 10 seconds")
+
+    async def unsubscribe(self, tracker: "WorkflowTracker") -> None:
+        """Stop routing to a tracker; closes the connection once none are left"""
+        if self.trackers.get(tracker.prompt_id) is tracker:
+            del self.trackers[tracker.prompt_id]
+
+        if not self.trackers and self._task:
+            logger.info("Closing WebSocket connection")
+            task, self._task = self._task, None
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _reader(self) -> None:
+        """
+        Read frames until the task is cancelled (last subscriber left)
+
+        A failed first connect ends the task (subscribe() reports it). A
+        connection lost later is reopened while trackers remain; messages
+        missed in between are recovered from each tracker's history.
+        """
+        connected = False
+        attempts = 0
+        try:
+            while True:
+                try:
+                    # ComfyUI's frames are small JSON objects; permessage-deflate would
+                    # cost an inflate per frame (including the ones filtered out)
+                    async with websockets.connect(self.ws_url, max_queue=64, compression=None) as ws:
+                        logger.info("✓ WebSocket connected")
+                        self._ready.set()
+                        if connected:
+                            await asyncio.gather(*(
+                                tracker._resync() for tracker in list(self.trackers.values())
+                            ))
+                        connected = True
+                        attempts = 0
+
+                        while True:
+                            # Frames are taken as raw bytes (no UTF-8 decode) and parsed
+                            # by orjson; binary preview-image frames start with a 4-byte
+                            # event type rather than a JSON object, so they are skipped
+                            raw = await ws.recv(decode=False)
+                            if not raw.startswith(b"{"):
+                                continue
+                            head = raw[:64]
+                            if any(frame_type in head for frame_type in SKIPPED_FRAME_TYPES):
+                                continue
+                            try:
+                                message = orjson.loads(raw)
+                            except orjson.JSONDecodeError as e:
+                                logger.warning(f"Skipping malformed WebSocket message: {e}")
+                                continue
+                            self._dispatch(message)
+
+                except websockets.exceptions.ConnectionClosed as e:
+                    logger.info(f"WebSocket closed: code={e.code}, msg={e.reason}")
+                    self._error = e
+
+                except Exception as e:
+                    logger.error(f"✗ WebSocket error: {e}")
+                    self._error = e
+
+                self._ready.clear()
+                if not connected or not self.trackers:
+                    return
+
+                attempts += 1
+                if attempts > WS_RECONNECT_ATTEMPTS:
+                    logger.error(f"✗ WebSocket lost, giving up after {WS_RECONNECT_ATTEMPTS} reconnect attempts")
+                    for tracker in list(self.trackers.values()):
+                        tracker._fail_connection_lost(self._error)
+                    return
+
+                delay = min(2 ** (attempts - 1), WS_RECONNECT_MAX_DELAY)
+                logger.info(f"Reconnecting WebSocket in {delay}s (attempt {attempts}/{WS_RECONNECT_ATTEMPTS})")
+                await asyncio.sleep(delay)
+
+        finally:
+            # Next subscriber reconnects
+            self._ready.clear()
+            if self._task is asyncio.current_task():
+                self._task = None
+
+    def _dispatch(self, message: Dict[str, Any]) -> None:
+        """Hand a message to the tracker for its prompt (or to all, if untagged)"""
+        data = message.get('data')
+        prompt_id = data.get('prompt_id') if isinstance(data, dict) else None
+
+        if prompt_id:
+            tracker = self.trackers.get(prompt_id)
+            if tracker:
+                tracker._handle_message(message)
+        else:
+            for tracker in list(self.trackers.values()):
+                tracker._handle_message(message)
+
+
+@dataclass(slots=True)
+class TrackResult:
+    """Final outcome of a tracked workflow"""
+    status: str
+    history: Dict[str, Any]
+    error: Optional[Dict[str, Any]]
+
 
 class WorkflowTracker:
     """
@@ -64,6 +322,13 @@ class WorkflowTracker:
         )
     """
 
+    # Fixed attribute layout: no per-instance __dict__ (many trackers run at once)
+    __slots__ = (
+        'prompt_id', 'server_address', 'client_id', 'timeout', 'tracked_message_types',
+        'client', 'http', 'completed', 'error_occurred', 'error_data', 'current_node',
+        'progress', '_last_log_progress', '_hub', '_start_ns', '_handlers',
+    )
+
     def __init__(
         self,
         prompt_id: str,
@@ -91,11 +356,12 @@ class WorkflowTracker:
         # Configure which message types to track
         self.tracked_message_types = tracked_message_types or DEFAULT_TRACKED_MESSAGES
 
-        # Create ComfyUI client
+        # Create ComfyUI client (URLs), plus async HTTP on the shared connection pool
         self.client = ComfyUIClient(
             server_address=server_address,
             client_id=client_id
         )
+        self.http = ComfyHTTPClient(self.client.http_url)
 
         # Execution state
         self.completed = asyncio.Event()
@@ -103,20 +369,30 @@ class WorkflowTracker:
         self.error_data = None
         self.current_node = None
         self.progress = 0.0
-
-        # WebSocket management
-        self._ws = None
-        self._ws_thread = None
-        self._ws_connected = threading.Event()
-        self._ws_error = None
-
-        # Track start time
-        self._start_time = None
+        self._last_log_progress = -1.0
+
+        # WebSocket shared with other trackers on the same server/client_id
+        self._hub = ComfyWSHub.for_url(self.client.ws_url)
+
+        # Track start time (monotonic, so elapsed times survive clock adjustments)
+        self._start_ns = None
+
+        # Message type -> handler, built once for the per-message dispatch
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], None]] = {
+            'executing': self._handle_executing,
+            'executed': self._handle_executed,
+            'progress': self._handle_progress,
+            'execution_start': self._handle_execution_start,
+            'execution_cached': self._handle_execution_cached,
+            'execution_error': self._handle_execution_error,
+            'execution_interrupted': self._handle_execution_interrupted,
+            'status': self._handle_status,
+        }
 
     async def track(
         self,
-        heartbeat_callback: Optional[Callable[[Dict[str, Any]], None]] = None
-    ) -> Dict[str, Any]:
+        heartbeat_callback: Optional[Callable[[Dict[str, Any]], Any]] = None
+    ) -> TrackResult:
         """
         Track workflow execution until completion
 
@@ -129,18 +405,17 @@ class WorkflowTracker:
         Args:
             heartbeat_callback: Optional callback for sending heartbeats
                                 Called periodically with current state
+                                (sync or async; delivered off the tracker's path)
 
         Returns:
-            {
-                "status": "completed" | "failed",
-                "history": {...},  # ComfyUI history data
-                "error": {...} | None
-            }
+            TrackResult with status "completed" | "failed", the ComfyUI
+            history data and the error payload (None on success).
+            Use dataclasses.asdict() where a plain dict is needed.
 
         Raises:
             Exception: If WebSocket fails to connect or timeout occurs
         """
-        self._start_time = time.time()
+        self._start_ns = time.monotonic_ns()
         logger.info(f"Starting workflow tracking for prompt_id: {self.prompt_id}")
         logger.info(f"Tracking message types: {self.tracked_message_types}")
 
@@ -151,14 +426,14 @@ class WorkflowTracker:
             return early_result
 
         # Step 2: Connect to WebSocket
-        self._connect_websocket()
+        await self._connect_websocket()
 
         try:
             # Step 3: Wait for completion with heartbeats
             await self._wait_for_completion(heartbeat_callback)
 
             # Step 4: Get final history from ComfyUI
-            history = self.client.get_history(self.prompt_id)
+            history = await self.http.get_history(self.prompt_id)
             history_data = history.get(self.prompt_id, {})
 
             # Step 5: Build and return result
@@ -166,83 +441,43 @@ class WorkflowTracker:
 
         finally:
             # Always close WebSocket
-            self._close_websocket()
-            elapsed = time.time() - self._start_time
-            logger.info(f"Tracking completed in {elapsed:.2f}s")
+            await self._close_websocket()
+            logger.info(f"Tracking completed in {self._elapsed():.2f}s")
 
-    def _should_process_message(self, message: Dict[str, Any]) -> bool:
+    def _handle_message(self, message: Dict[str, Any]) -> None:
         """
-        Check if a message should be processed based on filters
+        Process a WebSocket message from ComfyUI
+
+        This is invoked by the WebSocket hub for each message.
+        It filters and routes messages to specific handlers.
 
-        Filters:
-        1. Skip monitoring messages (always)
-        2. Filter by message type (configurable)
-        3. Filter by prompt_id (always)
+        Filters (inlined: this runs for every frame):
+        1. Filter by message type (configurable; also drops noisy
+           monitoring messages such as crystools.monitor)
+        2. Filter by prompt_id (always)
 
         Args:
             message: WebSocket message from ComfyUI
-
-        Returns:
-            True if message should be processed, False otherwise
         """
+        # Filter by message type (configurable) - a single set lookup
         msg_type = message.get('type')
-        data = message.get('data', {})
-
-        # Always skip monitoring messages (noisy)
-        if msg_type == 'crystools.monitor':
-            return False
-
-        # Filter by message type (configurable)
         if msg_type not in self.tracked_message_types:
-            logger.debug(f"Skipping untracked message type: {msg_type}")
-            return False
+            return
 
         # Filter by prompt_id - only process messages for OUR prompt
+        data = message.get('data', {})
         msg_prompt_id = data.get('prompt_id')
         if msg_prompt_id and msg_prompt_id != self.prompt_id:
-            logger.debug(f"Skipping message for different prompt_id: {msg_prompt_id}")
-            return False
-
-        return True
-
-    def _handle_message(self, message: Dict[str, Any]) -> None:
-        """
-        Process a WebSocket message from ComfyUI
-
-        This is the callback invoked by the WebSocket client for each message.
-        It filters and routes messages to specific handlers.
-
-        Args:
-            message: WebSocket message from ComfyUI
-        """
-        # Apply filters
-        if not self._should_process_message(message):
             return
 
-        msg_type = message.get('type')
-        data = message.get('data', {})
-
-        logger.info(f"[WS] Processing: {msg_type}")
+        logger.info("[WS] Processing: %s", msg_type)
 
         # Route to specific handler based on message type
-        if msg_type == 'executing':
-            self._handle_executing(data)
-        elif msg_type == 'executed':
-            self._handle_executed(data)
-        elif msg_type == 'progress':
-            self._handle_progress(data)
-        elif msg_type == 'execution_start':
-            self._handle_execution_start(data)
-        elif msg_type == 'execution_cached':
-            self._handle_execution_cached(data)
-        elif msg_type == 'execution_error':
-            self._handle_execution_error(data)
-        elif msg_type == 'execution_interrupted':
-            self._handle_execution_interrupted(data)
-        elif msg_type == 'status':
-            self._handle_status(data)
+        handler = self._handlers.get(msg_type)
+        if handler:
+            handler(data)
         else:
-            logger.warning(f"No handler for message type: {msg_type}")
+            logger.warning("No handler for message type: %s", msg_type)
 
     # ========================================================================
     # Message Handlers - Each handles a specific message type
@@ -258,19 +493,24 @@ class WorkflowTracker:
         else:
             # Node execution started
             self.current_node = node
-            logger.info(f"→ Executing node: {node}")
+            logger.info("→ Executing node: %s", node)
 
     def _handle_executed(self, data: Dict[str, Any]) -> None:
         """Handle 'executed' message - node finished successfully"""
         node = data.get('node')
-        logger.info(f"✓ Node completed: {node}")
+        logger.info("✓ Node completed: %s", node)
 
     def _handle_progress(self, data: Dict[str, Any]) -> None:
         """Handle 'progress' message - update progress percentage"""
         value = data.get('value', 0)
         max_val = data.get('max', 100)
-        self.progress = (value / max_val) if max_val > 0 else 0
-        logger.info(f"Progress: {value}/{max_val} ({self.progress*100:.1f}%)")
+        progress = self.progress = (value / max_val) if max_val > 0 else 0
+
+        # Log in 10% steps (progress restarts for each sampler node)
+        last = self._last_log_progress
+        if progress - last >= 0.1 or progress >= 1.0 or progress < last:
+            self._last_log_progress = progress
+            logger.info("Progress: %s/%s (%.1f%%)", value, max_val, progress * 100)
 
     def _handle_execution_start(self, data: Dict[str, Any]) -> None:
         """Handle 'execution_start' message - workflow started"""
@@ -279,7 +519,7 @@ class WorkflowTracker:
     def _handle_execution_cached(self, data: Dict[str, Any]) -> None:
         """Handle 'execution_cached' message - nodes loaded from cache"""
         nodes = data.get('nodes', [])
-        logger.info(f"⚡ {len(nodes)} node(s) cached")
+        logger.info("⚡ %d node(s) cached", len(nodes))
 
     def _handle_execution_error(self, data: Dict[str, Any]) -> None:
         """Handle 'execution_error' message - workflow failed"""
@@ -304,74 +544,58 @@ class WorkflowTracker:
     def _handle_status(self, data: Dict[str, Any]) -> None:
         """Handle 'status' message - ComfyUI status update"""
         status_info = data.get('status', {})
-        logger.info(f"Status update: {status_info}")
+        logger.info("Status update: %s", status_info)
+
+    def _fail_connection_lost(self, error: Optional[Exception]) -> None:
+        """Called by the hub when the WebSocket is lost for good - fail tracking"""
+        if self.completed.is_set():
+            return
+        logger.error(f"✗ WebSocket lost while tracking: {error}")
+
+        self.error_occurred = True
+        self.error_data = {"message": "WebSocket connection lost", "error": str(error)}
+        self.completed.set()
+
+    async def _resync(self) -> None:
+        """
+        Called by the hub after a reconnect - catch up on missed messages
+
+        Completion (or failure) may have been announced while the socket
+        was down, so it is read back from the history API.
+        """
+        result = await self._check_workflow_history()
+        if result and not self.completed.is_set():
+            logger.info(f"Workflow finished while WebSocket was reconnecting: {result.status}")
+            if result.status == "failed":
+                self.error_occurred = True
+                self.error_data = result.error
+            self.completed.set()
 
     # ========================================================================
     # WebSocket Connection Management
     # ========================================================================
 
-    def _connect_websocket(self) -> None:
+    async def _connect_websocket(self) -> None:
         """
-        Establish WebSocket connection to ComfyUI
+        Start receiving this prompt's messages over the hub's WebSocket
 
         Raises:
             Exception: If connection fails within 10 seconds
         """
-        logger.info(f"Connecting to WebSocket: {self.client.ws_url}")
-
-        def on_open(ws):
-            """WebSocket opened callback"""
-            elapsed = time.time() - self._start_time
-            logger.info(f"✓ WebSocket connected ({elapsed:.2f}s)")
-            self._ws_connected.set()
-
-        def on_error(ws, error):
-            """WebSocket error callback"""
-            logger.error(f"✗ WebSocket error: {error}")
-            self._ws_error = error
-
-        def on_close(ws, close_status_code, close_msg):
-            """WebSocket closed callback"""
-            logger.info(f"WebSocket closed: code={close_status_code}, msg={close_msg}")
-
-        # Start WebSocket tracking
-        self._ws = self.client.track_updates(self._handle_message)
-
-        # Override callbacks
-        original_on_open = self._ws.on_open
-        self._ws.on_open = lambda ws_obj: (
-            on_open(ws_obj),
-            original_on_open(ws_obj) if original_on_open else None
-        )
-        self._ws.on_error = on_error
-        self._ws.on_close = on_close
-
-        # Start WebSocket in background thread
-        self._ws_thread = threading.Thread(
-            target=self._ws.run_forever,
-            daemon=True
-        )
-        self._ws_thread.start()
+        await self._hub.subscribe(self)
 
-        # Wait for connection (with timeout)
-        if not self._ws_connected.wait(timeout=10):
-            self._ws.close()
-            raise Exception("WebSocket failed to connect within 10 seconds")
+        elapsed = self._elapsed()
+        logger.info(f"WebSocket ready ({elapsed:.2f}s), waiting for execution messages...")
 
-        logger.info("WebSocket ready, waiting for execution messages...")
-
-    def _close_websocket(self) -> None:
-        """Close WebSocket connection"""
-        if self._ws:
-            logger.info("Closing WebSocket connection")
-            self._ws.close()
-            self._ws = None
+    async def _close_websocket(self) -> None:
+        """Stop receiving messages (the hub closes the socket when unused)"""
+        await self._hub.unsubscribe(self)
 
     # ========================================================================
     # Helper Methods
     # ========================================================================
 
-    async def _check_workflow_history(self) -> Optional[Dict[str, Any]]:
+    async def _check_workflow_history(self) -> Optional[TrackResult]:
         """
         Check if workflow already completed (race condition handling)
 
@@ -379,10 +603,10 @@ class WorkflowTracker:
         This checks the history API to see if it's already done.
 
         Returns:
-            Result dict if workflow already finished, None otherwise
+            TrackResult if workflow already finished, None otherwise
         """
         try:
-            history = self.client.get_history(self.prompt_id)
+            history = await self.http.get_history(self.prompt_id)
             if self.prompt_id in history:
                 history_data = history[self.prompt_id]
                 status = history_data.get('status', {}).get('status_str', 'unknown')
@@ -390,17 +614,9 @@ class WorkflowTracker:
                 logger.info(f"Workflow already in history with status: {status}")
 
                 if status == 'success':
-                    return {
-                        "status": "completed",
-                        "history": history_data,
-                        "error": None
-                    }
+                    return TrackResult("completed", history_data, None)
                 elif status == 'error':
-                    return {
-                        "status": "failed",
-                        "history": history_data,
-                        "error": history_data.get('status', {})
-                    }
+                    return TrackResult("failed", history_data, history_data.get('status', {}))
         except Exception as e:
             # No history yet - this is expected for new workflows
             logger.debug(f"No history yet (expected): {e}")
@@ -409,64 +625,84 @@ class WorkflowTracker:
 
     async def _wait_for_completion(
         self,
-        heartbeat_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+        heartbeat_callback: Optional[Callable[[Dict[str, Any]], Any]] = None
     ) -> None:
         """
         Wait for workflow completion while sending heartbeats
 
+        Waits on the completion event itself, so completion is seen as soon
+        as a handler sets it; heartbeats run as a separate task.
+
         Args:
             heartbeat_callback: Optional callback to invoke with current state
 
         Raises:
             Exception: If timeout is exceeded
         """
-        loop_start = time.time()
+        heartbeat_task = None
+        if heartbeat_callback:
+            heartbeat_task = asyncio.create_task(self._send_heartbeats(heartbeat_callback))
+
+        try:
+            remaining = self.timeout - self._elapsed()
+            await asyncio.wait_for(self.completed.wait(), timeout=max(remaining, 0))
+        except asyncio.TimeoutError:
+            raise Exception(f"Execution timeout after {self.timeout} seconds")
+        finally:
+            if heartbeat_task:
+                heartbeat_task.cancel()
+
+    async def _send_heartbeats(
+        self,
+        heartbeat_callback: Callable[[Dict[str, Any]], Any]
+    ) -> None:
+        """
+        Queue heartbeats until cancelled, skipping ones that repeat the last state
+
+        Checked every HEARTBEAT_INTERVAL seconds. A state change (node or
+        progress) is sent subject to the burst limit; an unchanged state is
+        re-sent only after HEARTBEAT_MAX_SILENCE seconds, as a keep-alive.
+        """
+        bucket = TokenBucket(HEARTBEAT_BURST, HEARTBEAT_BURST_INTERVAL)
+        last_state = None
+        last_sent = None
 
         while not self.completed.is_set():
-            # Check timeout
-            elapsed = time.time() - self._start_time
-            if elapsed > self.timeout:
-                raise Exception(f"Execution timeout after {self.timeout} seconds")
+            elapsed = self._elapsed()
+            state = (self.current_node, round(self.progress, 2))
 
-            # Send heartbeat if callback provided
-            if heartbeat_callback:
-                try:
-                    heartbeat_data = {
-                        "prompt_id": self.prompt_id,
-                        "current_node": self.current_node,
-                        "progress": self.progress,
-                        "elapsed": elapsed
-                    }
-                    heartbeat_callback(heartbeat_data)
-                except Exception as e:
-                    # Don't fail on heartbeat errors
-                    logger.warning(f"Heartbeat callback failed: {e}")
+            keep_alive = last_sent is None or elapsed - last_sent >= HEARTBEAT_MAX_SILENCE
+            changed = state != last_state
 
-            # Wait 1 second before next heartbeat
-            await asyncio.sleep(1)
+            if keep_alive or (changed and bucket.take()):
+                heartbeat_data = {
+                    "prompt_id": self.prompt_id,
+                    "current_node": self.current_node,
+                    "progress": self.progress,
+                    "elapsed": elapsed
+                }
+                _queue_heartbeat(heartbeat_callback, heartbeat_data)
+                last_state, last_sent = state, elapsed
 
-    def _build_result(self, history_data: Dict[str, Any]) -> Dict[str, Any]:
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+
+    def _elapsed(self) -> float:
+        """Seconds since tracking started"""
+        return (time.monotonic_ns() - self._start_ns) / 1e9
+
+    def _build_result(self, history_data: Dict[str, Any]) -> TrackResult:
         """
-        Build final result dict
+        Build final result
 
         Args:
             history_data: ComfyUI history data for this prompt
 
         Returns:
-            Standardized result dict
+            Standardized TrackResult
         """
         if self.error_occurred:
-            return {
-                "status": "failed",
-                "history": history_data,
-                "error": self.error_data
-            }
-        else:
-            return {
-                "status": "completed",
-                "history": history_data,
-                "error": None
-            }
+            return TrackResult("failed", history_data, self.error_data)
+        return TrackResult("completed", history_data, None)
 
     def get_current_state(self) -> Dict[str, Any]:
         """
@@ -475,7 +711,7 @@ class WorkflowTracker:
         Returns:
             Dict with current state
         """
-        elapsed = time.time() - self._start_time if self._start_time else 0
+        elapsed = self._elapsed() if self._start_ns else 0
 
         return {
             "prompt_id": self.prompt_id,
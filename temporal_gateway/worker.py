@@ -6,19 +6,18 @@ Run this alongside the FastAPI gateway.
 """
 
 import asyncio
+import pickle
 import sys
 import yaml
 from pathlib import Path
 
-# Add parent to path
-sys.path.append(str(Path(__file__).parent.parent))
-
 from temporalio.client import Client
 from temporalio.worker import Worker
 
-from temporal_gateway.workflows import ComfyUIWorkflow, ChainExecutorWorkflow
+from temporal_gateway.workflows import ComfyUIWorkflow, ChainExecutorWorkflow, LegacyChainExecutorWorkflow
 from temporal_gateway.activities import (
     select_best_server,
+    is_server_healthy,
     execute_and_track_workflow,
     download_and_store_images,
     download_and_store_artifacts,
@@ -27,16 +26,56 @@ from temporal_gateway.activities import (
     resolve_chain_templates,
     evaluate_chain_condition,
     apply_workflow_parameters,
+    upsert_workflow_record_and_apply_params,
     transfer_outputs_to_input,
     transfer_artifacts_from_storage,
+    collect_and_transfer_dependency_artifacts,
     create_chain_record,
     create_workflow_record,
     update_chain_status_activity,
     update_workflow_status_activity,
+    bulk_update_chain_and_workflows,
     get_workflow_artifacts,
+    create_approval_request_activity,
 )
 from gateway.core import load_balancer
 from temporal_gateway.database import init_db
+from temporal_gateway.clients.comfy.http import close_shared_client, warm_up_shared_client
+
+# The chain template/condition activities import the interpreter lazily (to
+# avoid an import cycle); load it at boot so their first run doesn't pay for it
+import temporal_gateway.chains.interpreter  # noqa: F401
+
+
+def load_config(config_path: Path) -> dict:
+    """
+    Load config.yaml, reusing a pickled copy while the YAML is unchanged
+
+    The pickle sits next to the config (config.pkl) and records the YAML's
+    mtime; it is rewritten whenever the YAML changes. Failing to write it
+    (e.g. read-only mount) just means parsing the YAML next time too.
+    """
+    mtime_ns = config_path.stat().st_mtime_ns
+    cache_path = config_path.with_suffix(".pkl")
+
+    try:
+        with open(cache_path, "rb") as f:
+            cached = pickle.load(f)
+        if cached["mtime_ns"] == mtime_ns:
+            return cached["config"]
+    except Exception:
+        pass
+
+    with open(config_path) as f:
+        config = yaml.safe_load(f)
+
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump({"mtime_ns": mtime_ns, "config": config}, f)
+    except OSError as e:
+        print(f"⚠ Could not cache parsed config: {e}")
+
+    return config
 
 
 async def main():
@@ -44,7 +83,7 @@ async def main():
 
     # Initialize database
     print("Initializing artifact database...")
-    init_db()
+    await init_db()
     print("✓ Database initialized\n")
 
     # Load server configuration
@@ -52,17 +91,19 @@ async def main():
     print(f"Loading server configuration from: {config_path}")
 
     try:
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+        config = load_config(config_path)
 
         # Register all servers from config
         servers = config.get('servers', [])
         print(f"Found {len(servers)} server(s) in config")
 
+        load_balancer.register_servers([server['address'] for server in servers])
         for server in servers:
-            load_balancer.register_server(server['address'])
             print(f"  ✓ Registered: {server['name']} ({server['address']})")
 
+        # Open the shared HTTP pool's connections before the first activity
+        await warm_up_shared_client([f"http://{server['address']}" for server in servers])
+
         print()
     except FileNotFoundError:
         print(f"⚠ Config file not found: {config_path}")
@@ -81,9 +122,11 @@ async def main():
     worker = Worker(
         client,
         task_queue="comfyui-gpu-farm",  # Name of our task queue
-        workflows=[ComfyUIWorkflow, ChainExecutorWorkflow],  # Register workflow classes
+        # LegacyChainExecutorWorkflow only finishes chains started before V2
+        workflows=[ComfyUIWorkflow, ChainExecutorWorkflow, LegacyChainExecutorWorkflow],  # Register workflow classes
         activities=[                     # Register activity functions
             select_best_server,
+            is_server_healthy,
             execute_and_track_workflow,
             download_and_store_images,
             download_and_store_artifacts,
@@ -92,13 +135,17 @@ async def main():
             resolve_chain_templates,
             evaluate_chain_condition,
             apply_workflow_parameters,
+            upsert_workflow_record_and_apply_params,
             transfer_outputs_to_input,
             transfer_artifacts_from_storage,
+            collect_and_transfer_dependency_artifacts,
             create_chain_record,
             create_workflow_record,
             update_chain_status_activity,
             update_workflow_status_activity,
+            bulk_update_chain_and_workflows,
             get_workflow_artifacts,
+            create_approval_request_activity,
         ]
     )
 
@@ -114,8 +161,17 @@ async def main():
     print("Waiting for workflows to execute...\n")
 
     # Run worker (blocks until stopped)
-    await worker.run()
+    try:
+        await worker.run()
+    finally:
+        await close_shared_client()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # The worker is I/O bound (Temporal gRPC, ComfyUI HTTP/WebSocket), so run
+    # it on uvloop's libuv event loop where available (not on Windows)
+    if sys.platform == "win32":
+        asyncio.run(main())
+    else:
+        import uvloop
+        uvloop.run(main())
@@ -25,17 +25,68 @@ Usage:
 
 import json
 import hashlib
+import os
+import re
 import logging
 import shutil
+import sys
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, field, asdict
+from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
+from types import MappingProxyType
+
+import orjson
+
+try:
+    from blake3 import blake3
+except ImportError:  # optional - faster change-detection hash
+    blake3 = None
 
 logger = logging.getLogger(__name__)
 
+# Known output node types -> output type
+_OUTPUT_NODE_TYPES = MappingProxyType({
+    "SaveVideo": "video",
+    "SaveImage": "image",
+    "PreviewImage": "image",
+    "VHS_VideoCombine": "video",  # VideoHelperSuite
+    "SaveAnimatedWEBP": "image"
+})
+
+# WorkflowParameter string fields that repeat across parameters and workflows
+_INTERNED_FIELDS = frozenset({"input_key", "type", "node_class", "node_title", "category"})
+
+
+def _intern(value: Any) -> Any:
+    """sys.intern() strings so repeated values share one object"""
+    return sys.intern(value) if type(value) is str else value
+
+
+# Parameter categories by exact (lowercased) input key
+_CATEGORY_EXACT = {
+    "width": "dimensions", "height": "dimensions", "length": "dimensions", "batch_size": "dimensions",
+    "steps": "sampling", "cfg": "sampling", "denoise": "sampling",
+    "sampler_name": "sampling", "scheduler": "sampling",
+    "fps": "video", "frame": "video", "duration": "video",
+}
+
+# Substring rules in priority order; the first alternative that matches wins
+# and its (empty) named group gives the category
+_CATEGORY_SUBSTR = re.compile(
+    r"^(?:(?=.*(?:text|prompt))(?P<prompts>)"
+    r"|(?=.*seed)(?P<generation>)"
+    r"|(?=.*(?:image|video))(?P<media>)"
+    r"|(?=.*(?:model|lora|vae))(?P<models>))",
+    re.DOTALL,
+)
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WorkflowParameter:
     """Represents an overridable parameter"""
     key: str                    # Full key: "node_id.input_key"
@@ -47,9 +98,26 @@ class WorkflowParameter:
     node_title: str            # Human-readable node title
     description: str = ""      # User-editable description
     category: str = "other"    # Parameter category (prompts, dimensions, etc)
-
-
-@dataclass
+    _dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Fields as a dict, built once per (immutable) parameter - treat as read-only"""
+        if self._dict is None:
+            object.__setattr__(self, "_dict", {
+                "key": self.key,
+                "node_id": self.node_id,
+                "input_key": self.input_key,
+                "default_value": self.default_value,
+                "type": self.type,
+                "node_class": self.node_class,
+                "node_title": self.node_title,
+                "description": self.description,
+                "category": self.category
+            })
+        return self._dict
+
+
+@dataclass(slots=True, frozen=True)
 class WorkflowOutput:
     """Represents the output of a workflow"""
     node_id: str               # Node ID that produces output
@@ -59,17 +127,42 @@ class WorkflowOutput:
     format: str = "auto"       # Output format
     filename_prefix: str = ""  # Filename prefix/pattern
 
+    def as_dict(self) -> Dict[str, Any]:
+        """Fields as a dict"""
+        return {
+            "node_id": self.node_id,
+            "output_type": self.output_type,
+            "node_class": self.node_class,
+            "node_title": self.node_title,
+            "format": self.format,
+            "filename_prefix": self.filename_prefix
+        }
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WorkflowInfo:
     """Information about a discovered workflow"""
     name: str
     parameters: List[WorkflowParameter] = field(default_factory=list)
     output: Optional[WorkflowOutput] = None
     description: str = ""
-
-
-@dataclass
+    # Parameters (as dicts) grouped by category; computed once at load time
+    parameters_by_category: Dict[str, List[Dict[str, Any]]] = field(init=False, default_factory=dict)
+    # Parameters by key ("node_id.input_key"); computed once at load time
+    parameters_by_key: Dict[str, WorkflowParameter] = field(init=False, default_factory=dict)
+    # Distinct parameter categories; computed once at load time
+    categories: frozenset = field(init=False, default_factory=frozenset)
+
+    def __post_init__(self):
+        grouped = defaultdict(list)
+        for p in self.parameters:
+            grouped[p.category or "other"].append(p.as_dict())
+        object.__setattr__(self, "parameters_by_key", {p.key: p for p in self.parameters})
+        object.__setattr__(self, "parameters_by_category", dict(grouped))
+        object.__setattr__(self, "categories", frozenset(p.category for p in self.parameters))
+
+
+@dataclass(slots=True, frozen=True)
 class OverrideFile:
     """Structure of the override JSON file"""
     workflow_hash: str
@@ -92,6 +185,8 @@ class WorkflowRegistry:
 
     OVERRIDE_SUFFIX = "_overrides.json"
     BACKUP_SUFFIX = ".bak"
+    # Upper bound on threads used to process workflow files during discovery
+    MAX_DISCOVERY_WORKERS = 8
 
     def __init__(self, workflows_dir: Optional[Path] = None):
         """
@@ -106,6 +201,17 @@ class WorkflowRegistry:
         self.workflows_dir = Path(workflows_dir)
         self.workflows: Dict[str, WorkflowInfo] = {}
         self.workflow_hashes: Dict[str, str] = {}
+        # Names of discovered workflows (rebuilt only on indexing/discovery/reload)
+        self.workflow_names: frozenset = frozenset()
+        # Output type per workflow ("video", "image", ...), rebuilt with workflow_names
+        self.output_types: Dict[str, str] = {}
+        # Parsed workflow JSON per workflow: (mtime_ns, size, data)
+        self._parsed_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+        # Indexed but not yet loaded workflows (name -> file), see _ensure_loaded()
+        self._pending: Dict[str, Path] = {}
+        # Guards registry writes while workflows are processed in parallel
+        # (re-entrant: on-demand loading holds it around _process_workflow)
+        self._lock = threading.RLock()
 
         logger.info(f"WorkflowRegistry initialized: {self.workflows_dir}")
 
@@ -128,20 +234,34 @@ class WorkflowRegistry:
             "errors": []
         }
 
-        for workflow_file in self.workflows_dir.glob("*.json"):
-            # Skip override files
-            if self.OVERRIDE_SUFFIX in workflow_file.name:
-                continue
+        workflow_files = self._index_workflows()
 
-            try:
-                result = self._process_workflow(workflow_file)
-                summary["discovered"] += 1
-                summary[result] += 1
+        # Files are independent (I/O + parse + hash), so process them in
+        # parallel; a single file isn't worth starting a pool for
+        if len(workflow_files) > 1:
+            max_workers = min(self.MAX_DISCOVERY_WORKERS, os.cpu_count() or 1, len(workflow_files))
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                results = list(pool.map(self._try_process_workflow, workflow_files))
+        else:
+            results = [self._try_process_workflow(f) for f in workflow_files]
 
-            except Exception as e:
-                error_msg = f"Failed to process {workflow_file.name}: {e}"
+        for workflow_file, result in zip(workflow_files, results):
+            if isinstance(result, Exception):
+                error_msg = f"Failed to process {workflow_file.name}: {result}"
                 logger.error(error_msg)
                 summary["errors"].append(error_msg)
+            else:
+                summary["discovered"] += 1
+                summary[result] += 1
+
+        self._pending.clear()
+        self.workflow_names = frozenset(self.workflows)
+        for name in self._parsed_cache.keys() - self.workflow_names:
+            del self._parsed_cache[name]
+        self.output_types = {
+            name: info.output.output_type if info.output else "unknown"
+            for name, info in self.workflows.items()
+        }
 
         logger.info(
             f"Discovery complete: {summary['discovered']} workflows, "
@@ -152,88 +272,88 @@ class WorkflowRegistry:
 
         return summary
 
-    def _find_terminal_nodes(self, workflow_data: Dict) -> set:
-        """
-        Find terminal nodes (nodes not referenced by any other node)
-
-        Args:
-            workflow_data: Parsed workflow JSON
-
-        Returns:
-            Set of node IDs that are terminal
+    def _walk_workflow(
+        self,
+        workflow_data: Dict,
+        extract_parameters: bool = True
+    ) -> Tuple[List[WorkflowParameter], Optional[WorkflowOutput]]:
         """
-        all_nodes = set(workflow_data.keys())
-        referenced_nodes = set()
-
-        # Find all referenced nodes
-        for node in workflow_data.values():
-            for value in node.get("inputs", {}).values():
-                if isinstance(value, list) and len(value) > 0:
-                    # This is a node reference
-                    referenced_nodes.add(str(value[0]))
+        Extract parameters and detect the output node in a single pass
 
-        # Terminal nodes = not referenced by anyone
-        terminal = all_nodes - referenced_nodes
-        return terminal
+        Parameters: non-list values in inputs are overridable (lists are
+        node connections).
 
-    def _detect_output(self, workflow_data: Dict) -> Optional[WorkflowOutput]:
-        """
-        Detect the output node of a workflow
-
-        Rules:
+        Output rules:
         1. Must be SaveVideo or SaveImage node
         2. Must be a terminal node (not referenced by others)
         3. There should be exactly ONE such node
 
         Args:
             workflow_data: Parsed workflow JSON
+            extract_parameters: Build WorkflowParameter objects (not needed
+                                when the parameters come from an override file)
 
         Returns:
-            WorkflowOutput if found, None otherwise
+            (parameters, output) - output is None if no output node was found
 
         Raises:
             ValueError: If multiple output nodes found
         """
-        # Known output node types
-        OUTPUT_NODE_TYPES = {
-            "SaveVideo": "video",
-            "SaveImage": "image",
-            "PreviewImage": "image",
-            "VHS_VideoCombine": "video",  # VideoHelperSuite
-            "SaveAnimatedWEBP": "image"
-        }
-
-        # Find terminal nodes
-        terminal_nodes = self._find_terminal_nodes(workflow_data)
+        parameters = []
+        referenced_nodes = set()
+        output_candidates = []
 
-        # Find output nodes (SaveVideo/SaveImage that are terminal)
-        output_nodes = []
+        for node_id, node in workflow_data.items():
+            inputs = node.get("inputs", {})
+            node_class = _intern(node.get("class_type", "Unknown"))
+            node_title = _intern(node.get("_meta", {}).get("title", node_class))
 
-        for node_id in terminal_nodes:
-            node = workflow_data.get(node_id)
-            if not node:
-                continue
+            if node_class in _OUTPUT_NODE_TYPES:
+                output_candidates.append((node_id, node_class, node_title, inputs))
 
-            node_class = node.get("class_type", "")
+            for input_key, value in inputs.items():
+                # Node connections are lists: [node_id, output_index]
+                if isinstance(value, list):
+                    if value:
+                        # Node ids are already strings in API-format JSON
+                        ref = value[0]
+                        referenced_nodes.add(ref if type(ref) is str else str(ref))
+                    continue
 
-            if node_class in OUTPUT_NODE_TYPES:
-                output_type = OUTPUT_NODE_TYPES[node_class]
-                node_title = node.get("_meta", {}).get("title", node_class)
-                inputs = node.get("inputs", {})
+                if not extract_parameters:
+                    continue
 
-                output_nodes.append(WorkflowOutput(
+                # This is a mutable parameter!
+                parameters.append(WorkflowParameter(
+                    key=f"{node_id}.{input_key}",
                     node_id=node_id,
-                    output_type=output_type,
+                    input_key=_intern(input_key),
+                    default_value=value,
+                    type=type(value).__name__,
                     node_class=node_class,
                     node_title=node_title,
-                    format=inputs.get("format", "auto"),
-                    filename_prefix=inputs.get("filename_prefix", "")
+                    description=self._generate_description(input_key, node_class, node_title),
+                    category=self._categorize_parameter(input_key, node_class)
                 ))
 
+        # Output nodes = Save*/Preview* nodes that nobody references
+        output_nodes = [
+            WorkflowOutput(
+                node_id=node_id,
+                output_type=_OUTPUT_NODE_TYPES[node_class],
+                node_class=node_class,
+                node_title=node_title,
+                format=inputs.get("format", "auto"),
+                filename_prefix=inputs.get("filename_prefix", "")
+            )
+            for node_id, node_class, node_title, inputs in output_candidates
+            if node_id not in referenced_nodes
+        ]
+
         # Validation
         if len(output_nodes) == 0:
             logger.warning("No output node found (no terminal SaveVideo/SaveImage)")
-            return None
+            return parameters, None
 
         if len(output_nodes) > 1:
             node_ids = [o.node_id for o in output_nodes]
@@ -243,7 +363,68 @@ class WorkflowRegistry:
                 f"Please split this into separate workflows."
             )
 
-        return output_nodes[0]
+        return parameters, output_nodes[0]
+
+    def _index_workflows(self) -> List[Path]:
+        """
+        List workflow files without parsing them
+
+        Workflows that are not loaded yet are queued in _pending and loaded
+        on first use (see _ensure_loaded).
+
+        Returns:
+            Paths of the workflow JSON files
+        """
+        if not self.workflows_dir.exists():
+            logger.warning(f"Workflows directory not found: {self.workflows_dir}")
+            return []
+
+        # Workflow JSON files, skipping override files (one scandir pass,
+        # Path objects are only built for the workers)
+        with os.scandir(self.workflows_dir) as it:
+            workflow_files = [
+                Path(entry.path) for entry in it
+                if entry.name.endswith(".json")
+                and self.OVERRIDE_SUFFIX not in entry.name
+                and entry.is_file()
+            ]
+
+        self._pending = {f.stem: f for f in workflow_files if f.stem not in self.workflows}
+        self.workflow_names = frozenset(f.stem for f in workflow_files)
+        return workflow_files
+
+    def _ensure_loaded(self, workflow_name: str) -> None:
+        """Load an indexed workflow (and its override file) on first use"""
+        if workflow_name not in self._pending:
+            return
+
+        with self._lock:
+            workflow_file = self._pending.pop(workflow_name, None)
+            if workflow_file is None:
+                return
+
+            try:
+                result = self._process_workflow(workflow_file)
+            except Exception as e:
+                logger.error(f"Failed to process {workflow_file.name}: {e}")
+                self.workflow_names = self.workflow_names - {workflow_name}
+                return
+
+            info = self.workflows[workflow_name]
+            self.output_types[workflow_name] = info.output.output_type if info.output else "unknown"
+            logger.info(f"Loaded workflow on demand: {workflow_name} ({result})")
+
+    def _ensure_all_loaded(self) -> None:
+        """Load every indexed workflow that hasn't been used yet"""
+        for workflow_name in list(self._pending):
+            self._ensure_loaded(workflow_name)
+
+    def _try_process_workflow(self, workflow_file: Path):
+        """_process_workflow() returning the exception instead of raising it"""
+        try:
+            return self._process_workflow(workflow_file)
+        except Exception as e:
+            return e
 
     def _process_workflow(self, workflow_file: Path) -> str:
         """
@@ -256,21 +437,27 @@ class WorkflowRegistry:
         override_file = self._get_override_path(workflow_file)
 
         # Load workflow JSON
-        with open(workflow_file, 'r', encoding='utf-8') as f:
-            workflow_data = json.load(f)
+        workflow_data = self._load_workflow_json(workflow_file)
 
         # Calculate current hash
         current_hash = self._calculate_hash(workflow_data)
-        self.workflow_hashes[workflow_name] = current_hash
+        with self._lock:
+            self.workflow_hashes[workflow_name] = current_hash
 
         # Check if override file exists
         if override_file.exists():
             # Load and validate
-            with open(override_file, 'r', encoding='utf-8') as f:
-                override_data = json.load(f)
+            override_data = orjson.loads(override_file.read_bytes())
 
             stored_hash = override_data.get("workflow_hash", "")
 
+            if stored_hash != current_hash and self._is_other_hash_format(stored_hash, workflow_data):
+                # Same workflow, hashed in an older/other format - keep the
+                # user's edits and only refresh the stored hash
+                override_data["workflow_hash"] = current_hash
+                self._write_override_file(override_file, override_data)
+                stored_hash = current_hash
+
             if stored_hash == current_hash:
                 # Hash matches - load parameters
                 logger.info(f"✓ {workflow_name}: Loading from override file")
@@ -282,12 +469,12 @@ class WorkflowRegistry:
                     f"⚠️ {workflow_name}: Workflow changed! "
                     f"Regenerating overrides..."
                 )
-                self._backup_override_file(override_file)
                 self._generate_override_file(
                     workflow_name,
                     workflow_data,
                     current_hash,
-                    override_file
+                    override_file,
+                    previous=override_data
                 )
                 return "regenerated"
         else:
@@ -301,24 +488,77 @@ class WorkflowRegistry:
             )
             return "generated"
 
-    def _calculate_hash(self, workflow_data: Dict) -> str:
+    def _load_workflow_json(self, workflow_file: Path) -> Dict[str, Any]:
+        """
+        Load a workflow JSON file, reusing the parsed dict while the file is unchanged
+
+        The returned dict is shared - callers must not mutate it.
+
+        Args:
+            workflow_file: Path to the workflow JSON
+
+        Returns:
+            Parsed workflow JSON
+        """
+        st = os.stat(workflow_file)
+        cached = self._parsed_cache.get(workflow_file.stem)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        workflow_data = orjson.loads(workflow_file.read_bytes())
+        with self._lock:
+            self._parsed_cache[workflow_file.stem] = (st.st_mtime_ns, st.st_size, workflow_data)
+        return workflow_data
+
+    def _calculate_hash(self, workflow_data: Dict, algorithm: Optional[str] = None) -> str:
         """
-        Calculate SHA256 hash of workflow JSON
+        Calculate hash of workflow JSON (change detection only)
+
+        BLAKE3 is used when the optional blake3 package is installed,
+        SHA256 otherwise.
 
         Args:
             workflow_data: Parsed workflow JSON
+            algorithm: "blake3" or "sha256" (default: fastest available)
 
         Returns:
-            Hash string with prefix (e.g., "sha256:abc123...")
+            Hash string with prefix (e.g., "blake3:abc123...", "sha256:abc123...")
         """
-        # Create canonical JSON (sorted keys for determinism)
-        canonical = json.dumps(workflow_data, sort_keys=True, ensure_ascii=False)
+        # Canonical JSON bytes (sorted keys for determinism)
+        canonical = orjson.dumps(workflow_data, option=orjson.OPT_SORT_KEYS)
+
+        if algorithm is None:
+            algorithm = "blake3" if blake3 is not None else "sha256"
+
+        if algorithm == "blake3":
+            return f"blake3:{blake3(canonical).hexdigest()}"
 
-        # Calculate hash
-        hash_obj = hashlib.sha256(canonical.encode('utf-8'))
-        hash_hex = hash_obj.hexdigest()
+        # Calculate hash (a content fingerprint, not a security boundary)
+        hash_obj = hashlib.sha256(canonical, usedforsecurity=False)
+        return f"sha256:{hash_obj.hexdigest()}"
 
-        return f"sha256:{hash_hex}"
+    def _is_other_hash_format(self, stored_hash: str, workflow_data: Dict) -> bool:
+        """
+        Check whether stored_hash is this workflow's hash in another format
+
+        Covers SHA256 vs BLAKE3 (blake3 installed or not) and the SHA256 of
+        the stdlib-json serialization used before the orjson switch.
+        """
+        algorithm = stored_hash.partition(":")[0]
+        if algorithm == "blake3" and blake3 is None:
+            return False
+        if algorithm == "sha256" and stored_hash == self._calculate_legacy_hash(workflow_data):
+            return True
+        return algorithm in ("blake3", "sha256") and stored_hash == self._calculate_hash(workflow_data, algorithm)
+
+    def _calculate_legacy_hash(self, workflow_data: Dict) -> str:
+        """Hash as computed before the orjson switch (stdlib json separators)"""
+        canonical = json.dumps(workflow_data, sort_keys=True, ensure_ascii=False)
+        return f"sha256:{hashlib.sha256(canonical.encode('utf-8')).hexdigest()}"
+
+    def _write_override_file(self, override_file: Path, override_data: Dict) -> None:
+        """Write override file (pretty-printed for human editing)"""
+        override_file.write_bytes(orjson.dumps(override_data, option=orjson.OPT_INDENT_2))
 
     def _get_override_path(self, workflow_file: Path) -> Path:
         """Get path to override file for a workflow"""
@@ -337,7 +577,8 @@ class WorkflowRegistry:
         workflow_name: str,
         workflow_data: Dict,
         workflow_hash: str,
-        override_file: Path
+        override_file: Path,
+        previous: Optional[Dict] = None
     ) -> None:
         """
         Generate override file with all mutable parameters
@@ -347,20 +588,21 @@ class WorkflowRegistry:
             workflow_data: Parsed workflow JSON
             workflow_hash: Calculated hash
             override_file: Path to write override file
+            previous: Parsed override file being replaced, if any (backed
+                      up unless its parameters are unchanged)
         """
-        # Extract all mutable parameters
-        parameters = self._extract_parameters(workflow_data)
-
-        # Detect workflow output
-        output = self._detect_output(workflow_data)
+        # Extract all mutable parameters and detect workflow output
+        parameters, output = self._walk_workflow(workflow_data)
 
         # Store in registry
-        self.workflows[workflow_name] = WorkflowInfo(
+        info = WorkflowInfo(
             name=workflow_name,
             parameters=parameters,
             output=output,
             description=f"Workflow with {len(parameters)} parameters"
         )
+        with self._lock:
+            self.workflows[workflow_name] = info
 
         # Create override file data
         override_data = {
@@ -372,25 +614,19 @@ class WorkflowRegistry:
                 "You can edit descriptions, remove parameters to make them immutable, "
                 "or add custom categories."
             ),
-            "parameters": [
-                {
-                    "key": p.key,
-                    "node_id": p.node_id,
-                    "input_key": p.input_key,
-                    "default_value": p.default_value,
-                    "type": p.type,
-                    "node_class": p.node_class,
-                    "node_title": p.node_title,
-                    "description": p.description,
-                    "category": p.category
-                }
-                for p in parameters
-            ]
+            "parameters": [p.as_dict() for p in parameters]
         }
 
+        if previous is not None:
+            if previous.get("parameters") == override_data["parameters"]:
+                # Only the hash changed (e.g. a link or layout edit): nothing
+                # worth backing up, keep the original timestamp
+                override_data["generated_at"] = previous.get("generated_at", override_data["generated_at"])
+            else:
+                self._backup_override_file(override_file)
+
         # Write to file (pretty-printed for human editing)
-        with open(override_file, 'w', encoding='utf-8') as f:
-            json.dump(override_data, f, indent=2, ensure_ascii=False)
+        self._write_override_file(override_file, override_data)
 
         logger.info(
             f"  Generated: {override_file.name} "
@@ -412,102 +648,45 @@ class WorkflowRegistry:
             override_data: Parsed override JSON
         """
         parameters = [
-            WorkflowParameter(**param_data)
+            WorkflowParameter(**{
+                k: _intern(v) if k in _INTERNED_FIELDS else v
+                for k, v in param_data.items()
+            })
             for param_data in override_data.get("parameters", [])
         ]
 
         # Detect workflow output
-        output = self._detect_output(workflow_data)
+        _, output = self._walk_workflow(workflow_data, extract_parameters=False)
 
         # Store in registry
-        self.workflows[workflow_name] = WorkflowInfo(
+        info = WorkflowInfo(
             name=workflow_name,
             parameters=parameters,
             output=output,
             description=override_data.get("description", "")
         )
+        with self._lock:
+            self.workflows[workflow_name] = info
 
         logger.info(f"  Loaded {len(parameters)} parameters from override file")
 
-    def _extract_parameters(self, workflow_data: Dict) -> List[WorkflowParameter]:
-        """
-        Extract all mutable parameters from workflow
-
-        Key insight: Non-list values in inputs are overridable!
-
-        Args:
-            workflow_data: Parsed workflow JSON
-
-        Returns:
-            List of WorkflowParameter objects
-        """
-        parameters = []
-
-        for node_id, node in workflow_data.items():
-            inputs = node.get("inputs", {})
-            node_class = node.get("class_type", "Unknown")
-            node_title = node.get("_meta", {}).get("title", node_class)
-
-            for input_key, value in inputs.items():
-                # Skip node connections (they're lists)
-                if isinstance(value, list):
-                    continue
-
-                # This is a mutable parameter!
-                category = self._categorize_parameter(
-                    input_key, value, node_class
-                )
-                description = self._generate_description(
-                    input_key, node_class, node_title
-                )
-
-                parameters.append(WorkflowParameter(
-                    key=f"{node_id}.{input_key}",
-                    node_id=node_id,
-                    input_key=input_key,
-                    default_value=value,
-                    type=type(value).__name__,
-                    node_class=node_class,
-                    node_title=node_title,
-                    description=description,
-                    category=category
-                ))
-
-        return parameters
-
-    def _categorize_parameter(
-        self,
-        input_key: str,
-        value: Any,
-        node_class: str
-    ) -> str:
-        """Auto-categorize parameter for better organization"""
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _categorize_parameter(input_key: str, node_class: str) -> str:
+        """Auto-categorize parameter for better organization (memoized)"""
         key_lower = input_key.lower()
 
-        if "text" in key_lower or "prompt" in key_lower:
-            return "prompts"
-        elif key_lower in ["width", "height", "length", "batch_size"]:
-            return "dimensions"
-        elif "seed" in key_lower:
-            return "generation"
-        elif key_lower in ["steps", "cfg", "denoise", "sampler_name", "scheduler"]:
-            return "sampling"
-        elif key_lower in ["fps", "frame", "duration"]:
-            return "video"
-        elif "image" in key_lower or "video" in key_lower:
-            return "media"
-        elif "model" in key_lower or "lora" in key_lower or "vae" in key_lower:
-            return "models"
-        else:
-            return "other"
+        category = _CATEGORY_EXACT.get(key_lower)
+        if category:
+            return category
 
-    def _generate_description(
-        self,
-        input_key: str,
-        node_class: str,
-        node_title: str
-    ) -> str:
-        """Generate helpful description for parameter"""
+        match = _CATEGORY_SUBSTR.match(key_lower)
+        return match.lastgroup if match else "other"
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _generate_description(input_key: str, node_class: str, node_title: str) -> str:
+        """Generate helpful description for parameter (memoized)"""
         if "text" in input_key.lower():
             if "negative" in node_title.lower():
                 return "Negative prompt (what to avoid)"
@@ -532,6 +711,7 @@ class WorkflowRegistry:
 
     def list_workflows(self) -> List[Dict[str, Any]]:
         """List all discovered workflows"""
+        self._ensure_all_loaded()
         return [
             {
                 "name": info.name,
@@ -539,7 +719,7 @@ class WorkflowRegistry:
                 "parameters": len(info.parameters),
                 "output_type": info.output.output_type if info.output else "unknown",
                 "hash": self.workflow_hashes.get(info.name, "unknown"),
-                "categories": list(set(p.category for p in info.parameters))
+                "categories": list(info.categories)
             }
             for name, info in self.workflows.items()
         ]
@@ -557,11 +737,12 @@ class WorkflowRegistry:
         Returns:
             List of parameters with metadata, or None if not found
         """
+        self._ensure_loaded(workflow_name)
         info = self.workflows.get(workflow_name)
         if not info:
             return None
 
-        return [asdict(p) for p in info.parameters]
+        return [p.as_dict() for p in info.parameters]
 
     def get_workflow_info(self, workflow_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -573,6 +754,7 @@ class WorkflowRegistry:
         Returns:
             Dict with workflow info including parameters and output, or None if not found
         """
+        self._ensure_loaded(workflow_name)
         info = self.workflows.get(workflow_name)
         if not info:
             return None
@@ -580,8 +762,9 @@ class WorkflowRegistry:
         return {
             "name": info.name,
             "description": info.description,
-            "parameters": [asdict(p) for p in info.parameters],
-            "output": asdict(info.output) if info.output else None
+            "parameters": [p.as_dict() for p in info.parameters],
+            "parameters_by_category": info.parameters_by_category,
+            "output": info.output.as_dict() if info.output else None
         }
 
     def apply_overrides(
@@ -597,35 +780,45 @@ class WorkflowRegistry:
             overrides: Dict of parameter overrides (key -> value)
 
         Returns:
-            Modified workflow JSON ready for execution
+            Modified workflow JSON ready for execution. Nodes that weren't
+            overridden are shared with the cached template - treat it as
+            read-only.
 
         Raises:
             ValueError: If workflow not found or parameter not overridable
         """
+        self._ensure_loaded(workflow_name)
+
         if workflow_name not in self.workflows:
             raise ValueError(f"Workflow '{workflow_name}' not found")
 
-        # Load original workflow
+        # Original workflow (shared, re-parsed only when the file changes) and
+        # allowed parameters
         workflow_file = self.workflows_dir / f"{workflow_name}.json"
-        with open(workflow_file, 'r', encoding='utf-8') as f:
-            workflow_data = json.load(f)
+        original = self._load_workflow_json(workflow_file)
+        allowed_params = self.workflows[workflow_name].parameters_by_key
 
-        # Get allowed parameters
-        workflow_info = self.workflows[workflow_name]
-        allowed_params = {p.key: p for p in workflow_info.parameters}
-
-        # Apply each override
-        for key, value in overrides.items():
+        for key in overrides:
             if key not in allowed_params:
                 raise ValueError(
                     f"Parameter '{key}' is not overridable in workflow '{workflow_name}'. "
                     f"Available parameters: {list(allowed_params.keys())}"
                 )
 
+        # Copy-on-write: only the touched nodes (and their inputs) are copied,
+        # untouched nodes are shared with the cached original
+        workflow_data = dict(original)
+        copied = set()
+        for key, value in overrides.items():
             param = allowed_params[key]
+            node_id = param.node_id
+            if node_id not in copied:
+                node = workflow_data[node_id] = dict(original[node_id])
+                node["inputs"] = dict(node["inputs"])
+                copied.add(node_id)
 
             # Apply to workflow data
-            workflow_data[param.node_id]["inputs"][param.input_key] = value
+            workflow_data[node_id]["inputs"][param.input_key] = value
             logger.info(f"Applied override: {key} = {value}")
 
         return workflow_data
@@ -634,6 +827,7 @@ class WorkflowRegistry:
         """Reload all workflows from disk"""
         self.workflows.clear()
         self.workflow_hashes.clear()
+        self._pending.clear()
         return self.discover_workflows()
 
 
@@ -642,9 +836,15 @@ _registry: Optional[WorkflowRegistry] = None
 
 
 def get_registry() -> WorkflowRegistry:
-    """Get or create global workflow registry"""
+    """
+    Get or create global workflow registry
+
+    The registry is only indexed here; each workflow is parsed (and its
+    override file loaded/generated) the first time it is used. Call
+    discover_workflows() to process everything up front.
+    """
     global _registry
     if _registry is None:
         _registry = WorkflowRegistry()
-        _registry.discover_workflows()
+        _registry._index_workflows()
     return _registry
@@ -14,6 +14,7 @@ from .chain.workflow import (
     ChainExecutorWorkflow,
     ChainExecutionRequest,
 )
+from .chain.legacy import LegacyChainExecutorWorkflow
 
 __all__ = [
     "ComfyUIWorkflow",
@@ -21,4 +22,5 @@ __all__ = [
     "WorkflowExecutionResult",
     "ChainExecutorWorkflow",
     "ChainExecutionRequest",
+    "LegacyChainExecutorWorkflow",
 ]
@@ -5,8 +5,10 @@ Contains the ChainExecutorWorkflow and approval-related helpers.
 """
 
 from .workflow import ChainExecutorWorkflow, ChainExecutionRequest
+from .legacy import LegacyChainExecutorWorkflow
 
 __all__ = [
     "ChainExecutorWorkflow",
     "ChainExecutionRequest",
+    "LegacyChainExecutorWorkflow",
 ]
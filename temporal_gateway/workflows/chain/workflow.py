@@ -4,8 +4,9 @@ Chain Executor Workflow
 Temporal workflow that executes chain plans by orchestrating child ComfyUI workflows.
 """
 
+import asyncio
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import timedelta
 
 from temporalio import workflow
@@ -18,30 +19,98 @@ with workflow.unsafe.imports_passed_through():
     from ...activities import (
         resolve_chain_templates,
         evaluate_chain_condition,
-        apply_workflow_parameters,
+        upsert_workflow_record_and_apply_params,
         select_best_server,
-        transfer_artifacts_from_storage,
+        collect_and_transfer_dependency_artifacts,
+        get_workflow_artifacts,
+        is_server_healthy,
         create_chain_record,
-        create_workflow_record,
         update_chain_status_activity,
-        update_workflow_status_activity,
-        get_workflow_artifacts,
+        bulk_update_chain_and_workflows,
         create_approval_request_activity,
     )
 
 
+# Applied to every activity without a tuned policy of its own: exponential
+# backoff (jittered by the server) bounded to 30s between attempts
+DEFAULT_RETRY = RetryPolicy(
+    initial_interval=timedelta(seconds=1),
+    backoff_coefficient=2.0,
+    maximum_interval=timedelta(seconds=30),
+    maximum_attempts=5,
+    non_retryable_error_types=["ValueError", "ValidationError"],
+)
+
+# Small DB reads/writes: a stalled call is abandoned after 2s and retried
+# quickly instead of holding a worker slot for the full timeout. The status
+# activities swallow DB errors (best effort), so for them only timeouts are
+# retried. Inserts get a longer attempt timeout, since an attempt abandoned
+# after a slow commit is retried against a row that already exists.
+DB_ACTIVITY_RETRY = RetryPolicy(
+    initial_interval=timedelta(milliseconds=100),
+    maximum_interval=timedelta(seconds=5),
+    maximum_attempts=8,
+)
+
+DB_ACTIVITY_TIMEOUT = timedelta(seconds=2)
+DB_INSERT_ACTIVITY_TIMEOUT = timedelta(seconds=10)
+DB_ACTIVITY_SCHEDULE_TIMEOUT = timedelta(seconds=30)
+
+# Activity timeouts, built once rather than on every call (and replay)
+_TD_10S = timedelta(seconds=10)
+_TD_30S = timedelta(seconds=30)
+_TD_5MIN = timedelta(minutes=5)
+
+SERVER_SELECTION_RETRY = RetryPolicy(
+    maximum_attempts=3,
+    initial_interval=timedelta(seconds=1),
+    maximum_interval=timedelta(seconds=10),
+    backoff_coefficient=2.0
+)
+
+TRANSFER_RETRY = RetryPolicy(
+    maximum_attempts=3,
+    initial_interval=timedelta(seconds=2),
+    maximum_interval=timedelta(seconds=10),
+    backoff_coefficient=2.0
+)
+
+CHILD_WORKFLOW_RETRY = RetryPolicy(
+    maximum_attempts=2,
+    initial_interval=timedelta(seconds=10),
+    maximum_interval=timedelta(seconds=60),
+    backoff_coefficient=2.0
+)
+
+# Event history length after which a chain continues as new at the next level
+# boundary (Temporal warns at 10k events and fails a workflow at 50k)
+CONTINUE_AS_NEW_HISTORY_LENGTH = 10_000
+
+
 @dataclass
 class ChainExecutionRequest:
     """Request to execute a chain"""
     plan: ExecutionPlan
     initial_parameters: Dict[str, Any] = None  # Optional parameters for first step
 
+    # Carried over by continue-as-new (see ChainExecutorWorkflow.run)
+    start_level: int = 0
+    chain_id: Optional[str] = None
+    step_results: Optional[Dict[str, StepResult]] = None
+    workflow_ids: Optional[Dict[str, str]] = None
+
 
-@workflow.defn
+@workflow.defn(name="ChainExecutorWorkflowV2")
 class ChainExecutorWorkflow:
     """
     Temporal workflow that executes workflow chains
 
+    Registered as "ChainExecutorWorkflowV2": its command sequence differs from
+    the original "ChainExecutorWorkflow", which stays registered (legacy.py)
+    until chains started on it have finished. A further change to the
+    sequence of activities/timers/child workflows here must be gated with
+    workflow.patched() or go under a new workflow type again.
+
     This workflow:
     1. Takes an ExecutionPlan from ChainInterpreter
     2. Executes steps level by level (sequential levels, parallel within level)
@@ -55,8 +124,15 @@ class ChainExecutorWorkflow:
         self._status = "initializing"
         self._current_level = 0
         self._step_results: Dict[str, StepResult] = {}
+        self._step_statuses: Dict[str, str] = {}  # step_id -> status, for get_status
+        self._completed_steps = 0
+        self._status_version = 0  # Bumped on every recorded result
+        self._status_cache: Optional[tuple] = None  # (version, step_statuses copy)
         self._chain_id: Optional[str] = None  # Database chain ID
         self._workflow_ids: Dict[str, str] = {}  # Map step_id -> workflow_id
+        self._workflow_id = ""  # Temporal IDs, bound once in run
+        self._run_id = ""
+        self._child_id_prefix = ""
 
         # Approval state
         self.approval_decision = None
@@ -75,65 +151,108 @@ class ChainExecutorWorkflow:
         Returns:
             ChainExecutionResult with all step results
         """
+        info = workflow.info()
+        self._workflow_id, self._run_id = info.workflow_id, info.run_id
+        self._child_id_prefix = f"{self._workflow_id}-"
+
         plan = request.plan
         workflow.logger.info(f"Starting chain execution: {plan.chain_name}")
         workflow.logger.info(f"Total levels: {plan.get_total_levels()}")
 
+        total_levels = plan.get_total_levels()
+
         try:
-            # Create chain record in database
-            self._chain_id = await workflow.execute_activity(
-                create_chain_record,
-                args=[
-                    plan.chain_name,
-                    workflow.info().workflow_id,
-                    workflow.info().run_id,
-                    None,  # chain_definition - can add later
-                    None,  # description
-                ],
-                start_to_close_timeout=timedelta(seconds=10)
-            )
-            workflow.logger.info(f"Created chain record: {self._chain_id}")
+            if request.chain_id:
+                # Continued as new: pick up where the previous run stopped
+                self._chain_id = request.chain_id
+                self._workflow_ids.update(request.workflow_ids or {})
+                for result in (request.step_results or {}).values():
+                    self._record_result(result)
+                workflow.logger.info(
+                    f"Continuing chain {self._chain_id} at level {request.start_level}"
+                )
+            else:
+                # Create chain record in database, already executing level 0
+                self._status = "executing_level_0" if total_levels else "initializing"
+                self._chain_id = await self._db_activity(
+                    create_chain_record,
+                    args=[
+                        plan.chain_name,
+                        self._workflow_id,
+                        self._run_id,
+                        None,  # chain_definition - can add later
+                        None,  # description
+                        self._status,
+                    ],
+                    start_to_close_timeout=DB_INSERT_ACTIVITY_TIMEOUT,
+                )
+                workflow.logger.info(f"Created chain record: {self._chain_id}")
 
             # Execute each level sequentially
-            for level_num in range(plan.get_total_levels()):
+            for level_num in range(request.start_level, total_levels):
                 self._current_level = level_num
                 self._status = f"executing_level_{level_num}"
 
-                # Update chain status in DB
-                await workflow.execute_activity(
-                    update_chain_status_activity,
-                    args=[self._chain_id, self._status, level_num],
-                    start_to_close_timeout=timedelta(seconds=10)
-                )
-
                 level_steps = plan.levels[level_num]
                 workflow.logger.info(f"Level {level_num}: Executing {len(level_steps)} step(s) in parallel")
 
-                # Execute all steps at this level in parallel
+                # Execute all steps at this level in parallel; each result is
+                # stored as soon as its step finishes (visible to get_status)
                 parallel_tasks = []
                 for step_id in level_steps:
                     node = plan.get_node(step_id)
-                    task = self._execute_step(node)
+                    task = self._execute_and_record_step(node)
                     parallel_tasks.append(task)
 
                 # Wait for all parallel steps to complete
-                import asyncio
                 results = await asyncio.gather(*parallel_tasks)
 
-                # Store results for next level
-                for result in results:
-                    self._step_results[result.step_id] = result
-                    workflow.logger.info(f"Step {result.step_id}: {result.status}")
+                # One DB write per level: the steps' final statuses plus the
+                # chain moving on to the next level (or completing)
+                next_level = level_num + 1
+                if next_level < total_levels:
+                    chain_status, chain_level = f"executing_level_{next_level}", next_level
+                else:
+                    chain_status, chain_level = "completed", None
+
+                await self._db_activity(
+                    bulk_update_chain_and_workflows,
+                    args=[
+                        self._chain_id,
+                        chain_status,
+                        chain_level,
+                        [
+                            [result.workflow_db_id, result.status, result.error]
+                            for result in results
+                            if result.workflow_db_id
+                        ],
+                    ]
+                )
+
+                # Bound the event history of long chains: carry the results
+                # (needed for template resolution) over into a fresh run
+                if (
+                    next_level < total_levels
+                    and info.get_current_history_length() >= CONTINUE_AS_NEW_HISTORY_LENGTH
+                ):
+                    workflow.logger.info(f"Continuing as new before level {next_level}")
+                    workflow.continue_as_new(ChainExecutionRequest(
+                        plan=plan,
+                        initial_parameters=request.initial_parameters,
+                        start_level=next_level,
+                        chain_id=self._chain_id,
+                        step_results=self._step_results,
+                        workflow_ids=self._workflow_ids,
+                    ))
 
             # All levels complete
             self._status = "completed"
 
-            # Update final chain status in DB
-            await workflow.execute_activity(
-                update_chain_status_activity,
-                args=[self._chain_id, "completed"],
-                start_to_close_timeout=timedelta(seconds=10)
-            )
+            if not total_levels:
+                await self._db_activity(
+                    update_chain_status_activity,
+                    args=[self._chain_id, "completed"]
+                )
 
             return ChainExecutionResult(
                 chain_name=plan.chain_name,
@@ -147,10 +266,9 @@ class ChainExecutorWorkflow:
 
             # Update chain status to failed in DB
             if self._chain_id:
-                await workflow.execute_activity(
+                await self._db_activity(
                     update_chain_status_activity,
-                    args=[self._chain_id, "failed", None, str(e)],
-                    start_to_close_timeout=timedelta(seconds=10)
+                    args=[self._chain_id, "failed", None, str(e)]
                 )
 
             return ChainExecutionResult(
@@ -166,7 +284,8 @@ class ChainExecutorWorkflow:
         workflow_db_id: str,
         artifact_ids: list,
         approval_config: dict,
-        node
+        node,
+        retry_count: int = 0
     ) -> tuple[str, dict]:
         """
         Wait for approval with regeneration support
@@ -177,6 +296,7 @@ class ChainExecutorWorkflow:
             artifact_ids: List of artifact IDs to approve
             approval_config: Approval configuration from YAML
             node: Execution node for regeneration
+            retry_count: Regenerations already done for this step
 
         Returns:
             Tuple of (decision, parameters) - parameters will be new params if rejected
@@ -184,7 +304,6 @@ class ChainExecutorWorkflow:
         timeout_hours = approval_config.get('timeout_hours', 24)
         on_rejected = approval_config.get('on_rejected', 'stop')
         max_retries = approval_config.get('max_retries', 0)
-        retry_count = 0
 
         while True:
             # Reset approval state
@@ -204,18 +323,19 @@ class ChainExecutorWorkflow:
                 create_approval_request_activity,
                 args=[
                     artifact_id,
-                    workflow.info().workflow_id,
+                    self._workflow_id,
                     f"https://your-domain.com/artifacts/{artifact_id}",  # artifact_view_url
                     self._chain_id,  # chain_id
                     step_id,  # step_id
-                    workflow.info().run_id,  # temporal_run_id
+                    self._run_id,  # temporal_run_id
                     168,  # link_expiration_hours (1 week default)
                     node.workflow,  # workflow_name
                     None,  # server (can add if needed)
                     self._step_results.get(step_id, {}).parameters if hasattr(self._step_results.get(step_id), 'parameters') else {},  # parameters
                     approval_config,  # approval_config
                 ],
-                start_to_close_timeout=timedelta(seconds=30)
+                start_to_close_timeout=_TD_30S,
+                retry_policy=DEFAULT_RETRY
             )
 
             workflow.logger.info(
@@ -247,7 +367,6 @@ class ChainExecutorWorkflow:
                             f"Step {step_id}: Regenerating "
                             f"(attempt {retry_count + 1}/{max_retries})"
                         )
-                        retry_count += 1
                         # Return rejected with new parameters to trigger regeneration
                         return "rejected", self.approval_parameters
 
@@ -274,6 +393,40 @@ class ChainExecutorWorkflow:
                 else:
                     raise Exception(f"Step {step_id} timeout - no approval received")
 
+    def _db_activity(self, activity_fn, args: list, start_to_close_timeout: timedelta = DB_ACTIVITY_TIMEOUT):
+        """Start a small DB activity with the shared DB timeouts and retry policy"""
+        return workflow.execute_activity(
+            activity_fn,
+            args=args,
+            start_to_close_timeout=start_to_close_timeout,
+            schedule_to_close_timeout=DB_ACTIVITY_SCHEDULE_TIMEOUT,
+            retry_policy=DB_ACTIVITY_RETRY
+        )
+
+    def _select_server(self):
+        """Start the select_best_server activity for a step"""
+        return workflow.execute_activity(
+            select_best_server,
+            "least_loaded",
+            start_to_close_timeout=_TD_30S,
+            retry_policy=SERVER_SELECTION_RETRY
+        )
+
+    async def _execute_and_record_step(self, node) -> StepResult:
+        """Execute a step and store its result for the next level as soon as it finishes"""
+        result = await self._execute_step(node)
+        self._record_result(result)
+        workflow.logger.info(f"Step {result.step_id}: {result.status}")
+        return result
+
+    def _record_result(self, result: StepResult) -> None:
+        """Store a step result and invalidate the cached get_status step statuses"""
+        if result.step_id not in self._step_results:
+            self._completed_steps += 1
+        self._step_results[result.step_id] = result
+        self._step_statuses[result.step_id] = result.status
+        self._status_version += 1
+
     async def _execute_step(self, node) -> StepResult:
         """
         Execute a single step as a child workflow with approval support
@@ -285,6 +438,7 @@ class ChainExecutorWorkflow:
             StepResult
         """
         step_id = node.step_id
+        child_workflow_id = self._child_id_prefix + step_id
         workflow.logger.info(f"Executing step: {step_id}")
 
         try:
@@ -293,7 +447,8 @@ class ChainExecutorWorkflow:
                 should_execute = await workflow.execute_activity(
                     evaluate_chain_condition,
                     args=[node.condition, self._step_results],
-                    start_to_close_timeout=timedelta(seconds=10)
+                    start_to_close_timeout=_TD_10S,
+                    retry_policy=DEFAULT_RETRY
                 )
 
                 if not should_execute:
@@ -304,138 +459,27 @@ class ChainExecutorWorkflow:
                         status="skipped"
                     )
 
-            # Check if step requires approval
-            requires_approval = node.parameters.get('requires_approval', False)
-            approval_config = node.parameters.get('approval', {}) if requires_approval else None
-
-            # Regeneration loop for approval rejections
-            regeneration_params = None
-            while True:
-                # 2. Resolve templates in parameters using activity
-                # Merge with regeneration params if this is a retry
-                current_params = {**node.parameters}
-                if regeneration_params:
-                    current_params.update(regeneration_params)
-
-                resolved_params = await workflow.execute_activity(
-                    resolve_chain_templates,
-                    args=[current_params, self._step_results],
-                    start_to_close_timeout=timedelta(seconds=10)
-                )
-
-                workflow.logger.info(f"Step {step_id}: Resolved parameters")
-
-                # 3. Get workflow JSON and apply parameters using activity
-                workflow_json = await workflow.execute_activity(
-                    apply_workflow_parameters,
-                    args=[node.workflow, resolved_params],
-                    start_to_close_timeout=timedelta(seconds=30)
+            # Dependency workflow IDs from our tracking
+            dep_workflow_ids = {}
+            for dep_step_id in node.dependencies:
+                dep_workflow_id = self._workflow_ids.get(dep_step_id)
+                if not dep_workflow_id:
+                    workflow.logger.warning(f"Dependency {dep_step_id} workflow ID not found - skipping transfer")
+                    continue
+                dep_workflow_ids[dep_step_id] = dep_workflow_id
+
+            # 2-5. Generate - steps requiring approval may regenerate
+            if node.parameters.get('requires_approval', False):
+                result, resolved_params, workflow_db_id = await self._execute_step_with_approval(
+                    node, child_workflow_id, dep_workflow_ids
                 )
-
-                # 4. Pre-select target server for this step
-                target_server = await workflow.execute_activity(
-                    select_best_server,
-                    "least_loaded",
-                    start_to_close_timeout=timedelta(seconds=30),
-                    retry_policy=RetryPolicy(
-                        maximum_attempts=3,
-                        initial_interval=timedelta(seconds=1),
-                        maximum_interval=timedelta(seconds=10),
-                        backoff_coefficient=2.0
-                    )
-                )
-                workflow.logger.info(f"Step {step_id}: Selected target server: {target_server}")
-
-            # 5. Transfer artifacts from dependency steps to target server
-            if node.dependencies:
-                workflow.logger.info(f"Step {step_id}: Processing {len(node.dependencies)} dependency step(s)")
-
-                for dep_step_id in node.dependencies:
-                    # Get dependency workflow ID from our tracking
-                    dep_workflow_id = self._workflow_ids.get(dep_step_id)
-
-                    if not dep_workflow_id:
-                        workflow.logger.warning(f"Dependency {dep_step_id} workflow ID not found - skipping transfer")
-                        continue
-
-                    # Get artifact IDs for the dependency workflow
-                    artifact_ids = await workflow.execute_activity(
-                        get_workflow_artifacts,
-                        args=[dep_workflow_id],
-                        start_to_close_timeout=timedelta(seconds=10)
-                    )
-
-                    if not artifact_ids:
-                        workflow.logger.info(f"Dependency {dep_step_id} has no artifacts - skipping transfer")
-                        continue
-
-                    workflow.logger.info(f"Transferring {len(artifact_ids)} artifact(s) from {dep_step_id} to {target_server}")
-
-                    # Transfer artifacts from local storage to target server
-                    await workflow.execute_activity(
-                        transfer_artifacts_from_storage,
-                        args=[dep_workflow_id, target_server, artifact_ids, None],
-                        start_to_close_timeout=timedelta(minutes=5),
-                        retry_policy=RetryPolicy(
-                            maximum_attempts=3,
-                            initial_interval=timedelta(seconds=2),
-                            maximum_interval=timedelta(seconds=10),
-                            backoff_coefficient=2.0
-                        )
-                    )
-
-            # 6. Create workflow record in database (before execution)
-            # Note: We don't have prompt_id yet, will use placeholder
-            workflow_db_id = await workflow.execute_activity(
-                create_workflow_record,
-                args=[
-                    node.workflow,                          # workflow_name
-                    target_server,                          # server_address
-                    "pending",                              # prompt_id (placeholder)
-                    self._chain_id,                         # chain_id
-                    step_id,                                # step_id
-                    f"{workflow.info().workflow_id}-{step_id}",  # temporal_workflow_id
-                    None,                                   # temporal_run_id
-                    workflow_json,                          # workflow_definition
-                    resolved_params,                        # parameters
-                ],
-                start_to_close_timeout=timedelta(seconds=10)
-            )
-
-            # Store workflow ID for this step
-            self._workflow_ids[step_id] = workflow_db_id
-            workflow.logger.info(f"Step {step_id}: Created workflow record {workflow_db_id}")
-
-            # 7. Execute as child workflow with pre-selected server
-            child_workflow_id = f"{workflow.info().workflow_id}-{step_id}"
-
-            result = await workflow.execute_child_workflow(
-                ComfyUIWorkflow.run,
-                WorkflowExecutionRequest(
-                    workflow_definition=workflow_json,
-                    strategy="least_loaded",
-                    workflow_name=node.workflow,
-                    server_address=target_server,  # Pass pre-selected server
-                    workflow_db_id=workflow_db_id,  # Pass DB workflow ID for artifact linking
-                ),
-                id=child_workflow_id,
-                task_queue="comfyui-gpu-farm",
-                retry_policy=RetryPolicy(
-                    maximum_attempts=2,
-                    initial_interval=timedelta(seconds=10),
-                    maximum_interval=timedelta(seconds=60),
-                    backoff_coefficient=2.0
+            else:
+                result, resolved_params, workflow_db_id, _ = await self._run_step_pass(
+                    node, child_workflow_id, dep_workflow_ids
                 )
-            )
-
-            # 8. Update workflow status to completed in DB
-            await workflow.execute_activity(
-                update_workflow_status_activity,
-                args=[workflow_db_id, result.status, result.error if hasattr(result, 'error') else None],
-                start_to_close_timeout=timedelta(seconds=10)
-            )
 
-            # 9. Return step result with workflow ID
+            # 7. Return step result with workflow ID; its DB status is
+            # written with the rest of the level (see run)
             return StepResult(
                 step_id=step_id,
                 workflow=node.workflow,
@@ -444,26 +488,179 @@ class ChainExecutorWorkflow:
                 parameters=resolved_params,
                 server_address=result.server_address,
                 workflow_db_id=workflow_db_id,  # Store for artifact retrieval
+                error=getattr(result, 'error', None),
             )
 
         except Exception as e:
             workflow.logger.error(f"Step {step_id} failed: {e}")
 
-            # Update workflow status to failed if we created the record
-            if step_id in self._workflow_ids:
-                await workflow.execute_activity(
-                    update_workflow_status_activity,
-                    args=[self._workflow_ids[step_id], "failed", str(e)],
-                    start_to_close_timeout=timedelta(seconds=10)
-                )
-
+            # workflow_db_id is set if we created the record, so the level's
+            # status write marks it failed
             return StepResult(
                 step_id=step_id,
                 workflow=node.workflow,
                 status="failed",
+                workflow_db_id=self._workflow_ids.get(step_id),
                 error=str(e)
             )
 
+    async def _execute_step_with_approval(
+        self,
+        node,
+        child_workflow_id: str,
+        dep_workflow_ids: Dict[str, str],
+    ) -> tuple:
+        """
+        Run a step requiring approval, regenerating on rejection
+
+        One pass per generation, repeated only when the result is rejected
+        with regeneration parameters.
+
+        Returns:
+            Tuple of (child workflow result, resolved parameters, workflow DB ID)
+        """
+        step_id = node.step_id
+        approval_config = node.parameters.get('approval', {})
+
+        regeneration_params = None
+        regeneration_count = 0
+        target_server = None
+        while True:
+            result, resolved_params, workflow_db_id, target_server = await self._run_step_pass(
+                node, child_workflow_id, dep_workflow_ids, regeneration_params, target_server
+            )
+
+            # 6. Wait for approval of the generated artifact
+            if result.status != "completed":
+                return result, resolved_params, workflow_db_id
+
+            artifact_ids = await self._db_activity(
+                get_workflow_artifacts,
+                args=[workflow_db_id]
+            )
+            decision, regeneration_params = await self._wait_for_approval(
+                step_id, workflow_db_id, artifact_ids, approval_config, node, regeneration_count
+            )
+            if decision != "rejected":
+                return result, resolved_params, workflow_db_id
+
+            regeneration_count += 1
+
+    async def _run_step_pass(
+        self,
+        node,
+        child_workflow_id: str,
+        dep_workflow_ids: Dict[str, str],
+        regeneration_params: Optional[Dict[str, Any]] = None,
+        previous_server: Optional[str] = None,
+    ) -> tuple:
+        """
+        Resolve, apply and execute a step once
+
+        Args:
+            node: ExecutionNode from the plan
+            child_workflow_id: Child workflow ID for the step
+            dep_workflow_ids: Dependency step_id -> workflow DB ID
+            regeneration_params: Parameters overriding the node's (regeneration)
+            previous_server: Server of the previous pass (regeneration)
+
+        Returns:
+            Tuple of (child workflow result, resolved parameters, workflow DB ID, target server)
+        """
+        step_id = node.step_id
+
+        # 2. Resolve templates in parameters and pick the target
+        # server - independent, so they run concurrently
+        # Merge with regeneration params if this is a retry (the node's own
+        # parameters are only read, so they're passed as-is otherwise)
+        current_params = (
+            {**node.parameters, **regeneration_params} if regeneration_params else node.parameters
+        )
+
+        resolve_task = workflow.execute_activity(
+            resolve_chain_templates,
+            args=[current_params, self._step_results],
+            start_to_close_timeout=_TD_10S,
+            retry_policy=DEFAULT_RETRY
+        )
+
+        if previous_server is None:
+            resolved_params, target_server = await asyncio.gather(
+                resolve_task,
+                self._select_server()
+            )
+            workflow.logger.info(f"Step {step_id}: Selected target server: {target_server}")
+        else:
+            # Regeneration: keep the previous server while it's healthy
+            target_server = previous_server
+            resolved_params, server_healthy = await asyncio.gather(
+                resolve_task,
+                workflow.execute_activity(
+                    is_server_healthy,
+                    target_server,
+                    start_to_close_timeout=_TD_10S,
+                    retry_policy=DEFAULT_RETRY
+                )
+            )
+            if not server_healthy:
+                target_server = await self._select_server()
+                workflow.logger.info(f"Step {step_id}: Reselected target server: {target_server}")
+
+        workflow.logger.info(f"Step {step_id}: Resolved parameters")
+
+        # 3. Apply parameters and create the workflow record (before
+        # execution - prompt_id is filled in by the child workflow)
+        workflow_json, workflow_db_id = await workflow.execute_activity(
+            upsert_workflow_record_and_apply_params,
+            args=[
+                node.workflow,
+                resolved_params,
+                target_server,
+                self._chain_id,
+                step_id,
+                child_workflow_id,
+            ],
+            start_to_close_timeout=_TD_30S,
+            retry_policy=DEFAULT_RETRY
+        )
+
+        # Store workflow ID for this step
+        self._workflow_ids[step_id] = workflow_db_id
+        workflow.logger.info(f"Step {step_id}: Created workflow record {workflow_db_id}")
+
+        # 4. Transfer artifacts from dependency steps to target server
+        # (again only if a regeneration moved to another server)
+        if dep_workflow_ids and target_server != previous_server:
+            workflow.logger.info(f"Step {step_id}: Processing {len(dep_workflow_ids)} dependency step(s)")
+
+            # Artifact lookup and transfer for all dependencies in one activity
+            transferred = await workflow.execute_activity(
+                collect_and_transfer_dependency_artifacts,
+                args=[list(dep_workflow_ids.values()), target_server],
+                start_to_close_timeout=_TD_5MIN,
+                retry_policy=TRANSFER_RETRY
+            )
+            workflow.logger.info(
+                f"Step {step_id}: Transferred {sum(map(len, transferred.values()))} artifact(s) to {target_server}"
+            )
+
+        # 5. Execute as child workflow with pre-selected server
+        result = await workflow.execute_child_workflow(
+            ComfyUIWorkflow.run,
+            WorkflowExecutionRequest(
+                workflow_definition=workflow_json,
+                strategy="least_loaded",
+                workflow_name=node.workflow,
+                server_address=target_server,  # Pass pre-selected server
+                workflow_db_id=workflow_db_id,  # Pass DB workflow ID for artifact linking
+            ),
+            id=child_workflow_id,
+            task_queue="comfyui-gpu-farm",
+            retry_policy=CHILD_WORKFLOW_RETRY
+        )
+
+        return result, resolved_params, workflow_db_id, target_server
+
     @workflow.signal
     async def approval_decision_signal(
         self,
@@ -497,12 +694,13 @@ class ChainExecutorWorkflow:
         Returns:
             Status dict with current level and step results
         """
+        # Step statuses are only copied again after a new result was recorded
+        if self._status_cache is None or self._status_cache[0] != self._status_version:
+            self._status_cache = (self._status_version, dict(self._step_statuses))
+
         return {
             "status": self._status,
             "current_level": self._current_level,
-            "completed_steps": len(self._step_results),
-            "step_statuses": {
-                step_id: result.status
-                for step_id, result in self._step_results.items()
-            }
+            "completed_steps": self._completed_steps,
+            "step_statuses": self._status_cache[1]
         }
@@ -4,6 +4,7 @@ Chain Executor Workflow
 Temporal workflow that executes chain plans by orchestrating child ComfyUI workflows.
 """
 
+import asyncio
 import sys
 from pathlib import Path
 from dataclasses import dataclass
@@ -35,6 +36,19 @@ with workflow.unsafe.imports_passed_through():
     )
 
 
+# Small DB reads/writes: a stalled call is abandoned after 2s and retried
+# quickly instead of holding a worker slot for the full timeout. Inserts get
+# a longer attempt timeout: create_workflow_record is not idempotent, so an
+# attempt abandoned after a slow commit would leave a duplicate row behind.
+DB_ACTIVITY_RETRY = RetryPolicy(
+    initial_interval=timedelta(milliseconds=100),
+    maximum_interval=timedelta(seconds=5),
+    maximum_attempts=8,
+)
+
+DB_INSERT_ACTIVITY_TIMEOUT = timedelta(seconds=10)
+
+
 @dataclass
 class ChainExecutionRequest:
     """Request to execute a chain"""
@@ -95,7 +109,9 @@ class ChainExecutorWorkflow:
                     None,  # chain_definition - can add later
                     None,  # description
                 ],
-                start_to_close_timeout=timedelta(seconds=10)
+                start_to_close_timeout=DB_INSERT_ACTIVITY_TIMEOUT,
+                schedule_to_close_timeout=timedelta(seconds=30),
+                retry_policy=DB_ACTIVITY_RETRY
             )
             workflow.logger.info(f"Created chain record: {self._chain_id}")
 
@@ -108,7 +124,9 @@ class ChainExecutorWorkflow:
                 await workflow.execute_activity(
                     update_chain_status_activity,
                     args=[self._chain_id, self._status, level_num],
-                    start_to_close_timeout=timedelta(seconds=10)
+                    start_to_close_timeout=timedelta(seconds=2),
+                    schedule_to_close_timeout=timedelta(seconds=30),
+                    retry_policy=DB_ACTIVITY_RETRY
                 )
 
                 level_steps = plan.levels[level_num]
@@ -122,7 +140,6 @@ class ChainExecutorWorkflow:
                     parallel_tasks.append(task)
 
                 # Wait for all parallel steps to complete
-                import asyncio
                 results = await asyncio.gather(*parallel_tasks)
 
                 # Store results for next level
@@ -137,7 +154,9 @@ class ChainExecutorWorkflow:
             await workflow.execute_activity(
                 update_chain_status_activity,
                 args=[self._chain_id, "completed"],
-                start_to_close_timeout=timedelta(seconds=10)
+                start_to_close_timeout=timedelta(seconds=2),
+                schedule_to_close_timeout=timedelta(seconds=30),
+                retry_policy=DB_ACTIVITY_RETRY
             )
 
             return ChainExecutionResult(
@@ -155,7 +174,9 @@ class ChainExecutorWorkflow:
                 await workflow.execute_activity(
                     update_chain_status_activity,
                     args=[self._chain_id, "failed", None, str(e)],
-                    start_to_close_timeout=timedelta(seconds=10)
+                    start_to_close_timeout=timedelta(seconds=2),
+                    schedule_to_close_timeout=timedelta(seconds=30),
+                    retry_policy=DB_ACTIVITY_RETRY
                 )
 
             return ChainExecutionResult(
@@ -367,7 +388,9 @@ class ChainExecutorWorkflow:
                     artifact_ids = await workflow.execute_activity(
                         get_workflow_artifacts,
                         args=[dep_workflow_id],
-                        start_to_close_timeout=timedelta(seconds=10)
+                        start_to_close_timeout=timedelta(seconds=2),
+                        schedule_to_close_timeout=timedelta(seconds=30),
+                        retry_policy=DB_ACTIVITY_RETRY
                     )
 
                     if not artifact_ids:
@@ -404,7 +427,9 @@ class ChainExecutorWorkflow:
                     workflow_json,                          # workflow_definition
                     resolved_params,                        # parameters
                 ],
-                start_to_close_timeout=timedelta(seconds=10)
+                start_to_close_timeout=DB_INSERT_ACTIVITY_TIMEOUT,
+                schedule_to_close_timeout=timedelta(seconds=30),
+                retry_policy=DB_ACTIVITY_RETRY
             )
 
             # Store workflow ID for this step
@@ -437,7 +462,9 @@ class ChainExecutorWorkflow:
             await workflow.execute_activity(
                 update_workflow_status_activity,
                 args=[workflow_db_id, result.status, result.error if hasattr(result, 'error') else None],
-                start_to_close_timeout=timedelta(seconds=10)
+                start_to_close_timeout=timedelta(seconds=2),
+                schedule_to_close_timeout=timedelta(seconds=30),
+                retry_policy=DB_ACTIVITY_RETRY
             )
 
             # 9. Return step result with workflow ID
@@ -459,7 +486,9 @@ class ChainExecutorWorkflow:
                 await workflow.execute_activity(
                     update_workflow_status_activity,
                     args=[self._workflow_ids[step_id], "failed", str(e)],
-                    start_to_close_timeout=timedelta(seconds=10)
+                    start_to_close_timeout=timedelta(seconds=2),
+                    schedule_to_close_timeout=timedelta(seconds=30),
+                    retry_policy=DB_ACTIVITY_RETRY
                 )
 
             return StepResult(
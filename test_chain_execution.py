@@ -51,7 +51,7 @@ async def test_image_edit_pipeline():
             json={"parameters": {}}
         )
 
-        if response.status_code != 200:
+        if response.status_code != 202:
             print(f"   ERROR: {response.status_code} - {response.text}")
             return
 